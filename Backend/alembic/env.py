@@ -0,0 +1,61 @@
+"""
+Ambiente do Alembic
+
+Usa a mesma URL e o mesmo engine da aplicação (app.database). Quem chama o Alembic
+pelo código (app.migrations) pode passar uma conexão pronta em
+config.attributes["connection"].
+"""
+from logging.config import fileConfig
+
+from alembic import context
+
+from app.database import Base, engine
+import app.models  # noqa: F401  (registra os modelos em Base.metadata)
+
+config = context.config
+
+if config.config_file_name is not None and config.attributes.get("configure_logger", True):
+    fileConfig(config.config_file_name, disable_existing_loggers=False)
+
+target_metadata = Base.metadata
+
+# Tabelas criadas fora dos modelos (índice FTS5 da busca de clientes)
+IGNORED_TABLE_PREFIXES = ("clients_fts",)
+
+
+def include_object(object, name, type_, reflected, compare_to):
+    """Ignora no autogenerate os objetos que não são mapeados pelos modelos"""
+    if type_ == "table" and name.startswith(IGNORED_TABLE_PREFIXES):
+        return False
+    return True
+
+
+def do_run_migrations(connection) -> None:
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        # SQLite não altera colunas com ALTER TABLE: o Alembic recria a tabela
+        render_as_batch=connection.dialect.name == "sqlite",
+        include_object=include_object,
+    )
+
+    with context.begin_transaction():
+        context.run_migrations()
+
+
+def run_migrations_online() -> None:
+    """Aplica as migrações conectado ao banco"""
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        do_run_migrations(connection)
+        return
+
+    with engine.connect() as connection:
+        do_run_migrations(connection)
+
+
+if context.is_offline_mode():
+    # As revisões preenchem dados e, no SQLite, recriam tabelas a partir da reflexão
+    raise SystemExit("As migrações precisam de conexão com o banco (modo --sql não suportado)")
+
+run_migrations_online()
@@ -0,0 +1,170 @@
+"""Esquema inicial: usuários, clientes e relatórios com checklist
+
+Corresponde ao banco criado por create_all antes das migrações, já com as
+colunas data_agendada, role e superior_id e seus índices.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-18 12:00:00
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ENUMS = ("clientstatus", "clientcategory", "userrole", "responsibletype", "reportstatus", "checklistresponse")
+
+
+def upgrade() -> None:
+    op.create_table(
+        "clients",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.Enum("ATIVO", "INATIVO", name="clientstatus"), nullable=False),
+        sa.Column("nome_fantasia", sa.String(length=255), nullable=False),
+        sa.Column(
+            "categoria",
+            sa.Enum(
+                "RESTAURANTE", "MERCADO", "HORTIFRUTI", "LANCHONETE_CAFETERIA", "BAR", "PADARIA_CONFEITARIA",
+                name="clientcategory",
+            ),
+            nullable=False,
+        ),
+        sa.Column("razao_social", sa.String(length=255), nullable=False),
+        sa.Column("cnpj", sa.String(length=18), nullable=False),
+        sa.Column("inscricao_estadual", sa.String(length=50), nullable=True),
+        sa.Column("inscricao_municipal", sa.String(length=50), nullable=True),
+        sa.Column("email", sa.String(length=255), nullable=True),
+        sa.Column("site_instagram", sa.String(length=255), nullable=True),
+        sa.Column("telefone_contato_1", sa.String(length=20), nullable=True),
+        sa.Column("telefone_contato_2", sa.String(length=20), nullable=True),
+        sa.Column("endereco", sa.String(length=255), nullable=True),
+        sa.Column("numero", sa.String(length=20), nullable=True),
+        sa.Column("bairro", sa.String(length=100), nullable=True),
+        sa.Column("complemento", sa.String(length=255), nullable=True),
+        sa.Column("cidade", sa.String(length=100), nullable=True),
+        sa.Column("estado", sa.String(length=2), nullable=True),
+        sa.Column("cep", sa.String(length=10), nullable=True),
+        sa.Column("logo_url", sa.String(length=500), nullable=True),
+        sa.Column("criado_em", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("atualizado_em", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_clients_cnpj", "clients", ["cnpj"], unique=True)
+    op.create_index("ix_clients_id", "clients", ["id"], unique=False)
+    op.create_index("ix_clients_nome_fantasia", "clients", ["nome_fantasia"], unique=False)
+
+    op.create_table(
+        "users",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("nome", sa.String(length=255), nullable=False),
+        sa.Column("email", sa.String(length=255), nullable=False),
+        sa.Column("senha_hash", sa.String(length=255), nullable=False),
+        sa.Column("role", sa.Enum("ADMIN", "CHEFE", "OPERADOR", name="userrole"), nullable=False),
+        sa.Column("superior_id", sa.Integer(), nullable=True),
+        sa.Column("criado_em", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.ForeignKeyConstraint(["superior_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_users_email", "users", ["email"], unique=True)
+    op.create_index("ix_users_id", "users", ["id"], unique=False)
+    op.create_index("idx_users_superior_id", "users", ["superior_id"], unique=False)
+
+    op.create_table(
+        "client_collaborators",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cliente_id", sa.Integer(), nullable=False),
+        sa.Column("numero_total_colaboradores", sa.Integer(), nullable=True),
+        sa.Column("numero_manipuladores_alimentos", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(["cliente_id"], ["clients.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("cliente_id"),
+    )
+    op.create_index("ix_client_collaborators_id", "client_collaborators", ["id"], unique=False)
+
+    op.create_table(
+        "client_responsibles",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("cliente_id", sa.Integer(), nullable=False),
+        sa.Column(
+            "tipo",
+            sa.Enum("RESPONSAVEL_ESTABELECIMENTO", "RESPONSAVEL_TECNICO", name="responsibletype"),
+            nullable=False,
+        ),
+        sa.Column("nome_completo", sa.String(length=255), nullable=True),
+        sa.Column("email", sa.String(length=255), nullable=True),
+        sa.Column("telefone", sa.String(length=20), nullable=True),
+        sa.Column("cpf", sa.String(length=14), nullable=True),
+        sa.ForeignKeyConstraint(["cliente_id"], ["clients.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_client_responsibles_id", "client_responsibles", ["id"], unique=False)
+
+    op.create_table(
+        "reports",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("descricao", sa.String(length=255), nullable=False),
+        sa.Column("cliente_id", sa.Integer(), nullable=False),
+        sa.Column("categoria", sa.String(length=100), nullable=True),
+        sa.Column("responsavel_inspecao_id", sa.Integer(), nullable=False),
+        sa.Column("status", sa.Enum("EM_ANDAMENTO", "CONCLUIDO", name="reportstatus"), nullable=False),
+        sa.Column("data_agendada", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("criado_em", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.Column("finalizado_em", sa.DateTime(timezone=True), nullable=True),
+        sa.ForeignKeyConstraint(["cliente_id"], ["clients.id"]),
+        sa.ForeignKeyConstraint(["responsavel_inspecao_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_reports_id", "reports", ["id"], unique=False)
+    op.create_index("idx_reports_data_agendada", "reports", ["data_agendada"], unique=False)
+
+    op.create_table(
+        "checklist_categories",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("relatorio_id", sa.Integer(), nullable=False),
+        sa.Column("nome", sa.String(length=255), nullable=False),
+        sa.Column("ordem", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["relatorio_id"], ["reports.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_checklist_categories_id", "checklist_categories", ["id"], unique=False)
+
+    op.create_table(
+        "checklist_items",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("categoria_id", sa.Integer(), nullable=False),
+        sa.Column("codigo", sa.String(length=20), nullable=False),
+        sa.Column("descricao", sa.Text(), nullable=False),
+        sa.Column(
+            "resposta",
+            sa.Enum("CONFORME", "NAO_CONFORME", "NA", name="checklistresponse"),
+            nullable=True,
+        ),
+        sa.Column("observacoes", sa.Text(), nullable=True),
+        sa.Column("ordem", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["categoria_id"], ["checklist_categories.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_checklist_items_id", "checklist_items", ["id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_table("checklist_items")
+    op.drop_table("checklist_categories")
+    op.drop_table("reports")
+    op.drop_table("client_responsibles")
+    op.drop_table("client_collaborators")
+    op.drop_table("users")
+    op.drop_table("clients")
+
+    # PostgreSQL cria um tipo para cada Enum
+    if op.get_bind().dialect.name == "postgresql":
+        for nome in ENUMS:
+            op.execute(f"DROP TYPE IF EXISTS {nome}")
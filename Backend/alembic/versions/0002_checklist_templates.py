@@ -0,0 +1,89 @@
+"""Templates de checklist versionados
+
+Os itens do relatório podem referenciar o item do template (template_item_id)
+em vez de copiar o texto, então checklist_items.descricao passa a ser opcional.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-18 12:00:01
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "checklist_templates",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("nome", sa.String(length=255), nullable=False),
+        sa.Column("versao", sa.Integer(), nullable=False),
+        sa.Column("descricao", sa.String(length=255), nullable=True),
+        sa.Column("ativo", sa.Boolean(), nullable=False),
+        sa.Column("criado_em", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("nome", "versao", name="uq_checklist_templates_nome_versao"),
+    )
+    op.create_index("ix_checklist_templates_id", "checklist_templates", ["id"], unique=False)
+    op.create_index("ix_checklist_templates_nome", "checklist_templates", ["nome"], unique=False)
+
+    op.create_table(
+        "checklist_template_categories",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("template_id", sa.Integer(), nullable=False),
+        sa.Column("nome", sa.String(length=255), nullable=False),
+        sa.Column("ordem", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["template_id"], ["checklist_templates.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_checklist_template_categories_id", "checklist_template_categories", ["id"], unique=False)
+    op.create_index(
+        "ix_checklist_template_categories_template_id", "checklist_template_categories", ["template_id"], unique=False
+    )
+
+    op.create_table(
+        "checklist_template_items",
+        sa.Column("id", sa.Integer(), nullable=False),
+        sa.Column("categoria_id", sa.Integer(), nullable=False),
+        sa.Column("codigo", sa.String(length=20), nullable=False),
+        sa.Column("descricao", sa.Text(), nullable=False),
+        sa.Column("ordem", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["categoria_id"], ["checklist_template_categories.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_checklist_template_items_categoria_id", "checklist_template_items", ["categoria_id"], unique=False)
+    op.create_index("ix_checklist_template_items_id", "checklist_template_items", ["id"], unique=False)
+
+    # No SQLite o batch recria checklist_items (não há ALTER COLUMN)
+    with op.batch_alter_table("checklist_items") as batch_op:
+        batch_op.add_column(sa.Column("template_item_id", sa.Integer(), nullable=True))
+        batch_op.alter_column("descricao", existing_type=sa.Text(), nullable=True)
+        batch_op.create_foreign_key(
+            "fk_checklist_items_template_item_id", "checklist_template_items", ["template_item_id"], ["id"]
+        )
+
+
+def downgrade() -> None:
+    # Copia de volta o texto dos itens que só referenciavam o template
+    op.execute(
+        "UPDATE checklist_items SET descricao = ("
+        "SELECT descricao FROM checklist_template_items WHERE checklist_template_items.id = checklist_items.template_item_id"
+        ") WHERE descricao IS NULL"
+    )
+    with op.batch_alter_table("checklist_items") as batch_op:
+        batch_op.drop_constraint("fk_checklist_items_template_item_id", type_="foreignkey")
+        batch_op.alter_column("descricao", existing_type=sa.Text(), nullable=False)
+        batch_op.drop_column("template_item_id")
+
+    op.drop_table("checklist_template_items")
+    op.drop_table("checklist_template_categories")
+    op.drop_table("checklist_templates")
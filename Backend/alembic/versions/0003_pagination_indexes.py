@@ -0,0 +1,27 @@
+"""Índices da paginação por cursor (criado_em, id)
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-18 12:00:02
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_clients_criado_em_id", "clients", ["criado_em", "id"], unique=False)
+    op.create_index("idx_reports_criado_em_id", "reports", ["criado_em", "id"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_reports_criado_em_id", table_name="reports")
+    op.drop_index("idx_clients_criado_em_id", table_name="clients")
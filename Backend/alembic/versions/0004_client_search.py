@@ -0,0 +1,144 @@
+"""Busca de clientes: nome sem acentos, CNPJ só com dígitos e índice de busca
+
+Preenche nome_busca e cnpj_digitos dos clientes existentes e cria o índice do
+banco (FTS5 no SQLite, trigram no PostgreSQL).
+
+O SQL e a normalização ficam escritos aqui (e não importados de app.search e
+app.text_utils) para que a revisão aplicada não mude com alterações futuras do
+código da aplicação.
+
+Obs.: no SQLite o batch_alter_table recria a tabela e descarta os triggers; revisões
+futuras que recriarem clients precisam criá-los de novo.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-18 12:00:03
+
+"""
+from typing import Sequence, Union
+
+import re
+import unicodedata
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Colunas de clients usadas no preenchimento (independe do modelo atual)
+clients = sa.table(
+    "clients",
+    sa.column("id", sa.Integer),
+    sa.column("nome_fantasia", sa.String),
+    sa.column("cnpj", sa.String),
+    sa.column("nome_busca", sa.String),
+    sa.column("cnpj_digitos", sa.String),
+)
+
+SQLITE_FTS_TRIGGERS = {
+    "clients_fts_ai": """
+        CREATE TRIGGER IF NOT EXISTS clients_fts_ai AFTER INSERT ON clients BEGIN
+            INSERT INTO clients_fts(rowid, nome_busca) VALUES (new.id, new.nome_busca);
+        END
+    """,
+    "clients_fts_ad": """
+        CREATE TRIGGER IF NOT EXISTS clients_fts_ad AFTER DELETE ON clients BEGIN
+            INSERT INTO clients_fts(clients_fts, rowid, nome_busca) VALUES ('delete', old.id, old.nome_busca);
+        END
+    """,
+    "clients_fts_au": """
+        CREATE TRIGGER IF NOT EXISTS clients_fts_au AFTER UPDATE OF nome_busca ON clients BEGIN
+            INSERT INTO clients_fts(clients_fts, rowid, nome_busca) VALUES ('delete', old.id, old.nome_busca);
+            INSERT INTO clients_fts(rowid, nome_busca) VALUES (new.id, new.nome_busca);
+        END
+    """,
+}
+
+
+def normalize_text(value):
+    """Remove acentos, converte para minúsculas e normaliza espaços"""
+    if value is None:
+        return None
+    decomposed = unicodedata.normalize("NFKD", value)
+    without_accents = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(without_accents.lower().split())
+
+
+def only_digits(value):
+    """Mantém apenas os dígitos (ex: CNPJ sem pontuação)"""
+    if value is None:
+        return None
+    return re.sub(r"\D", "", value)
+
+
+def create_search_index(conn):
+    """
+    Cria o índice de busca do banco (também usado por migrate_database.py)
+    - SQLite: tabela FTS5 com conteúdo externo e triggers de sincronização
+    - PostgreSQL: índice trigram sobre nome_busca
+    """
+    if conn.dialect.name == "sqlite":
+        try:
+            conn.execute(sa.text(
+                "CREATE VIRTUAL TABLE clients_fts USING fts5("
+                "nome_busca, content='clients', content_rowid='id', "
+                "tokenize='unicode61 remove_diacritics 2')"
+            ))
+        except Exception:
+            # SQLite compilado sem FTS5: a busca usa LIKE em nome_busca
+            return
+        for sql in SQLITE_FTS_TRIGGERS.values():
+            conn.execute(sa.text(sql))
+        conn.execute(sa.text("INSERT INTO clients_fts(clients_fts) VALUES ('rebuild')"))
+    elif conn.dialect.name == "postgresql":
+        conn.execute(sa.text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
+        conn.execute(sa.text(
+            "CREATE INDEX IF NOT EXISTS idx_clients_nome_busca_trgm "
+            "ON clients USING gin (nome_busca gin_trgm_ops)"
+        ))
+
+
+def drop_search_index(conn):
+    """Remove o índice de busca do banco"""
+    if conn.dialect.name == "sqlite":
+        for trigger in SQLITE_FTS_TRIGGERS:
+            conn.execute(sa.text(f"DROP TRIGGER IF EXISTS {trigger}"))
+        conn.execute(sa.text("DROP TABLE IF EXISTS clients_fts"))
+    elif conn.dialect.name == "postgresql":
+        conn.execute(sa.text("DROP INDEX IF EXISTS idx_clients_nome_busca_trgm"))
+
+
+def upgrade() -> None:
+    op.add_column("clients", sa.Column("nome_busca", sa.String(length=255), nullable=True))
+    op.add_column("clients", sa.Column("cnpj_digitos", sa.String(length=14), nullable=True))
+    op.create_index("ix_clients_cnpj_digitos", "clients", ["cnpj_digitos"], unique=False)
+
+    conn = op.get_bind()
+    rows = conn.execute(sa.select(clients.c.id, clients.c.nome_fantasia, clients.c.cnpj)).all()
+    if rows:
+        conn.execute(
+            clients.update().where(clients.c.id == sa.bindparam("client_id")),
+            [
+                {
+                    "client_id": client_id,
+                    "nome_busca": normalize_text(nome_fantasia),
+                    "cnpj_digitos": only_digits(cnpj),
+                }
+                for client_id, nome_fantasia, cnpj in rows
+            ],
+        )
+
+    create_search_index(conn)
+
+
+def downgrade() -> None:
+    drop_search_index(op.get_bind())
+    op.drop_index("ix_clients_cnpj_digitos", table_name="clients")
+    with op.batch_alter_table("clients") as batch_op:
+        batch_op.drop_column("cnpj_digitos")
+        batch_op.drop_column("nome_busca")
@@ -0,0 +1,222 @@
+"""Contadores pré-agregados do dashboard
+
+Cria dashboard_counters e, no SQLite, os triggers que a mantêm, já preenchida com
+os dados existentes.
+
+O SQL fica escrito aqui (e não gerado por app.dashboard) para que a revisão aplicada
+não mude com alterações futuras do código da aplicação.
+
+Obs.: no SQLite o batch_alter_table recria a tabela e descarta os triggers; revisões
+futuras que recriarem clients, reports ou checklist_items precisam criá-los de novo.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-18 12:00:04
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Contadores por dimensão, atualizados na mesma transação de cada escrita
+TRIGGERS = {
+    "dashboard_clients_ai": """
+        CREATE TRIGGER IF NOT EXISTS dashboard_clients_ai AFTER INSERT ON clients BEGIN
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('clientes', 'total', 1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+        END
+    """,
+    "dashboard_clients_ad": """
+        CREATE TRIGGER IF NOT EXISTS dashboard_clients_ad AFTER DELETE ON clients BEGIN
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('clientes', 'total', -1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+        END
+    """,
+    "dashboard_clients_au": """
+        CREATE TRIGGER IF NOT EXISTS dashboard_clients_au AFTER UPDATE OF categoria ON clients
+        WHEN old.categoria IS NOT new.categoria BEGIN
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            SELECT 'relatorios_categoria_cliente', old.categoria, -count(*) FROM reports WHERE cliente_id = old.id
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            SELECT 'relatorios_categoria_cliente', new.categoria, count(*) FROM reports WHERE cliente_id = new.id
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+        END
+    """,
+    "dashboard_reports_ai": """
+        CREATE TRIGGER IF NOT EXISTS dashboard_reports_ai AFTER INSERT ON reports BEGIN
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('relatorios_status', new.status, 1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('relatorios_mes', coalesce(strftime('%Y-%m', new.criado_em), ''), 1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('relatorios_inspetor', CAST(new.responsavel_inspecao_id AS TEXT), 1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES (
+                'relatorios_categoria_cliente',
+                coalesce((SELECT categoria FROM clients WHERE id = new.cliente_id), ''),
+                1
+            )
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+        END
+    """,
+    "dashboard_reports_ad": """
+        CREATE TRIGGER IF NOT EXISTS dashboard_reports_ad AFTER DELETE ON reports BEGIN
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('relatorios_status', old.status, -1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('relatorios_mes', coalesce(strftime('%Y-%m', old.criado_em), ''), -1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('relatorios_inspetor', CAST(old.responsavel_inspecao_id AS TEXT), -1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES (
+                'relatorios_categoria_cliente',
+                coalesce((SELECT categoria FROM clients WHERE id = old.cliente_id), ''),
+                -1
+            )
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+        END
+    """,
+    "dashboard_reports_au": """
+        CREATE TRIGGER IF NOT EXISTS dashboard_reports_au
+        AFTER UPDATE OF status, criado_em, responsavel_inspecao_id, cliente_id ON reports BEGIN
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('relatorios_status', old.status, -1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('relatorios_mes', coalesce(strftime('%Y-%m', old.criado_em), ''), -1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('relatorios_inspetor', CAST(old.responsavel_inspecao_id AS TEXT), -1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES (
+                'relatorios_categoria_cliente',
+                coalesce((SELECT categoria FROM clients WHERE id = old.cliente_id), ''),
+                -1
+            )
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('relatorios_status', new.status, 1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('relatorios_mes', coalesce(strftime('%Y-%m', new.criado_em), ''), 1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('relatorios_inspetor', CAST(new.responsavel_inspecao_id AS TEXT), 1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES (
+                'relatorios_categoria_cliente',
+                coalesce((SELECT categoria FROM clients WHERE id = new.cliente_id), ''),
+                1
+            )
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+        END
+    """,
+    "dashboard_items_ai": """
+        CREATE TRIGGER IF NOT EXISTS dashboard_items_ai AFTER INSERT ON checklist_items BEGIN
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('itens_resposta', coalesce(new.resposta, ''), 1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+        END
+    """,
+    "dashboard_items_ad": """
+        CREATE TRIGGER IF NOT EXISTS dashboard_items_ad AFTER DELETE ON checklist_items BEGIN
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('itens_resposta', coalesce(old.resposta, ''), -1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+        END
+    """,
+    "dashboard_items_au": """
+        CREATE TRIGGER IF NOT EXISTS dashboard_items_au AFTER UPDATE OF resposta ON checklist_items
+        WHEN old.resposta IS NOT new.resposta BEGIN
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('itens_resposta', coalesce(old.resposta, ''), -1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+            INSERT INTO dashboard_counters (dimensao, chave, total)
+            VALUES ('itens_resposta', coalesce(new.resposta, ''), 1)
+            ON CONFLICT (dimensao, chave) DO UPDATE SET total = total + excluded.total;
+        END
+    """,
+}
+
+# Carga inicial: as mesmas chaves gravadas pelos triggers
+BACKFILL = [
+    "DELETE FROM dashboard_counters",
+    "INSERT INTO dashboard_counters (dimensao, chave, total) SELECT 'clientes', 'total', count(*) FROM clients",
+    """
+        INSERT INTO dashboard_counters (dimensao, chave, total)
+        SELECT 'relatorios_status', coalesce(status, ''), count(*) FROM reports GROUP BY 2
+    """,
+    """
+        INSERT INTO dashboard_counters (dimensao, chave, total)
+        SELECT 'relatorios_mes', coalesce(strftime('%Y-%m', criado_em), ''), count(*) FROM reports GROUP BY 2
+    """,
+    """
+        INSERT INTO dashboard_counters (dimensao, chave, total)
+        SELECT 'relatorios_inspetor', CAST(responsavel_inspecao_id AS TEXT), count(*) FROM reports GROUP BY 2
+    """,
+    """
+        INSERT INTO dashboard_counters (dimensao, chave, total)
+        SELECT 'relatorios_categoria_cliente', coalesce(c.categoria, ''), count(*)
+        FROM reports r JOIN clients c ON c.id = r.cliente_id GROUP BY 2
+    """,
+    """
+        INSERT INTO dashboard_counters (dimensao, chave, total)
+        SELECT 'itens_resposta', coalesce(resposta, ''), count(*) FROM checklist_items GROUP BY 2
+    """,
+]
+
+
+def create_dashboard_triggers(conn):
+    """
+    Cria os triggers dos contadores e os preenche com os dados já existentes
+    (só no SQLite; também usado por migrate_database.py)
+    """
+    if conn.dialect.name != "sqlite":
+        return
+
+    for sql in [*TRIGGERS.values(), *BACKFILL]:
+        conn.execute(sa.text(sql))
+
+
+def drop_dashboard_triggers(conn):
+    """Remove os triggers dos contadores"""
+    if conn.dialect.name != "sqlite":
+        return
+
+    for trigger in TRIGGERS:
+        conn.execute(sa.text(f"DROP TRIGGER IF EXISTS {trigger}"))
+
+
+def upgrade() -> None:
+    op.create_table(
+        "dashboard_counters",
+        sa.Column("dimensao", sa.String(length=40), nullable=False),
+        sa.Column("chave", sa.String(length=100), nullable=False),
+        sa.Column("total", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("dimensao", "chave"),
+    )
+    create_dashboard_triggers(op.get_bind())
+
+
+def downgrade() -> None:
+    drop_dashboard_triggers(op.get_bind())
+    op.drop_table("dashboard_counters")
@@ -0,0 +1,38 @@
+"""Índices compostos das listagens de relatórios e do checklist
+
+- reports (cliente_id, criado_em, id) e (status, criado_em, id): listagem filtrada
+  por cliente ou status, já na ordem da paginação
+- checklist_categories (relatorio_id, ordem) e checklist_items (categoria_id, ordem):
+  carga da árvore do relatório sem varrer as tabelas
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-18 12:00:05
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index("idx_reports_cliente_criado_em_id", "reports", ["cliente_id", "criado_em", "id"], unique=False)
+    op.create_index("idx_reports_status_criado_em_id", "reports", ["status", "criado_em", "id"], unique=False)
+    op.create_index(
+        "idx_checklist_categories_relatorio_ordem", "checklist_categories", ["relatorio_id", "ordem"], unique=False
+    )
+    op.create_index("idx_checklist_items_categoria_ordem", "checklist_items", ["categoria_id", "ordem"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("idx_checklist_items_categoria_ordem", table_name="checklist_items")
+    op.drop_index("idx_checklist_categories_relatorio_ordem", table_name="checklist_categories")
+    op.drop_index("idx_reports_status_criado_em_id", table_name="reports")
+    op.drop_index("idx_reports_cliente_criado_em_id", table_name="reports")
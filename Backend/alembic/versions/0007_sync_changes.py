@@ -0,0 +1,154 @@
+"""Registro de alterações para a sincronização incremental
+
+Cria sync_changes (uma linha por relatório, categoria ou item com a versão da sua
+última alteração) e, no SQLite, os triggers que a mantêm, já preenchida com os
+registros existentes.
+
+O SQL fica escrito aqui (e não gerado por app.sync) para que a revisão aplicada
+não mude com alterações futuras do código da aplicação.
+
+Obs.: no SQLite o batch_alter_table recria a tabela e descarta os triggers; revisões
+futuras que recriarem reports, checklist_categories ou checklist_items precisam criá-los de novo.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-18 12:00:06
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Cada escrita substitui a alteração anterior da linha por uma nova (nova versão)
+TRIGGERS = {
+    "sync_reports_ai": """
+        CREATE TRIGGER IF NOT EXISTS sync_reports_ai AFTER INSERT ON reports BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'relatorios' AND registro_id = new.id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('relatorios', new.id, new.id, 0);
+        END
+    """,
+    "sync_reports_au": """
+        CREATE TRIGGER IF NOT EXISTS sync_reports_au AFTER UPDATE ON reports BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'relatorios' AND registro_id = new.id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('relatorios', new.id, new.id, 0);
+        END
+    """,
+    "sync_reports_ad": """
+        CREATE TRIGGER IF NOT EXISTS sync_reports_ad AFTER DELETE ON reports BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'relatorios' AND registro_id = old.id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('relatorios', old.id, old.id, 1);
+        END
+    """,
+    "sync_checklist_categories_ai": """
+        CREATE TRIGGER IF NOT EXISTS sync_checklist_categories_ai AFTER INSERT ON checklist_categories BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'categorias' AND registro_id = new.id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('categorias', new.id, new.relatorio_id, 0);
+        END
+    """,
+    "sync_checklist_categories_au": """
+        CREATE TRIGGER IF NOT EXISTS sync_checklist_categories_au AFTER UPDATE ON checklist_categories BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'categorias' AND registro_id = new.id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('categorias', new.id, new.relatorio_id, 0);
+        END
+    """,
+    "sync_checklist_categories_ad": """
+        CREATE TRIGGER IF NOT EXISTS sync_checklist_categories_ad AFTER DELETE ON checklist_categories BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'categorias' AND registro_id = old.id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('categorias', old.id, old.relatorio_id, 1);
+        END
+    """,
+    "sync_checklist_items_ai": """
+        CREATE TRIGGER IF NOT EXISTS sync_checklist_items_ai AFTER INSERT ON checklist_items BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'itens' AND registro_id = new.id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('itens', new.id, (SELECT relatorio_id FROM checklist_categories WHERE id = new.categoria_id), 0);
+        END
+    """,
+    "sync_checklist_items_au": """
+        CREATE TRIGGER IF NOT EXISTS sync_checklist_items_au AFTER UPDATE ON checklist_items BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'itens' AND registro_id = new.id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('itens', new.id, (SELECT relatorio_id FROM checklist_categories WHERE id = new.categoria_id), 0);
+        END
+    """,
+    "sync_checklist_items_ad": """
+        CREATE TRIGGER IF NOT EXISTS sync_checklist_items_ad AFTER DELETE ON checklist_items BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'itens' AND registro_id = old.id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('itens', old.id, (SELECT relatorio_id FROM checklist_categories WHERE id = old.categoria_id), 1);
+        END
+    """,
+}
+
+# Carga inicial com os registros existentes
+BACKFILL = [
+    "DELETE FROM sync_changes",
+    """
+        INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+        SELECT 'relatorios', id, id, 0 FROM reports ORDER BY id
+    """,
+    """
+        INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+        SELECT 'categorias', id, relatorio_id, 0 FROM checklist_categories ORDER BY id
+    """,
+    """
+        INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+        SELECT 'itens', i.id, c.relatorio_id, 0 FROM checklist_items i
+        JOIN checklist_categories c ON c.id = i.categoria_id ORDER BY i.id
+    """,
+]
+
+
+def create_sync_triggers(conn):
+    """Cria os triggers do registro de alterações e registra as linhas já existentes (só no SQLite)"""
+    if conn.dialect.name != "sqlite":
+        return
+
+    for sql in [*TRIGGERS.values(), *BACKFILL]:
+        conn.execute(sa.text(sql))
+
+
+def drop_sync_triggers(conn):
+    """Remove os triggers do registro de alterações (também usado pelos benchmarks)"""
+    if conn.dialect.name != "sqlite":
+        return
+
+    for trigger in TRIGGERS:
+        conn.execute(sa.text(f"DROP TRIGGER IF EXISTS {trigger}"))
+
+
+def upgrade() -> None:
+    op.create_table(
+        "sync_changes",
+        sa.Column("versao", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("tabela", sa.String(length=20), nullable=False),
+        sa.Column("registro_id", sa.Integer(), nullable=False),
+        sa.Column("relatorio_id", sa.Integer(), nullable=True),
+        sa.Column("excluido", sa.Boolean(), nullable=False),
+        sa.PrimaryKeyConstraint("versao"),
+        sqlite_autoincrement=True,
+    )
+    op.create_index("idx_sync_changes_registro", "sync_changes", ["tabela", "registro_id"], unique=True)
+    op.create_index("idx_sync_changes_relatorio_versao", "sync_changes", ["relatorio_id", "versao"], unique=False)
+    create_sync_triggers(op.get_bind())
+
+
+def downgrade() -> None:
+    drop_sync_triggers(op.get_bind())
+    op.drop_index("idx_sync_changes_relatorio_versao", table_name="sync_changes")
+    op.drop_index("idx_sync_changes_registro", table_name="sync_changes")
+    op.drop_table("sync_changes")
@@ -0,0 +1,118 @@
+"""Versões dos clientes no registro de alterações (ETags)
+
+Cria, no SQLite, os triggers que registram em sync_changes as escritas em clients,
+client_responsibles e client_collaborators (uma linha por cliente, tabela 'clientes'),
+já preenchida com os clientes existentes. As versões são usadas nos ETags de
+GET /clients/{id} e GET /reports/{id}.
+
+O SQL fica escrito aqui (e não gerado por app.sync) para que a revisão aplicada
+não mude com alterações futuras do código da aplicação.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-18 12:00:07
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Responsáveis e colaboradores fazem parte do cliente: alteram a versão dele
+# (a exclusão de um deles não exclui o cliente)
+TRIGGERS = {
+    "sync_clients_ai": """
+        CREATE TRIGGER IF NOT EXISTS sync_clients_ai AFTER INSERT ON clients BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'clientes' AND registro_id = new.id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('clientes', new.id, NULL, 0);
+        END
+    """,
+    "sync_clients_au": """
+        CREATE TRIGGER IF NOT EXISTS sync_clients_au AFTER UPDATE ON clients BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'clientes' AND registro_id = new.id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('clientes', new.id, NULL, 0);
+        END
+    """,
+    "sync_clients_ad": """
+        CREATE TRIGGER IF NOT EXISTS sync_clients_ad AFTER DELETE ON clients BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'clientes' AND registro_id = old.id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('clientes', old.id, NULL, 1);
+        END
+    """,
+    "sync_client_responsibles_ai": """
+        CREATE TRIGGER IF NOT EXISTS sync_client_responsibles_ai AFTER INSERT ON client_responsibles BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'clientes' AND registro_id = new.cliente_id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('clientes', new.cliente_id, NULL, 0);
+        END
+    """,
+    "sync_client_responsibles_au": """
+        CREATE TRIGGER IF NOT EXISTS sync_client_responsibles_au AFTER UPDATE ON client_responsibles BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'clientes' AND registro_id = new.cliente_id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('clientes', new.cliente_id, NULL, 0);
+        END
+    """,
+    "sync_client_responsibles_ad": """
+        CREATE TRIGGER IF NOT EXISTS sync_client_responsibles_ad AFTER DELETE ON client_responsibles BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'clientes' AND registro_id = old.cliente_id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('clientes', old.cliente_id, NULL, 0);
+        END
+    """,
+    "sync_client_collaborators_ai": """
+        CREATE TRIGGER IF NOT EXISTS sync_client_collaborators_ai AFTER INSERT ON client_collaborators BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'clientes' AND registro_id = new.cliente_id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('clientes', new.cliente_id, NULL, 0);
+        END
+    """,
+    "sync_client_collaborators_au": """
+        CREATE TRIGGER IF NOT EXISTS sync_client_collaborators_au AFTER UPDATE ON client_collaborators BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'clientes' AND registro_id = new.cliente_id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('clientes', new.cliente_id, NULL, 0);
+        END
+    """,
+    "sync_client_collaborators_ad": """
+        CREATE TRIGGER IF NOT EXISTS sync_client_collaborators_ad AFTER DELETE ON client_collaborators BEGIN
+            DELETE FROM sync_changes WHERE tabela = 'clientes' AND registro_id = old.cliente_id;
+            INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido)
+            VALUES ('clientes', old.cliente_id, NULL, 0);
+        END
+    """,
+}
+
+
+def upgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != "sqlite":
+        return
+
+    for sql in TRIGGERS.values():
+        conn.execute(sa.text(sql))
+    conn.execute(sa.text("DELETE FROM sync_changes WHERE tabela = 'clientes'"))
+    conn.execute(sa.text(
+        "INSERT INTO sync_changes (tabela, registro_id, relatorio_id, excluido) "
+        "SELECT 'clientes', id, NULL, 0 FROM clients ORDER BY id"
+    ))
+
+
+def downgrade() -> None:
+    conn = op.get_bind()
+    if conn.dialect.name != "sqlite":
+        return
+
+    for trigger in TRIGGERS:
+        conn.execute(sa.text(f"DROP TRIGGER IF EXISTS {trigger}"))
+    conn.execute(sa.text("DELETE FROM sync_changes WHERE tabela = 'clientes'"))
@@ -1,14 +1,19 @@
+import asyncio
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
 import bcrypt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy.orm import Session
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
 import os
 from dotenv import load_dotenv
 
-from app.database import get_db
+from app.cache import TTLCache
+from app.database import DbSession, get_session, run_db
 from app.models import User
 from app.schemas import TokenData
 
@@ -19,9 +24,23 @@ SECRET_KEY = os.getenv("SECRET_KEY", "sua-chave-secreta-super-segura-aqui")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", "30"))
 
+# Configurações do bcrypt
+# O hash roda em um executor dedicado ("thread" ou "process") para não ocupar
+# o threadpool do AnyIO que atende os demais endpoints
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+BCRYPT_EXECUTOR = os.getenv("BCRYPT_EXECUTOR", "thread")
+BCRYPT_WORKERS = int(os.getenv("BCRYPT_WORKERS", "2"))
+
+# Cache dos usuários autenticados
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", "1024"))
+
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="auth/login")
 
+# Usuários resolvidos por get_current_user, indexados pelo subject (email) do token
+user_cache = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verifica se a senha está correta"""
@@ -35,11 +54,48 @@ def get_password_hash(password: str) -> str:
     if len(password_bytes) > 72:
         password_bytes = password_bytes[:72]
     
-    salt = bcrypt.gensalt()
+    salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
     hashed = bcrypt.hashpw(password_bytes, salt)
     return hashed.decode('utf-8')
 
 
+_bcrypt_executor: Optional[Executor] = None
+
+
+def configure_bcrypt_executor(kind: str = BCRYPT_EXECUTOR, workers: int = BCRYPT_WORKERS) -> Executor:
+    """Cria (ou recria) o executor dedicado ao bcrypt"""
+    global _bcrypt_executor
+    shutdown_bcrypt_executor()
+    if kind == "process":
+        _bcrypt_executor = ProcessPoolExecutor(max_workers=workers)
+    else:
+        _bcrypt_executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+    return _bcrypt_executor
+
+
+def shutdown_bcrypt_executor():
+    """Encerra o executor do bcrypt (chamado no shutdown da aplicação)"""
+    global _bcrypt_executor
+    if _bcrypt_executor is not None:
+        _bcrypt_executor.shutdown(wait=False, cancel_futures=True)
+        _bcrypt_executor = None
+
+
+async def _run_bcrypt(func, *args):
+    executor = _bcrypt_executor or configure_bcrypt_executor()
+    return await asyncio.get_running_loop().run_in_executor(executor, func, *args)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verifica a senha no executor do bcrypt"""
+    return await _run_bcrypt(verify_password, plain_password, hashed_password)
+
+
+async def get_password_hash_async(password: str) -> str:
+    """Gera o hash da senha no executor do bcrypt"""
+    return await _run_bcrypt(get_password_hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     """Cria token JWT"""
     to_encode = data.copy()
@@ -52,12 +108,38 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     return encoded_jwt
 
 
+def _user_snapshot(user: User) -> dict:
+    """Copia as colunas do usuário para guardar no cache"""
+    return {attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs}
+
+
+def _user_from_snapshot(db: Session, snapshot: dict) -> User:
+    """Recria o usuário do cache e o associa à sessão atual sem consultar o banco"""
+    user = User(**snapshot)
+    make_transient_to_detached(user)
+    return db.merge(user, load=False)
+
+
+def invalidate_user_cache(email: str):
+    """Remove o usuário do cache (ex: após trocar email ou senha)"""
+    user_cache.pop(email)
+
+
+def _load_user(db: Session, token_data: TokenData) -> Optional[User]:
+    """Busca o usuário do token pela chave primária (claim uid) ou pelo email"""
+    if token_data.user_id is not None:
+        return db.get(User, token_data.user_id)
+    # Tokens antigos não têm o uid
+    return db.query(User).filter(User.email == token_data.email).first()
+
+
 async def get_current_user(
     token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
+    db: DbSession = Depends(get_session)
 ) -> User:
     """
     Dependency que retorna o usuário atual autenticado
+    Usa o cache de usuários; em caso de falha, busca pela chave primária (claim uid)
     """
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -70,22 +152,31 @@ async def get_current_user(
         email: str = payload.get("sub")
         if email is None:
             raise credentials_exception
-        token_data = TokenData(email=email)
+        token_data = TokenData(email=email, user_id=payload.get("uid"))
     except JWTError:
         raise credentials_exception
     
-    user = db.query(User).filter(User.email == token_data.email).first()
-    if user is None:
+    snapshot = user_cache.get(token_data.email)
+    if snapshot is not None:
+        # merge(load=False) não faz I/O: roda direto no event loop nos dois modos
+        sync_db = db.sync_session if isinstance(db, AsyncSession) else db
+        return _user_from_snapshot(sync_db, snapshot)
+    
+    user = await run_db(db, _load_user, token_data)
+    
+    # O email do token precisa continuar sendo o do usuário
+    if user is None or user.email != token_data.email:
         raise credentials_exception
     
+    user_cache.set(token_data.email, _user_snapshot(user))
     return user
 
 
-def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
+async def authenticate_user(db: DbSession, email: str, password: str) -> Optional[User]:
     """Autentica usuário"""
-    user = db.query(User).filter(User.email == email).first()
+    user = await run_db(db, lambda session: session.query(User).filter(User.email == email).first())
     if not user:
         return None
-    if not verify_password(password, user.senha_hash):
+    if not await verify_password_async(password, user.senha_hash):
         return None
     return user
@@ -0,0 +1,59 @@
+"""
+Agregação das respostas do checklist (conforme / não conforme / N/A / sem resposta)
+
+A mesma contagem pode ser feita em Python, em uma única passada pelos itens já
+carregados (PDF), ou no banco com GROUP BY resposta (API).
+"""
+from collections import Counter
+from typing import Mapping, Optional
+
+from sqlalchemy import select, func
+from sqlalchemy.orm import Session
+
+from app.models.report import Report, ChecklistCategory, ChecklistItem, ChecklistResponse
+from app.schemas.report import ChecklistSummary
+
+
+def _percentual(parte: int, total: int) -> int:
+    return parte * 100 // total if total else 0
+
+
+def build_summary(counts: Mapping[Optional[ChecklistResponse], int]) -> ChecklistSummary:
+    """Monta o resumo a partir da contagem de itens por resposta (None = sem resposta)"""
+    total = sum(counts.values())
+    conforme = counts.get(ChecklistResponse.CONFORME, 0)
+    nao_conforme = counts.get(ChecklistResponse.NAO_CONFORME, 0)
+    na = counts.get(ChecklistResponse.NA, 0)
+    return ChecklistSummary(
+        total_itens=total,
+        conforme=conforme,
+        nao_conforme=nao_conforme,
+        na=na,
+        sem_resposta=total - (conforme + nao_conforme + na),
+        percentual_conforme=_percentual(conforme, total),
+        percentual_nao_conforme=_percentual(nao_conforme, total),
+        percentual_na=_percentual(na, total),
+    )
+
+
+def summarize_report(report: Report) -> ChecklistSummary:
+    """Resumo de um relatório já carregado, em uma única passada pelos itens"""
+    return build_summary(Counter(
+        item.resposta
+        for categoria in report.categorias
+        for item in categoria.itens
+    ))
+
+
+def query_summary(db: Session, report_id: Optional[int] = None) -> ChecklistSummary:
+    """
+    Resumo calculado no banco (GROUP BY resposta)
+    Sem report_id, agrega os itens de todos os relatórios
+    """
+    query = select(ChecklistItem.resposta, func.count()).group_by(ChecklistItem.resposta)
+    if report_id is not None:
+        query = query.join(
+            ChecklistCategory, ChecklistItem.categoria_id == ChecklistCategory.id
+        ).where(ChecklistCategory.relatorio_id == report_id)
+    
+    return build_summary(dict(db.execute(query).all()))
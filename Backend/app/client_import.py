@@ -0,0 +1,286 @@
+"""
+Importação de clientes em lote (CSV ou JSON Lines)
+
+Cada linha é validada com o mesmo schema do POST /clients (ClientCreate). As linhas
+válidas são gravadas em lotes: uma consulta `cnpj IN (...)` separa os clientes novos
+dos existentes e cada tabela (clientes, responsáveis, colaboradores) recebe um único
+INSERT/UPDATE em lote, com um commit por lote.
+
+Clientes cujo CNPJ já existe são atualizados (upsert) com os campos enviados.
+Responsáveis e colaboradores só são substituídos quando vêm na linha.
+
+Colunas do CSV (separado por ';' ou ','):
+- os campos do cliente com o nome da API (nome_fantasia, cnpj, status, ...)
+- responsáveis: <tipo>_<campo>, ex: responsavel_tecnico_nome_completo
+- colaboradores: numero_total_colaboradores, numero_manipuladores_alimentos
+Células vazias são ignoradas.
+"""
+import csv
+import enum
+import io
+import json
+import os
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+from dotenv import load_dotenv
+from pydantic import ValidationError
+from sqlalchemy import delete, insert, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.models import Client, ClientResponsible, ClientCollaborators, ResponsibleType
+from app.schemas import ClientBase, ClientCreate, ClientImportRowResult, ClientImportResult
+from app.schemas.client import ClientCollaboratorsBase, ClientResponsibleBase
+from app.text_utils import normalize_text, only_digits
+
+load_dotenv()
+
+# Linhas validadas e gravadas por lote (uma transação por lote)
+IMPORT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "500"))
+
+CRIADO = "criado"
+ATUALIZADO = "atualizado"
+
+CLIENT_FIELDS = tuple(ClientBase.model_fields)
+RESPONSIBLE_FIELDS = tuple(field for field in ClientResponsibleBase.model_fields if field != "tipo")
+COLLABORATOR_FIELDS = tuple(ClientCollaboratorsBase.model_fields)
+
+
+class ImportFormat(str, enum.Enum):
+    """Enum para formato do arquivo de importação"""
+    CSV = "csv"
+    JSONL = "jsonl"
+
+
+# Extensões de arquivo aceitas quando o formato não é informado
+FORMAT_EXTENSIONS = {
+    ".csv": ImportFormat.CSV,
+    ".jsonl": ImportFormat.JSONL,
+    ".ndjson": ImportFormat.JSONL,
+}
+
+# Linha do arquivo: (número da linha, registro) ou (número da linha, mensagem de erro)
+Record = Tuple[int, object]
+
+
+def _csv_record(values: Dict[str, str]) -> dict:
+    """Converte as colunas achatadas do CSV na estrutura do ClientCreate"""
+    record = {field: values[field] for field in CLIENT_FIELDS if field in values}
+
+    responsaveis = []
+    for tipo in ResponsibleType:
+        dados = {
+            field: values[f"{tipo.value}_{field}"]
+            for field in RESPONSIBLE_FIELDS
+            if f"{tipo.value}_{field}" in values
+        }
+        if dados:
+            responsaveis.append({"tipo": tipo, **dados})
+    if responsaveis:
+        record["responsaveis"] = responsaveis
+
+    colaboradores = {field: values[field] for field in COLLABORATOR_FIELDS if field in values}
+    if colaboradores:
+        record["colaboradores_info"] = colaboradores
+
+    return record
+
+
+def parse_csv(content: str) -> Iterator[Record]:
+    """Linhas do CSV; o separador (';' ou ',') é detectado pelo cabeçalho"""
+    header = content.split("\n", 1)[0]
+    delimiter = ";" if header.count(";") >= header.count(",") else ","
+    reader = csv.DictReader(io.StringIO(content), delimiter=delimiter)
+    reader.fieldnames = [name.strip() for name in reader.fieldnames or []]
+
+    for row in reader:
+        values = {
+            key: value.strip()
+            for key, value in row.items()
+            if key and isinstance(value, str) and value.strip()
+        }
+        if values:
+            yield reader.line_num, _csv_record(values)
+
+
+def parse_jsonl(content: str) -> Iterator[Record]:
+    """Um objeto JSON (no formato do POST /clients) por linha"""
+    for linha, texto in enumerate(content.splitlines(), start=1):
+        if not texto.strip():
+            continue
+        try:
+            yield linha, json.loads(texto)
+        except json.JSONDecodeError as e:
+            yield linha, f"JSON inválido: {e.msg}"
+
+
+def parse_records(content: str, formato: ImportFormat) -> Iterator[Record]:
+    if formato == ImportFormat.CSV:
+        return parse_csv(content)
+    return parse_jsonl(content)
+
+
+def _validation_errors(exc: ValidationError) -> List[str]:
+    return [
+        f"{'.'.join(str(loc) for loc in error['loc'])}: {error['msg']}" if error["loc"] else error["msg"]
+        for error in exc.errors()
+    ]
+
+
+def _client_values(client: ClientCreate, exclude_unset: bool = False) -> dict:
+    """Colunas do cliente; as de busca são preenchidas aqui (os @validates só rodam em objetos do ORM)"""
+    values = client.model_dump(exclude={"responsaveis", "colaboradores_info"}, exclude_unset=exclude_unset)
+    values["nome_busca"] = normalize_text(client.nome_fantasia)
+    values["cnpj_digitos"] = only_digits(client.cnpj)
+    return values
+
+
+def _write_batch(db: Session, batch: List[Tuple[int, ClientCreate]], atualizar: bool) -> List[ClientImportRowResult]:
+    """Grava um lote de linhas válidas em uma transação"""
+    results = []
+
+    # Uma consulta para todos os CNPJs do lote
+    existing = dict(db.execute(
+        select(Client.cnpj, Client.id).where(Client.cnpj.in_([client.cnpj for _, client in batch]))
+    ).all())
+
+    new_rows: List[Tuple[int, ClientCreate]] = []
+    updated_rows: List[Tuple[int, int, ClientCreate]] = []
+    for linha, client in batch:
+        client_id = existing.get(client.cnpj)
+        if client_id is None:
+            new_rows.append((linha, client))
+        elif atualizar:
+            updated_rows.append((linha, client_id, client))
+        else:
+            results.append(ClientImportRowResult(
+                linha=linha, cnpj=client.cnpj, sucesso=False, cliente_id=client_id,
+                erros=["CNPJ já cadastrado"],
+            ))
+
+    written: List[Tuple[int, int, ClientCreate, str]] = []
+    if new_rows:
+        new_ids = db.execute(
+            insert(Client).returning(Client.id, sort_by_parameter_order=True),
+            [_client_values(client) for _, client in new_rows],
+        ).scalars().all()
+        written += [(linha, client_id, client, CRIADO) for (linha, client), client_id in zip(new_rows, new_ids)]
+    if updated_rows:
+        db.execute(update(Client), [
+            {"id": client_id, **_client_values(client, exclude_unset=True)}
+            for _, client_id, client in updated_rows
+        ])
+        written += [(linha, client_id, client, ATUALIZADO) for linha, client_id, client in updated_rows]
+
+    # Responsáveis: substitui os de clientes existentes só quando enviados
+    replaced = [
+        client_id for _, client_id, client, acao in written
+        if acao == ATUALIZADO and "responsaveis" in client.model_fields_set
+    ]
+    if replaced:
+        db.execute(delete(ClientResponsible).where(ClientResponsible.cliente_id.in_(replaced)))
+    responsibles = [
+        {"cliente_id": client_id, **resp.model_dump()}
+        for _, client_id, client, _ in written
+        for resp in client.responsaveis or []
+    ]
+    if responsibles:
+        db.execute(insert(ClientResponsible), responsibles)
+
+    # Colaboradores: um registro por cliente (atualiza o existente ou cria)
+    collaborators = {
+        client_id: client.colaboradores_info.model_dump()
+        for _, client_id, client, _ in written
+        if client.colaboradores_info is not None
+    }
+    if collaborators:
+        existing_collab = dict(db.execute(
+            select(ClientCollaborators.cliente_id, ClientCollaborators.id)
+            .where(ClientCollaborators.cliente_id.in_(list(collaborators)))
+        ).all())
+        collab_updates = [
+            {"id": existing_collab[client_id], **values}
+            for client_id, values in collaborators.items() if client_id in existing_collab
+        ]
+        collab_inserts = [
+            {"cliente_id": client_id, **values}
+            for client_id, values in collaborators.items() if client_id not in existing_collab
+        ]
+        if collab_updates:
+            db.execute(update(ClientCollaborators), collab_updates)
+        if collab_inserts:
+            db.execute(insert(ClientCollaborators), collab_inserts)
+
+    db.commit()
+
+    results += [
+        ClientImportRowResult(linha=linha, cnpj=client.cnpj, sucesso=True, cliente_id=client_id, acao=acao)
+        for linha, client_id, client, acao in written
+    ]
+    return results
+
+
+def import_clients(db: Session, records: Iterable[Record], atualizar: bool = True,
+                   batch_size: int = IMPORT_BATCH_SIZE) -> ClientImportResult:
+    """
+    Valida e grava as linhas em lotes de batch_size
+    Linhas inválidas não interrompem a importação: entram no relatório com os erros
+    """
+    results: List[ClientImportRowResult] = []
+    seen_cnpjs: Dict[str, int] = {}
+    batch: List[Tuple[int, ClientCreate]] = []
+
+    def flush():
+        try:
+            results.extend(_write_batch(db, batch, atualizar))
+        except IntegrityError:
+            # Ex: CNPJ cadastrado por outra requisição durante a importação
+            db.rollback()
+            results.extend(
+                ClientImportRowResult(
+                    linha=linha, cnpj=client.cnpj, sucesso=False,
+                    erros=["Conflito ao gravar o lote; nenhuma linha do lote foi importada"],
+                )
+                for linha, client in batch
+            )
+        batch.clear()
+
+    total = 0
+    for linha, record in records:
+        total += 1
+        if isinstance(record, str):
+            results.append(ClientImportRowResult(linha=linha, sucesso=False, erros=[record]))
+            continue
+
+        try:
+            client = ClientCreate.model_validate(record)
+        except ValidationError as e:
+            cnpj = record.get("cnpj") if isinstance(record, dict) else None
+            results.append(ClientImportRowResult(
+                linha=linha, cnpj=cnpj if isinstance(cnpj, str) else None, sucesso=False,
+                erros=_validation_errors(e),
+            ))
+            continue
+
+        if client.cnpj in seen_cnpjs:
+            results.append(ClientImportRowResult(
+                linha=linha, cnpj=client.cnpj, sucesso=False,
+                erros=[f"CNPJ repetido no arquivo (linha {seen_cnpjs[client.cnpj]})"],
+            ))
+            continue
+        seen_cnpjs[client.cnpj] = linha
+
+        batch.append((linha, client))
+        if len(batch) >= batch_size:
+            flush()
+    if batch:
+        flush()
+
+    results.sort(key=lambda result: result.linha)
+    return ClientImportResult(
+        total_linhas=total,
+        criados=sum(1 for result in results if result.acao == CRIADO),
+        atualizados=sum(1 for result in results if result.acao == ATUALIZADO),
+        com_erro=sum(1 for result in results if not result.sucesso),
+        linhas=results,
+    )
@@ -0,0 +1,195 @@
+"""
+Compressão das respostas (Brotli ou GZip, conforme o Accept-Encoding)
+
+Os JSONs dos relatórios repetem muito texto (descrições dos itens) e comprimem bem;
+os tablets usam dados móveis. Respostas menores que COMPRESSION_MIN_SIZE e tipos já
+comprimidos (PDF, ZIP, XLSX, imagens) passam sem alteração. Respostas em streaming
+(exportação CSV) são comprimidas por partes, sem juntar o corpo em memória.
+
+O Brotli é opcional (pacote `brotli`); sem ele só o GZip é oferecido.
+"""
+import os
+import zlib
+from typing import List, Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Codificações aceitas, em ordem de preferência ("" desliga a compressão)
+COMPRESSION = os.getenv("COMPRESSION", "br,gzip")
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", "1024"))
+GZIP_LEVEL = int(os.getenv("GZIP_LEVEL", "6"))
+# Qualidade 4: boa taxa para conteúdo dinâmico sem o custo dos níveis altos
+BROTLI_QUALITY = int(os.getenv("BROTLI_QUALITY", "4"))
+
+# Tipos que já são comprimidos: comprimir de novo só gasta CPU
+EXCLUDED_MEDIA_TYPES = (
+    "application/pdf",
+    "application/zip",
+    "application/vnd.openxmlformats-officedocument",
+    "image/",
+)
+
+
+def available_encodings() -> List[str]:
+    """Codificações configuradas que estão disponíveis neste ambiente"""
+    encodings = []
+    for encoding in COMPRESSION.split(","):
+        encoding = encoding.strip().lower()
+        if encoding == "gzip" or (encoding == "br" and brotli is not None):
+            encodings.append(encoding)
+    return encodings
+
+
+def choose_encoding(accept_encoding: str, encodings: List[str]) -> Optional[str]:
+    """Primeira codificação configurada que o cliente aceita (q > 0)"""
+    accepted = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        accepted[name.strip()] = q
+    for encoding in encodings:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+class _Compressor:
+    def __init__(self, encoding: str, gzip_level: int, brotli_quality: int):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=brotli_quality)
+        else:
+            self._brotli = None
+            self._gzip = zlib.compressobj(gzip_level, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+
+    def compress(self, data: bytes) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(data)
+        return self._gzip.compress(data)
+
+    def finish(self) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.finish()
+        return self._gzip.flush()
+
+
+class CompressionMiddleware:
+    """Middleware ASGI de compressão com tamanho mínimo e tipos excluídos"""
+
+    def __init__(self, app: ASGIApp, encodings: Optional[List[str]] = None,
+                 minimum_size: int = COMPRESSION_MIN_SIZE, gzip_level: int = GZIP_LEVEL,
+                 brotli_quality: int = BROTLI_QUALITY, excluded_media_types=EXCLUDED_MEDIA_TYPES):
+        self.app = app
+        self.encodings = available_encodings() if encodings is None else encodings
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+        self.excluded_media_types = tuple(excluded_media_types)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http" or not self.encodings:
+            await self.app(scope, receive, send)
+            return
+
+        # Sem codificação aceita a resposta sai sem compressão, mas ainda leva o Vary
+        encoding = choose_encoding(Headers(scope=scope).get("accept-encoding", ""), self.encodings)
+        await _CompressionResponder(self, encoding, send)(scope, receive)
+
+
+class _CompressionResponder:
+    """
+    Decide na primeira parte do corpo se a resposta é comprimida
+    Toda resposta de tipo comprimível leva Vary: Accept-Encoding, mesmo quando sai sem
+    compressão (corpo pequeno, identity ou q=0): um cache compartilhado não pode
+    entregá-la a quem pediu outra codificação
+    """
+
+    def __init__(self, middleware: CompressionMiddleware, encoding: Optional[str], send: Send):
+        self.middleware = middleware
+        self.encoding = encoding
+        self.send = send
+        self.start: Optional[Message] = None
+        self.compressor: Optional[_Compressor] = None
+        self.passthrough = False
+
+    async def __call__(self, scope: Scope, receive: Receive):
+        await self.middleware.app(scope, receive, self.send_wrapper)
+
+    def _varies(self, headers: Headers) -> bool:
+        """O conteúdo depende do Accept-Encoding (tipo comprimível e ainda sem codificação)"""
+        if "content-encoding" in headers:
+            return False
+        return not headers.get("content-type", "").startswith(self.middleware.excluded_media_types)
+
+    def _compressible(self, headers: Headers) -> bool:
+        if self.start["status"] < 200 or self.start["status"] in (204, 304):
+            return False
+        return self._varies(headers)
+
+    async def _send_uncompressed_start(self):
+        headers = MutableHeaders(raw=self.start["headers"])
+        if self._varies(headers):
+            headers.add_vary_header("Accept-Encoding")
+        self.passthrough = True
+        await self.send(self.start)
+
+    def _compressed_headers(self) -> MutableHeaders:
+        headers = MutableHeaders(raw=self.start["headers"])
+        headers["Content-Encoding"] = self.encoding
+        headers.add_vary_header("Accept-Encoding")
+        return headers
+
+    async def send_wrapper(self, message: Message):
+        if message["type"] == "http.response.start":
+            self.start = message
+            if self.encoding is None:
+                await self._send_uncompressed_start()
+            # Senão só envia o início junto com a primeira parte do corpo (cabeçalhos podem mudar)
+            return
+
+        if message["type"] != "http.response.body" or self.passthrough:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.compressor is None:
+            headers = Headers(raw=self.start["headers"])
+            if not self._compressible(headers) or (not more_body and len(body) < self.middleware.minimum_size):
+                await self._send_uncompressed_start()
+                await self.send(message)
+                return
+
+            self.compressor = _Compressor(self.encoding, self.middleware.gzip_level, self.middleware.brotli_quality)
+            compressed_headers = self._compressed_headers()
+            if not more_body:
+                # Corpo inteiro: comprime de uma vez e corrige o Content-Length
+                body = self.compressor.compress(body) + self.compressor.finish()
+                compressed_headers["Content-Length"] = str(len(body))
+                await self.send(self.start)
+                await self.send({"type": "http.response.body", "body": body})
+                return
+
+            # Streaming: tamanho final desconhecido
+            del compressed_headers["Content-Length"]
+            await self.send(self.start)
+
+        if more_body:
+            body = self.compressor.compress(body)
+            if body:
+                await self.send({"type": "http.response.body", "body": body, "more_body": True})
+        else:
+            body = self.compressor.compress(body) + self.compressor.finish()
+            await self.send({"type": "http.response.body", "body": body})
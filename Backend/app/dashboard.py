@@ -0,0 +1,178 @@
+"""
+Estatísticas do dashboard
+
+As contagens ficam pré-agregadas na tabela dashboard_counters (dimensão, chave, total).
+No SQLite, triggers em clients, reports e checklist_items atualizam os contadores
+na mesma transação de cada escrita, inclusive nos inserts/updates em lote, que não
+passam pelos eventos do ORM. O dashboard lê apenas essa tabela pequena, então o
+custo não cresce com o histórico.
+
+Nos demais bancos (sem os triggers) as mesmas contagens são feitas na hora, com
+uma query agrupada por dimensão.
+
+A tabela e os triggers são criados pela migração 0005 do Alembic.
+"""
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+from sqlalchemy import func, select, text
+from sqlalchemy.engine import Engine
+
+from app.models import (
+    User,
+    Client,
+    Report,
+    ChecklistItem,
+    ClientCategory,
+    ReportStatus,
+    ChecklistResponse,
+    DashboardCounter,
+)
+from app.schemas.dashboard import DashboardStats, DashboardMonthCount, DashboardInspectorCount
+from app.checklist_summary import build_summary
+
+# Dimensões dos contadores (as mesmas gravadas pelos triggers da migração 0005)
+CLIENTES = "clientes"
+RELATORIOS_STATUS = "relatorios_status"
+RELATORIOS_MES = "relatorios_mes"
+RELATORIOS_INSPETOR = "relatorios_inspetor"
+RELATORIOS_CATEGORIA_CLIENTE = "relatorios_categoria_cliente"
+ITENS_RESPOSTA = "itens_resposta"
+
+_counters_enabled = False
+
+
+def _month_expr(dialect: str):
+    """Mês (AAAA-MM) de criação do relatório"""
+    if dialect == "postgresql":
+        return func.to_char(Report.criado_em, "YYYY-MM")
+    if dialect == "mysql":
+        return func.date_format(Report.criado_em, "%Y-%m")
+    return func.strftime("%Y-%m", Report.criado_em)
+
+
+def _enum_name(value) -> str:
+    """Chave gravada pelo banco para um Enum (o nome do membro; '' para NULL)"""
+    return value.name if value is not None else ""
+
+
+def _live_counts(conn, dialect: str) -> List[Tuple[str, str, int]]:
+    """Contagens calculadas na hora: uma query agrupada por dimensão"""
+    rows = [(CLIENTES, "total", conn.execute(select(func.count()).select_from(Client)).scalar())]
+
+    rows += [
+        (RELATORIOS_STATUS, _enum_name(status), total)
+        for status, total in conn.execute(select(Report.status, func.count()).group_by(Report.status))
+    ]
+
+    mes = _month_expr(dialect)
+    rows += [
+        (RELATORIOS_MES, chave or "", total)
+        for chave, total in conn.execute(select(mes, func.count()).group_by(mes))
+    ]
+
+    rows += [
+        (RELATORIOS_INSPETOR, str(responsavel_id), total)
+        for responsavel_id, total in conn.execute(
+            select(Report.responsavel_inspecao_id, func.count()).group_by(Report.responsavel_inspecao_id)
+        )
+    ]
+
+    rows += [
+        (RELATORIOS_CATEGORIA_CLIENTE, _enum_name(categoria), total)
+        for categoria, total in conn.execute(
+            select(Client.categoria, func.count(Report.id))
+            .join(Client, Report.cliente_id == Client.id)
+            .group_by(Client.categoria)
+        )
+    ]
+
+    rows += [
+        (ITENS_RESPOSTA, _enum_name(resposta), total)
+        for resposta, total in conn.execute(
+            select(ChecklistItem.resposta, func.count()).group_by(ChecklistItem.resposta)
+        )
+    ]
+    return rows
+
+
+def init_dashboard_counters(engine: Engine):
+    """
+    Verifica se os triggers dos contadores existem (chamado na inicialização da aplicação)
+    Os triggers são criados pela migração; sem eles o dashboard agrega na hora
+    """
+    global _counters_enabled
+
+    if engine.dialect.name != "sqlite":
+        return
+
+    with engine.connect() as conn:
+        _counters_enabled = conn.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'dashboard_items_au'"
+        )).first() is not None
+
+
+def _enum_value(enum, chave: str) -> str:
+    """Converte a chave gravada (nome do membro) para o valor exposto pela API"""
+    return enum[chave].value if chave in enum.__members__ else chave
+
+
+def load_dashboard(db, user_name: str, meses: int = 12) -> DashboardStats:
+    """
+    Monta as estatísticas do dashboard
+    Lê os contadores pré-agregados ou, sem os triggers, agrega na hora
+    """
+    if _counters_enabled:
+        rows = db.execute(select(DashboardCounter.dimensao, DashboardCounter.chave, DashboardCounter.total)).all()
+    else:
+        rows = _live_counts(db, db.get_bind().dialect.name)
+
+    counts: Dict[str, Dict[str, int]] = defaultdict(dict)
+    for dimensao, chave, total in rows:
+        if total:
+            counts[dimensao][chave] = total
+
+    por_status = {
+        _enum_value(ReportStatus, chave): total
+        for chave, total in counts[RELATORIOS_STATUS].items()
+    }
+
+    por_mes = [
+        DashboardMonthCount(mes=mes, total=counts[RELATORIOS_MES][mes])
+        for mes in sorted(counts[RELATORIOS_MES])[-meses:]
+    ]
+
+    # Um único SELECT para os nomes dos responsáveis
+    inspetores = {int(chave): total for chave, total in counts[RELATORIOS_INSPETOR].items()}
+    nomes = dict(db.execute(select(User.id, User.nome).where(User.id.in_(inspetores))).all()) if inspetores else {}
+    por_inspetor = sorted(
+        (
+            DashboardInspectorCount(responsavel_id=responsavel_id, nome=nomes.get(responsavel_id, ""), total=total)
+            for responsavel_id, total in inspetores.items()
+        ),
+        key=lambda inspetor: inspetor.total,
+        reverse=True,
+    )
+
+    por_categoria = {
+        _enum_value(ClientCategory, chave): total
+        for chave, total in counts[RELATORIOS_CATEGORIA_CLIENTE].items()
+    }
+
+    summary = build_summary({
+        (ChecklistResponse[chave] if chave else None): total
+        for chave, total in counts[ITENS_RESPOSTA].items()
+    })
+    avaliados = summary.conforme + summary.nao_conforme
+
+    return DashboardStats(
+        user_name=user_name,
+        total_clients=counts[CLIENTES].get("total", 0),
+        total_reports=sum(counts[RELATORIOS_STATUS].values()),
+        checklist_summary=summary,
+        taxa_conformidade=round(summary.conforme * 100 / avaliados, 1) if avaliados else 0.0,
+        relatorios_por_status=por_status,
+        relatorios_por_mes=por_mes,
+        relatorios_por_inspetor=por_inspetor,
+        relatorios_por_categoria_cliente=por_categoria,
+    )
@@ -1,6 +1,10 @@
-from sqlalchemy import create_engine
+from typing import Union
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import create_engine, event
+from sqlalchemy.engine import Engine, make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy.orm import Session, sessionmaker
 import os
 from dotenv import load_dotenv
 
@@ -8,13 +12,123 @@ load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./database.db")
 
-engine = create_engine(
-    DATABASE_URL,
-    connect_args={"check_same_thread": False} if "sqlite" in DATABASE_URL else {}
-)
+# Camada assíncrona (AsyncSession com aiosqlite/asyncpg) para os routers
+DB_ASYNC = os.getenv("DB_ASYNC", "false").lower() in ("1", "true", "yes")
+
+# Driver assíncrono usado para cada banco quando DB_ASYNC está ativo
+ASYNC_DRIVERS = {
+    "sqlite": "sqlite+aiosqlite",
+    "postgresql": "postgresql+asyncpg",
+    "mysql": "mysql+aiomysql",
+}
+
+# Pragmas aplicados em cada conexão SQLite
+SQLITE_JOURNAL_MODE = os.getenv("SQLITE_JOURNAL_MODE", "WAL")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_BUSY_TIMEOUT_MS = int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", "5000"))
+SQLITE_CACHE_SIZE_KB = int(os.getenv("SQLITE_CACHE_SIZE_KB", "65536"))
+SQLITE_MMAP_SIZE_MB = int(os.getenv("SQLITE_MMAP_SIZE_MB", "256"))
+
+# Pool de conexões dos bancos servidor (PostgreSQL, MySQL...)
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE", "10"))
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW", "20"))
+DB_POOL_TIMEOUT = int(os.getenv("DB_POOL_TIMEOUT", "30"))
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE", "1800"))
+DB_POOL_PRE_PING = os.getenv("DB_POOL_PRE_PING", "true").lower() in ("1", "true", "yes")
+
+
+def sqlite_pragmas(
+    journal_mode: str = SQLITE_JOURNAL_MODE,
+    synchronous: str = SQLITE_SYNCHRONOUS,
+    busy_timeout_ms: int = SQLITE_BUSY_TIMEOUT_MS,
+    cache_size_kb: int = SQLITE_CACHE_SIZE_KB,
+    mmap_size_mb: int = SQLITE_MMAP_SIZE_MB,
+) -> dict:
+    """Pragmas do SQLite a partir das configurações (cache_size negativo = KiB)"""
+    return {
+        "journal_mode": journal_mode,
+        "synchronous": synchronous,
+        "busy_timeout": busy_timeout_ms,
+        "cache_size": -cache_size_kb,
+        "mmap_size": mmap_size_mb * 1024 * 1024,
+    }
+
+
+def _apply_sqlite_pragmas(engine: Engine, pragmas: dict):
+    """Registra os pragmas para serem aplicados a cada nova conexão"""
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for nome, valor in pragmas.items():
+            cursor.execute(f"PRAGMA {nome}={valor}")
+        cursor.close()
+
+
+def _pool_options(**kwargs) -> dict:
+    """Opções de pool dos bancos servidor"""
+    pool_options = {
+        "pool_size": DB_POOL_SIZE,
+        "max_overflow": DB_MAX_OVERFLOW,
+        "pool_timeout": DB_POOL_TIMEOUT,
+        "pool_recycle": DB_POOL_RECYCLE,
+        "pool_pre_ping": DB_POOL_PRE_PING,
+    }
+    pool_options.update(kwargs)
+    return pool_options
+
+
+def create_db_engine(url: str = DATABASE_URL, pragmas: dict = None, **kwargs) -> Engine:
+    """
+    Cria o engine conforme o tipo de banco
+    - SQLite: aplica os pragmas (WAL, synchronous, busy_timeout, cache e mmap) a cada conexão
+    - Bancos servidor: configura o tamanho do pool, overflow, pre-ping e reciclagem
+    """
+    if url.startswith("sqlite"):
+        engine = create_engine(url, connect_args={"check_same_thread": False}, **kwargs)
+        _apply_sqlite_pragmas(engine, sqlite_pragmas() if pragmas is None else pragmas)
+        return engine
+
+    return create_engine(url, **_pool_options(**kwargs))
+
+
+def async_database_url(url: str = DATABASE_URL) -> str:
+    """Troca o driver da URL pelo driver assíncrono (ex: sqlite:// -> sqlite+aiosqlite://)"""
+    parsed = make_url(url)
+    driver = ASYNC_DRIVERS.get(parsed.get_backend_name())
+    if driver is None:
+        raise ValueError(f"Banco sem driver assíncrono configurado: {parsed.get_backend_name()}")
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def create_async_db_engine(url: str = DATABASE_URL, pragmas: dict = None, **kwargs):
+    """
+    Cria o engine assíncrono com as mesmas configurações de create_db_engine
+    """
+    async_url = async_database_url(url)
+    if url.startswith("sqlite"):
+        engine = create_async_engine(async_url, **kwargs)
+        _apply_sqlite_pragmas(engine.sync_engine, sqlite_pragmas() if pragmas is None else pragmas)
+        return engine
+
+    return create_async_engine(async_url, **_pool_options(**kwargs))
+
+
+engine = create_db_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Só criado no modo assíncrono (exige aiosqlite/asyncpg instalado)
+# expire_on_commit=False: os objetos continuam legíveis depois do commit sem novo I/O
+async_engine = create_async_db_engine() if DB_ASYNC else None
+AsyncSessionLocal = (
+    async_sessionmaker(async_engine, autoflush=False, expire_on_commit=False)
+    if DB_ASYNC else None
+)
+
+# Sessão recebida pelos endpoints (síncrona ou assíncrona, conforme DB_ASYNC)
+DbSession = Union[Session, AsyncSession]
+
 Base = declarative_base()
 
 
@@ -28,3 +142,30 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db():
+    """
+    Dependency que cria uma AsyncSession (modo DB_ASYNC)
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+# Dependency usada pelos routers
+get_session = get_async_db if DB_ASYNC else get_db
+
+
+async def run_db(db: DbSession, fn, *args, **kwargs):
+    """
+    Executa fn(session, *args) sem bloquear o event loop
+    - AsyncSession: roda no próprio event loop via run_sync (I/O assíncrono, sem thread)
+    - Session: roda no threadpool
+
+    fn recebe sempre uma Session síncrona, então o mesmo código de consulta serve
+    aos dois modos. Deve devolver dados já carregados (ex: schemas validados), pois
+    no modo assíncrono não há lazy loading fora de fn.
+    """
+    if isinstance(db, AsyncSession):
+        return await db.run_sync(fn, *args, **kwargs)
+    return await run_in_threadpool(fn, db, *args, **kwargs)
@@ -0,0 +1,47 @@
+"""
+Utilitários para requisições condicionais (ETag / If-None-Match)
+"""
+import os
+from typing import Optional
+
+from fastapi import Response, status
+
+# Tempo (s) que o navegador pode reutilizar um relatório concluído sem revalidar
+REPORT_CACHE_MAX_AGE = int(os.getenv("REPORT_CACHE_MAX_AGE", "600"))
+
+# Demais respostas: podem ficar em cache, mas são revalidadas (If-None-Match) a cada uso
+NO_CACHE = "private, no-cache"
+
+
+def weak_etag(value: str) -> str:
+    """Monta um ETag fraco a partir de um identificador de versão"""
+    return f'W/"{value}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Verifica se o cabeçalho If-None-Match contém o ETag informado
+    A comparação é fraca (ignora o prefixo W/), como define a RFC 9110 para GET
+    """
+    if not if_none_match:
+        return False
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == opaque:
+            return True
+    return False
+
+
+def not_modified(if_none_match: Optional[str], etag: str, cache_control: str = NO_CACHE) -> Optional[Response]:
+    """Resposta 304 se o cliente já tem a versão atual; None caso contrário"""
+    if not etag_matches(if_none_match, etag):
+        return None
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers={"ETag": etag, "Cache-Control": cache_control},
+    )
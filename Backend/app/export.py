@@ -0,0 +1,286 @@
+"""
+Exportação dos resultados do checklist (CSV / XLSX)
+
+Os relatórios filtrados são percorridos com yield_per e os itens de cada lote
+(relatórios + categorias + itens) vêm de uma única consulta: cada lote é escrito
+e enviado antes do próximo ser lido, então a memória fica constante, qualquer
+que seja o volume.
+
+O XLSX é montado em streaming com zipfile sobre um destino não pesquisável
+(as entradas usam data descriptors), sem biblioteca extra e sem arquivo temporário.
+"""
+import csv
+import enum
+import io
+import os
+import re
+import zipfile
+from datetime import date, datetime, timedelta
+from typing import Iterable, Iterator, List, Optional, Sequence
+from xml.sax.saxutils import escape
+
+from dotenv import load_dotenv
+from sqlalchemy import func, select
+
+from app.database import SessionLocal
+from app.models import (
+    User,
+    Client,
+    Report,
+    ChecklistCategory,
+    ChecklistItem,
+    ChecklistTemplateItem,
+    ReportStatus,
+    ChecklistResponse,
+)
+
+load_dotenv()
+
+# Relatórios lidos do banco por lote
+EXPORT_BATCH_SIZE = int(os.getenv("EXPORT_BATCH_SIZE", "100"))
+
+# Linhas (itens) escritas na resposta por bloco
+ROWS_PER_CHUNK = 1000
+
+
+class ExportFormat(str, enum.Enum):
+    """Enum para formato da exportação"""
+    CSV = "csv"
+    XLSX = "xlsx"
+
+
+MEDIA_TYPES = {
+    ExportFormat.CSV: "text/csv",
+    ExportFormat.XLSX: "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+}
+
+COLUMNS = [
+    "relatorio_id",
+    "relatorio",
+    "cliente",
+    "cnpj",
+    "status",
+    "criado_em",
+    "finalizado_em",
+    "responsavel",
+    "categoria",
+    "codigo",
+    "item",
+    "resposta",
+    "observacoes",
+]
+
+
+def report_ids_statement(
+    cliente_id: Optional[int] = None,
+    data_inicio: Optional[date] = None,
+    data_fim: Optional[date] = None,
+    status_filter: Optional[ReportStatus] = None,
+):
+    """
+    Ids dos relatórios exportados, na ordem de criação
+    Só a tabela reports: a ordem vem do índice (criado_em, id) ou (cliente_id/status,
+    criado_em, id), sem ordenar o resultado. O período (data de criação) inclui data_fim
+    """
+    stmt = select(Report.id).order_by(Report.criado_em, Report.id)
+
+    if cliente_id:
+        stmt = stmt.where(Report.cliente_id == cliente_id)
+    if data_inicio:
+        stmt = stmt.where(Report.criado_em >= datetime.combine(data_inicio, datetime.min.time()))
+    if data_fim:
+        stmt = stmt.where(Report.criado_em < datetime.combine(data_fim + timedelta(days=1), datetime.min.time()))
+    if status_filter:
+        stmt = stmt.where(Report.status == status_filter)
+
+    return stmt
+
+
+def items_statement(report_ids: Sequence[int], resposta: Optional[ChecklistResponse] = None):
+    """Linhas de um lote de relatórios: uma por item, na ordem dos relatórios e do checklist"""
+    stmt = (
+        select(
+            Report.id,
+            Report.descricao,
+            Client.nome_fantasia,
+            Client.cnpj,
+            Report.status,
+            Report.criado_em,
+            Report.finalizado_em,
+            User.nome,
+            ChecklistCategory.nome,
+            ChecklistItem.codigo,
+            # Itens criados a partir de template só referenciam o texto
+            func.coalesce(ChecklistItem.descricao, ChecklistTemplateItem.descricao),
+            ChecklistItem.resposta,
+            ChecklistItem.observacoes,
+        )
+        .join(Client, Report.cliente_id == Client.id)
+        .join(User, Report.responsavel_inspecao_id == User.id)
+        .join(ChecklistCategory, ChecklistCategory.relatorio_id == Report.id)
+        .join(ChecklistItem, ChecklistItem.categoria_id == ChecklistCategory.id)
+        .outerjoin(ChecklistTemplateItem, ChecklistItem.template_item_id == ChecklistTemplateItem.id)
+        .where(Report.id.in_(report_ids))
+        .order_by(Report.criado_em, Report.id, ChecklistCategory.ordem, ChecklistItem.ordem)
+    )
+
+    if resposta:
+        stmt = stmt.where(ChecklistItem.resposta == resposta)
+
+    return stmt
+
+
+def _cell(value):
+    """Valor exportado: enums pelo valor da API, datas em ISO, NULL vazio"""
+    if value is None:
+        return ""
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat(sep=" ", timespec="seconds")
+    return value
+
+
+def export_batches(
+    resposta: Optional[ChecklistResponse] = None,
+    batch_size: int = EXPORT_BATCH_SIZE,
+    **filtros,
+) -> Iterator[List[Sequence]]:
+    """
+    Percorre os ids dos relatórios com yield_per (cursor do servidor) e, para cada
+    lote de ids, busca os itens com uma única consulta. A ordenação fica restrita
+    ao lote, então a primeira linha sai sem esperar o resultado inteiro.
+
+    Usa uma sessão própria: o gerador é consumido pela StreamingResponse depois que
+    o endpoint retorna, fora do ciclo de vida da sessão da requisição
+    """
+    db = SessionLocal()
+    try:
+        ids = db.execute(report_ids_statement(**filtros).execution_options(yield_per=batch_size))
+        for report_ids in ids.scalars().partitions():
+            rows = db.execute(
+                items_statement(report_ids, resposta).execution_options(yield_per=ROWS_PER_CHUNK)
+            )
+            for partition in rows.partitions():
+                yield [[_cell(value) for value in row] for row in partition]
+    finally:
+        db.close()
+
+
+def stream_csv(batches: Iterable[List[Sequence]]) -> Iterator[bytes]:
+    """
+    CSV separado por ';' com BOM UTF-8 (abre direto no Excel em português)
+    Cada bloco de linhas vira um bloco da resposta
+    """
+    buffer = io.StringIO()
+    buffer.write("\ufeff")
+    writer = csv.writer(buffer, delimiter=";")
+    writer.writerow(COLUMNS)
+
+    for batch in batches:
+        writer.writerows(batch)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+class ChunkSink:
+    """Destino de escrita não pesquisável: guarda os bytes até serem enviados"""
+
+    def __init__(self):
+        self.chunks: List[bytes] = []
+
+    def write(self, data) -> int:
+        self.chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def take(self) -> bytes:
+        data = b"".join(self.chunks)
+        self.chunks.clear()
+        return data
+
+
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+_XLSX_STATIC_PARTS = {
+    "[Content_Types].xml": (
+        '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+        '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+        '<Default Extension="xml" ContentType="application/xml"/>'
+        '<Override PartName="/xl/workbook.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+        '<Override PartName="/xl/worksheets/sheet1.xml" '
+        'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+        '</Types>'
+    ),
+    "_rels/.rels": (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="xl/workbook.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument"/>'
+        '</Relationships>'
+    ),
+    "xl/workbook.xml": (
+        '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+        'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+        '<sheets><sheet name="Relatorios" sheetId="1" r:id="rId1"/></sheets>'
+        '</workbook>'
+    ),
+    "xl/_rels/workbook.xml.rels": (
+        '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+        '<Relationship Id="rId1" Target="worksheets/sheet1.xml" '
+        'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"/>'
+        '</Relationships>'
+    ),
+}
+
+# Caracteres de controle que não são permitidos em XML 1.0
+_XML_INVALID = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+def _xlsx_row(values: Sequence) -> str:
+    cells = []
+    for value in values:
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            cells.append(f"<c><v>{value}</v></c>")
+        else:
+            texto = escape(_XML_INVALID.sub("", str(value)))
+            cells.append(f'<c t="inlineStr"><is><t xml:space="preserve">{texto}</t></is></c>')
+    return f"<row>{''.join(cells)}</row>"
+
+
+def stream_xlsx(batches: Iterable[List[Sequence]]) -> Iterator[bytes]:
+    """
+    Planilha XLSX (uma aba, textos inline) escrita em streaming
+    Cada bloco de linhas é comprimido e enviado antes do próximo ser lido
+    """
+    sink = ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as xlsx:
+        for name, content in _XLSX_STATIC_PARTS.items():
+            xlsx.writestr(name, _XML_HEADER + content)
+
+        with xlsx.open("xl/worksheets/sheet1.xml", mode="w", force_zip64=True) as sheet:
+            sheet.write((
+                _XML_HEADER
+                + '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+                + _xlsx_row(COLUMNS)
+            ).encode("utf-8"))
+            for batch in batches:
+                sheet.write("".join(_xlsx_row(row) for row in batch).encode("utf-8"))
+                chunk = sink.take()
+                if chunk:
+                    yield chunk
+            sheet.write(b"</sheetData></worksheet>")
+    yield sink.take()
+
+
+def stream_export(formato: ExportFormat, **filtros) -> Iterator[bytes]:
+    """Gera os bytes da exportação no formato pedido (filtros de export_batches)"""
+    batches = export_batches(**filtros)
+    if formato == ExportFormat.XLSX:
+        return stream_xlsx(batches)
+    return stream_csv(batches)
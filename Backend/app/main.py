@@ -1,11 +1,30 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.database import Base, engine
-from app.routers import auth_router, clients_router, reports_router
+from app.database import engine, async_engine
+from app.auth import shutdown_bcrypt_executor
+from app.pdf_jobs import shutdown_pdf_workers
+from app.migrations import check_schema_version
+from app.search import init_search_index
+from app.dashboard import init_dashboard_counters
+from app.sync import init_sync
+from app.responses import PydanticJSONResponse
+from app.compression import CompressionMiddleware
+from app.metrics import MetricsMiddleware, instrument_engine
+from app.routers import auth_router, clients_router, reports_router, templates_router, sync_router, metrics_router
 
-# Cria as tabelas no banco de dados
-Base.metadata.create_all(bind=engine)
+# O esquema é criado pelas migrações (alembic upgrade head): aqui só confere a revisão
+check_schema_version(engine)
+
+# Índice de busca de clientes (FTS5 no SQLite) e triggers do dashboard e da sincronização criados pelas migrações
+init_search_index(engine)
+init_dashboard_counters(engine)
+init_sync(engine)
+
+# Contagem de consultas SQL por requisição (GET /metrics)
+instrument_engine(engine)
+if async_engine is not None:
+    instrument_engine(async_engine.sync_engine)
 
 # Inicializa o app FastAPI
 app = FastAPI(
@@ -14,6 +33,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",  # Swagger UI
     redoc_url="/redoc",  # ReDoc
+    default_response_class=PydanticJSONResponse,  # JSON serializado pelo pydantic-core
 )
 
 # Configuração de CORS para permitir requisições do frontend
@@ -23,12 +43,31 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor", "X-Total-Count", "ETag"],  # Paginação por cursor e ETags
 )
 
+# Compressão Brotli/GZip das respostas (exceto pequenas e tipos já comprimidos, como PDF)
+app.add_middleware(CompressionMiddleware)
+
+# Métricas por rota (adicionado por último: mede também a compressão)
+app.add_middleware(MetricsMiddleware)
+
 # Registra os routers
 app.include_router(auth_router)
 app.include_router(clients_router)
 app.include_router(reports_router)
+app.include_router(templates_router)
+app.include_router(sync_router)
+app.include_router(metrics_router)
+
+
+@app.on_event("shutdown")
+def shutdown():
+    """
+    Encerra os pools de processos/threads (geração de PDF e bcrypt)
+    """
+    shutdown_pdf_workers()
+    shutdown_bcrypt_executor()
 
 
 @app.get("/", tags=["Root"])
@@ -0,0 +1,254 @@
+"""
+Métricas da aplicação no formato texto do Prometheus (GET /metrics)
+
+- latência e total de requisições por rota (MetricsMiddleware)
+- consultas SQL e tempo no banco por requisição (eventos do engine)
+- duração da renderização dos PDFs (na requisição ou nos processos da fila)
+- ocupação do threadpool e estatísticas dos caches (lidas na hora da coleta)
+
+Implementação própria e pequena (contadores e histogramas com rótulos), sem
+depender do prometheus_client; os valores são por processo.
+
+GET /metrics só responde com METRICS_TOKEN configurado, e exige o token no
+cabeçalho Authorization: Bearer (sem o token o endpoint fica desligado, 404).
+"""
+import os
+import threading
+import time
+from bisect import bisect_left
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# Token exigido por GET /metrics (vazio: endpoint desligado)
+METRICS_TOKEN = os.getenv("METRICS_TOKEN", "")
+
+# Tipo de conteúdo da exposição em texto do Prometheus
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_BUCKETS = (0, 1, 2, 3, 5, 10, 20, 50, 100, 250)
+PDF_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    if not names:
+        return ""
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}"
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Counter:
+    """Contador crescente com rótulos"""
+
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels):
+        key = tuple(str(labels[name]) for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        for key, value in values:
+            yield f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+
+
+class Histogram:
+    """Histograma com buckets cumulativos, soma e contagem por combinação de rótulos"""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 buckets: Sequence[float] = LATENCY_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        # rótulos -> (contagem por bucket, soma, total)
+        self._values: Dict[Tuple[str, ...], list] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels):
+        key = tuple(str(labels[name]) for name in self.labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [[0] * len(self.buckets), 0.0, 0]
+            if index < len(self.buckets):
+                entry[0][index] += 1
+            entry[1] += value
+            entry[2] += 1
+
+    def samples(self) -> Iterator[str]:
+        with self._lock:
+            values = sorted((key, ([*entry[0]], entry[1], entry[2])) for key, entry in self._values.items())
+        names = self.labels + ("le",)
+        for key, (counts, total_sum, total) in values:
+            cumulative = 0
+            for bound, count in zip(self.buckets, counts):
+                cumulative += count
+                yield f"{self.name}_bucket{_format_labels(names, key + (_format_value(bound),))} {cumulative}"
+            yield f"{self.name}_bucket{_format_labels(names, key + ('+Inf',))} {total}"
+            yield f"{self.name}_sum{_format_labels(self.labels, key)} {_format_value(total_sum)}"
+            yield f"{self.name}_count{_format_labels(self.labels, key)} {total}"
+
+
+class Gauge:
+    """
+    Valores lidos na hora da coleta: a função devolve [(valores dos rótulos, valor)]
+    Com kind="counter" expõe contadores mantidos fora daqui (ex.: acertos de um cache)
+    """
+
+    def __init__(self, name: str, documentation: str, labels: Sequence[str] = (),
+                 collect: Callable[[], List[Tuple[Sequence[str], float]]] = list, kind: str = "gauge"):
+        self.name = name
+        self.kind = kind
+        self.documentation = documentation
+        self.labels = tuple(labels)
+        self.collect = collect
+
+    def samples(self) -> Iterator[str]:
+        for key, value in self.collect():
+            yield f"{self.name}{_format_labels(self.labels, key)} {_format_value(value)}"
+
+
+_registry: List = []
+
+
+def register(metric):
+    """Inclui a métrica na exposição de GET /metrics"""
+    _registry.append(metric)
+    return metric
+
+
+def render_metrics(extra: Sequence = ()) -> str:
+    """Todas as métricas registradas (e as extras) no formato texto do Prometheus"""
+    lines = []
+    for metric in [*_registry, *extra]:
+        lines.append(f"# HELP {metric.name} {metric.documentation}")
+        lines.append(f"# TYPE {metric.name} {metric.kind}")
+        lines.extend(metric.samples())
+    return "\n".join(lines) + "\n"
+
+
+# ===== Métricas da aplicação =====
+
+REQUEST_LATENCY = register(Histogram(
+    "bpa_http_request_duration_seconds", "Latência das requisições por rota", ("method", "route"),
+))
+REQUESTS = register(Counter(
+    "bpa_http_requests_total", "Requisições por rota e status", ("method", "route", "status"),
+))
+REQUEST_QUERIES = register(Histogram(
+    "bpa_db_queries_per_request", "Consultas SQL por requisição", ("method", "route"), QUERY_BUCKETS,
+))
+REQUEST_DB_TIME = register(Histogram(
+    "bpa_db_time_per_request_seconds", "Tempo gasto no banco por requisição", ("method", "route"),
+))
+QUERIES = register(Counter(
+    "bpa_db_queries_total", "Consultas SQL executadas (inclusive fora de requisições)",
+))
+PDF_RENDER = register(Histogram(
+    "bpa_pdf_render_duration_seconds", "Duração da geração dos PDFs (generate_report_pdf)", ("modo",), PDF_BUCKETS,
+))
+PDF_CACHE = register(Counter(
+    "bpa_pdf_cache_requests_total", "Consultas ao cache em disco dos PDFs", ("resultado",),
+))
+
+
+# ===== Consultas por requisição =====
+
+class RequestStats:
+    """Consultas e tempo no banco da requisição atual"""
+
+    __slots__ = ("queries", "db_seconds")
+
+    def __init__(self):
+        self.queries = 0
+        self.db_seconds = 0.0
+
+
+# Propagada para o threadpool (run_in_threadpool copia o contexto)
+_request_stats: ContextVar[Optional[RequestStats]] = ContextVar("request_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start"].pop()
+    QUERIES.inc()
+    stats = _request_stats.get()
+    if stats is not None:
+        stats.queries += 1
+        stats.db_seconds += elapsed
+
+
+def instrument_engine(engine: Engine):
+    """Conta as consultas e o tempo de cada uma (para o engine assíncrono, passe engine.sync_engine)"""
+    if event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        return
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+
+
+# ===== Middleware =====
+
+class MetricsMiddleware:
+    """Mede latência, status e consultas SQL de cada requisição HTTP, pela rota (não pelo caminho)"""
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        status_code = 500
+        inicio = time.perf_counter()
+
+        async def send_wrapper(message: Message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            elapsed = time.perf_counter() - inicio
+            _request_stats.reset(token)
+            # O roteamento do FastAPI grava a rota encontrada no scope; sem rota, não usa o caminho
+            # (cada ID viraria uma série nova)
+            route = scope.get("route")
+            labels = {"method": scope["method"], "route": getattr(route, "path", "<sem rota>")}
+            REQUEST_LATENCY.observe(elapsed, **labels)
+            REQUESTS.inc(status=status_code, **labels)
+            REQUEST_QUERIES.observe(stats.queries, **labels)
+            REQUEST_DB_TIME.observe(stats.db_seconds, **labels)
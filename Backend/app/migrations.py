@@ -0,0 +1,78 @@
+"""
+Versão do esquema do banco (Alembic)
+
+As tabelas, índices e triggers são criados pelas migrações em alembic/versions.
+A aplicação não cria nem altera o esquema: na inicialização só confere se o banco
+está na última revisão.
+"""
+import os
+
+from alembic import command
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import Engine
+
+ALEMBIC_INI = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "alembic.ini")
+
+# Última revisão do esquema criado por create_all + migrate_database.py (antes do Alembic)
+LEGACY_REVISION = "0006"
+
+
+class SchemaVersionError(RuntimeError):
+    """Banco fora da revisão esperada pela aplicação"""
+
+
+def alembic_config(connection=None) -> Config:
+    """Configuração do Alembic; com connection, as migrações usam essa conexão"""
+    config = Config(ALEMBIC_INI)
+    if connection is not None:
+        config.attributes["connection"] = connection
+        config.attributes["configure_logger"] = False
+    return config
+
+
+def head_revision() -> str:
+    """Última revisão entre as migrações do projeto"""
+    return ScriptDirectory.from_config(alembic_config()).get_current_head()
+
+
+def revision_module(revision: str):
+    """
+    Módulo de uma revisão, com o SQL congelado dos seus triggers
+    (usado por migrate_database.py e pelos benchmarks)
+    """
+    return ScriptDirectory.from_config(alembic_config()).get_revision(revision).module
+
+
+def current_revision(engine: Engine):
+    """Revisão gravada no banco (None se as migrações nunca rodaram)"""
+    with engine.connect() as conn:
+        return MigrationContext.configure(conn).get_current_revision()
+
+
+def upgrade_database(engine: Engine, revision: str = "head"):
+    """Aplica as migrações pendentes (equivale a `alembic upgrade head`)"""
+    with engine.begin() as conn:
+        command.upgrade(alembic_config(conn), revision)
+
+
+def stamp_database(engine: Engine, revision: str):
+    """Grava a revisão sem executar migrações (bancos criados antes do Alembic)"""
+    with engine.begin() as conn:
+        command.stamp(alembic_config(conn), revision)
+
+
+def check_schema_version(engine: Engine):
+    """
+    Confere se o banco está na última revisão (chamado na inicialização da aplicação)
+    Uma única leitura de alembic_version; não reflete nem cria tabelas
+    """
+    atual = current_revision(engine)
+    esperada = head_revision()
+    if atual != esperada:
+        raise SchemaVersionError(
+            f"Banco de dados na revisão {atual or 'nenhuma'}, a aplicação espera {esperada}. "
+            "Execute `alembic upgrade head` (ou `python migrate_database.py` para bancos "
+            "criados antes das migrações) na pasta Backend/."
+        )
@@ -1,6 +1,11 @@
 from app.models.user import User, UserRole
 from app.models.client import Client, ClientResponsible, ClientCollaborators, ClientStatus, ClientCategory, ResponsibleType
-from app.models.report import Report, ChecklistCategory, ChecklistItem, ReportStatus, ChecklistResponse
+from app.models.report import (
+    Report, ChecklistCategory, ChecklistItem, ReportStatus, ChecklistResponse, PdfJobStatus, PdfBatchFormat,
+)
+from app.models.template import ChecklistTemplate, ChecklistTemplateCategory, ChecklistTemplateItem
+from app.models.dashboard import DashboardCounter
+from app.models.sync import SyncChange
 
 __all__ = [
     "User",
@@ -15,5 +20,12 @@ __all__ = [
     "ChecklistCategory",
     "ChecklistItem",
     "ReportStatus",
+    "PdfJobStatus",
+    "PdfBatchFormat",
     "ChecklistResponse",
+    "ChecklistTemplate",
+    "ChecklistTemplateCategory",
+    "ChecklistTemplateItem",
+    "DashboardCounter",
+    "SyncChange",
 ]
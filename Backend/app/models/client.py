@@ -1,7 +1,8 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, ForeignKey
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, ForeignKey, Index
+from sqlalchemy.orm import relationship, validates
 from sqlalchemy.sql import func
 from app.database import Base
+from app.text_utils import normalize_text, only_digits
 import enum
 
 
@@ -26,6 +27,10 @@ class Client(Base):
     Tabela de clientes (estabelecimentos)
     """
     __tablename__ = "clients"
+    __table_args__ = (
+        # Paginação por cursor (criado_em, id)
+        Index("idx_clients_criado_em_id", "criado_em", "id"),
+    )
 
     # Campos obrigatórios
     id = Column(Integer, primary_key=True, index=True)
@@ -51,6 +56,10 @@ class Client(Base):
     cep = Column(String(10), nullable=True)
     logo_url = Column(String(500), nullable=True)
 
+    # Colunas de busca (preenchidas automaticamente)
+    nome_busca = Column(String(255), nullable=True)  # Nome sem acentos e em minúsculas
+    cnpj_digitos = Column(String(14), nullable=True, index=True)  # CNPJ somente com dígitos
+
     # Timestamps
     criado_em = Column(DateTime(timezone=True), server_default=func.now())
     atualizado_em = Column(DateTime(timezone=True), onupdate=func.now())
@@ -60,6 +69,16 @@ class Client(Base):
     colaboradores_info = relationship("ClientCollaborators", back_populates="cliente", uselist=False, cascade="all, delete-orphan")
     relatorios = relationship("Report", back_populates="cliente", cascade="all, delete-orphan")
 
+    @validates("nome_fantasia")
+    def _sync_nome_busca(self, key, value):
+        self.nome_busca = normalize_text(value)
+        return value
+
+    @validates("cnpj")
+    def _sync_cnpj_digitos(self, key, value):
+        self.cnpj_digitos = only_digits(value)
+        return value
+
 
 class ResponsibleType(str, enum.Enum):
     """Enum para tipo de responsável"""
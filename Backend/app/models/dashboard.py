@@ -0,0 +1,16 @@
+from sqlalchemy import Column, Integer, String
+from app.database import Base
+
+
+class DashboardCounter(Base):
+    """
+    Contadores pré-agregados do dashboard
+    Cada linha é o total de uma chave dentro de uma dimensão
+    Ex: ("relatorios_status", "CONCLUIDO") -> 42
+    Mantidos por triggers no banco (ver app/dashboard.py)
+    """
+    __tablename__ = "dashboard_counters"
+
+    dimensao = Column(String(40), primary_key=True)
+    chave = Column(String(100), primary_key=True)
+    total = Column(Integer, nullable=False, default=0)
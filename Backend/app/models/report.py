@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, ForeignKey, Text
+from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, ForeignKey, Text, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -11,11 +11,34 @@ class ReportStatus(str, enum.Enum):
     CONCLUIDO = "concluido"
 
 
+class PdfJobStatus(str, enum.Enum):
+    """Enum para status do job de PDF"""
+    PENDENTE = "pendente"
+    PROCESSANDO = "processando"
+    CONCLUIDO = "concluido"
+    ERRO = "erro"
+
+
+class PdfBatchFormat(str, enum.Enum):
+    """Enum para formato do lote de PDFs"""
+    ZIP = "zip"
+    PDF = "pdf"
+
+
 class Report(Base):
     """
     Tabela de relatórios de inspeção
     """
     __tablename__ = "reports"
+    __table_args__ = (
+        # Paginação por cursor (criado_em, id)
+        Index("idx_reports_criado_em_id", "criado_em", "id"),
+        # Listagem filtrada por cliente ou status, na ordem da paginação
+        Index("idx_reports_cliente_criado_em_id", "cliente_id", "criado_em", "id"),
+        Index("idx_reports_status_criado_em_id", "status", "criado_em", "id"),
+        # Agenda (intervalo de datas)
+        Index("idx_reports_data_agendada", "data_agendada"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     descricao = Column(String(255), nullable=False)
@@ -31,7 +54,12 @@ class Report(Base):
     # Relacionamentos
     cliente = relationship("Client", back_populates="relatorios")
     responsavel = relationship("User")
-    categorias = relationship("ChecklistCategory", back_populates="relatorio", cascade="all, delete-orphan")
+    categorias = relationship(
+        "ChecklistCategory",
+        back_populates="relatorio",
+        cascade="all, delete-orphan",
+        order_by="ChecklistCategory.ordem",
+    )
 
 
 class ChecklistCategory(Base):
@@ -40,6 +68,10 @@ class ChecklistCategory(Base):
     Ex: "Edificação, Isntações e Transporte", "Preparação do Alimento"
     """
     __tablename__ = "checklist_categories"
+    __table_args__ = (
+        # Categorias de um relatório, já na ordem de exibição
+        Index("idx_checklist_categories_relatorio_ordem", "relatorio_id", "ordem"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     relatorio_id = Column(Integer, ForeignKey("reports.id"), nullable=False)
@@ -48,7 +80,12 @@ class ChecklistCategory(Base):
 
     # Relacionamentos
     relatorio = relationship("Report", back_populates="categorias")
-    itens = relationship("ChecklistItem", back_populates="categoria", cascade="all, delete-orphan")
+    itens = relationship(
+        "ChecklistItem",
+        back_populates="categoria",
+        cascade="all, delete-orphan",
+        order_by="ChecklistItem.ordem",
+    )
 
 
 class ChecklistResponse(str, enum.Enum):
@@ -63,14 +100,27 @@ class ChecklistItem(Base):
     Itens individuais do checklist
     """
     __tablename__ = "checklist_items"
+    __table_args__ = (
+        # Itens de uma categoria, já na ordem de exibição
+        Index("idx_checklist_items_categoria_ordem", "categoria_id", "ordem"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     categoria_id = Column(Integer, ForeignKey("checklist_categories.id"), nullable=False)
+    template_item_id = Column(Integer, ForeignKey("checklist_template_items.id"), nullable=True)
     codigo = Column(String(20), nullable=False)  # Ex: "1.1.1"
-    descricao = Column(Text, nullable=False)
+    descricao = Column(Text, nullable=True)  # Vazio quando o texto vem do template
     resposta = Column(SQLEnum(ChecklistResponse), nullable=True)
     observacoes = Column(Text, nullable=True)
     ordem = Column(Integer, nullable=False)
 
-    # Relacionamento
+    # Relacionamentos
     categoria = relationship("ChecklistCategory", back_populates="itens")
+    template_item = relationship("ChecklistTemplateItem")
+
+    @property
+    def descricao_resolvida(self) -> str:
+        """Descrição do item, buscando no template quando não foi copiada"""
+        if self.descricao is not None:
+            return self.descricao
+        return self.template_item.descricao if self.template_item else ""
@@ -0,0 +1,25 @@
+from sqlalchemy import Column, Integer, String, Boolean, Index
+from app.database import Base
+
+
+class SyncChange(Base):
+    """
+    Registro de alterações para a sincronização incremental dos tablets
+    Uma linha por registro com a sua última alteração: `versao` cresce a cada escrita
+    (AUTOINCREMENT, nunca reutilizada), então "alterados desde a versão N" é um
+    intervalo da chave primária. Exclusões ficam registradas com excluido = True
+    Mantido por triggers no banco (ver app/sync.py)
+    """
+    __tablename__ = "sync_changes"
+    __table_args__ = (
+        Index("idx_sync_changes_registro", "tabela", "registro_id", unique=True),
+        # Sincronização de um único relatório
+        Index("idx_sync_changes_relatorio_versao", "relatorio_id", "versao"),
+        {"sqlite_autoincrement": True},
+    )
+
+    versao = Column(Integer, primary_key=True, autoincrement=True)
+    tabela = Column(String(20), nullable=False)  # "relatorios", "categorias" ou "itens"
+    registro_id = Column(Integer, nullable=False)
+    relatorio_id = Column(Integer, nullable=True)
+    excluido = Column(Boolean, nullable=False, default=False)
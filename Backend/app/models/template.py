@@ -0,0 +1,69 @@
+from sqlalchemy import Column, Integer, String, DateTime, Boolean, ForeignKey, Text, UniqueConstraint
+from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
+from app.database import Base
+
+
+class ChecklistTemplate(Base):
+    """
+    Tabela de templates (modelos) de checklist versionados
+    Ex: "RDC 216" versão 1, versão 2...
+    """
+    __tablename__ = "checklist_templates"
+    __table_args__ = (
+        UniqueConstraint("nome", "versao", name="uq_checklist_templates_nome_versao"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    nome = Column(String(255), nullable=False, index=True)
+    versao = Column(Integer, nullable=False, default=1)
+    descricao = Column(String(255), nullable=True)
+    ativo = Column(Boolean, nullable=False, default=True)
+
+    criado_em = Column(DateTime(timezone=True), server_default=func.now())
+
+    # Relacionamentos
+    categorias = relationship(
+        "ChecklistTemplateCategory",
+        back_populates="template",
+        cascade="all, delete-orphan",
+        order_by="ChecklistTemplateCategory.ordem",
+    )
+
+
+class ChecklistTemplateCategory(Base):
+    """
+    Categorias de um template de checklist
+    """
+    __tablename__ = "checklist_template_categories"
+
+    id = Column(Integer, primary_key=True, index=True)
+    template_id = Column(Integer, ForeignKey("checklist_templates.id"), nullable=False, index=True)
+    nome = Column(String(255), nullable=False)
+    ordem = Column(Integer, nullable=False)
+
+    # Relacionamentos
+    template = relationship("ChecklistTemplate", back_populates="categorias")
+    itens = relationship(
+        "ChecklistTemplateItem",
+        back_populates="categoria",
+        cascade="all, delete-orphan",
+        order_by="ChecklistTemplateItem.ordem",
+    )
+
+
+class ChecklistTemplateItem(Base):
+    """
+    Itens de um template de checklist
+    O texto fica somente aqui; os itens dos relatórios apenas referenciam esta linha
+    """
+    __tablename__ = "checklist_template_items"
+
+    id = Column(Integer, primary_key=True, index=True)
+    categoria_id = Column(Integer, ForeignKey("checklist_template_categories.id"), nullable=False, index=True)
+    codigo = Column(String(20), nullable=False)  # Ex: "1.1.1"
+    descricao = Column(Text, nullable=False)
+    ordem = Column(Integer, nullable=False)
+
+    # Relacionamento
+    categoria = relationship("ChecklistTemplateCategory", back_populates="itens")
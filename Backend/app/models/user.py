@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, ForeignKey
+from sqlalchemy import Column, Integer, String, DateTime, Enum as SQLEnum, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from app.database import Base
@@ -17,6 +17,10 @@ class User(Base):
     Tabela de usuários do sistema
     """
     __tablename__ = "users"
+    __table_args__ = (
+        # Hierarquia (subordinados de um chefe)
+        Index("idx_users_superior_id", "superior_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     nome = Column(String(255), nullable=False)
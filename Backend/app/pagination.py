@@ -0,0 +1,80 @@
+"""
+Paginação por cursor (keyset) para as listagens
+
+As páginas são ordenadas por (criado_em, id) decrescente. O cursor é opaco para o
+cliente e carrega apenas o ID da última linha da página; o criado_em correspondente
+é lido do próprio banco, evitando diferenças de formato entre o valor gravado pelo
+banco e o valor enviado como parâmetro.
+"""
+import base64
+import json
+from typing import Optional
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Query
+
+# Cabeçalhos de resposta usados pela paginação
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+
+
+def encode_cursor(last_id: int) -> str:
+    """Gera o cursor opaco a partir do ID da última linha da página"""
+    payload = json.dumps({"id": last_id}, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Lê o ID contido no cursor"""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        return int(json.loads(base64.urlsafe_b64decode(padded))["id"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cursor inválido"
+        )
+
+
+def _after_cursor(query: Query, model, cursor_id: int):
+    """Condição para as linhas que vêm depois do cursor na ordem (criado_em, id) decrescente"""
+    if query.session.query(model.id).filter(model.id == cursor_id).first() is None:
+        # A linha do cursor foi removida: os IDs seguem a ordem de criação
+        return model.id < cursor_id
+
+    # Comparação de row values: usa o índice (criado_em, id) como intervalo
+    cursor_criado_em = select(model.criado_em).where(model.id == cursor_id).scalar_subquery()
+    return tuple_(model.criado_em, model.id) < tuple_(cursor_criado_em, cursor_id)
+
+
+def paginate(
+    query: Query,
+    model,
+    response: Response,
+    limit: int,
+    cursor: Optional[str] = None,
+    skip: int = 0,
+    incluir_total: bool = False,
+) -> list:
+    """
+    Aplica ordenação determinística e paginação à query
+    O próximo cursor vai no cabeçalho X-Next-Cursor e, se pedido, o total em X-Total-Count
+    """
+    if incluir_total:
+        response.headers[TOTAL_COUNT_HEADER] = str(query.order_by(None).count())
+
+    query = query.order_by(model.criado_em.desc(), model.id.desc())
+
+    if cursor:
+        query = query.filter(_after_cursor(query, model, decode_cursor(cursor)))
+    elif skip:
+        query = query.offset(skip)
+
+    # Busca uma linha a mais para saber se existe próxima página
+    rows = query.limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(rows[-1].id)
+
+    return rows
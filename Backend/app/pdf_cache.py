@@ -0,0 +1,139 @@
+"""
+Cache em disco dos PDFs gerados
+
+Cada arquivo é identificado pelo ID do relatório e por um hash do conteúdo
+(relatório, cliente, responsável, categorias e itens). Qualquer alteração nos
+dados gera um hash novo, então um PDF desatualizado nunca é servido. O tamanho
+total é limitado e os arquivos menos usados recentemente são removidos primeiro.
+"""
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from typing import Optional
+
+from dotenv import load_dotenv
+
+from app.models.report import Report
+from app.metrics import PDF_CACHE
+
+load_dotenv()
+
+# Configurações do cache
+PDF_CACHE_DIR = os.getenv("PDF_CACHE_DIR", "./pdf_cache")
+PDF_CACHE_MAX_MB = int(os.getenv("PDF_CACHE_MAX_MB", "200"))
+
+_lock = threading.Lock()
+
+
+def report_content_hash(report: Report) -> str:
+    """
+    Calcula o hash do conteúdo que aparece no PDF
+    Espera o relatório carregado com get_report_tree
+    """
+    content = {
+        "relatorio": [
+            report.id,
+            report.descricao,
+            report.categoria,
+            report.status.value,
+            report.criado_em,
+            report.finalizado_em,
+        ],
+        "cliente": [report.cliente.nome_fantasia, report.cliente.cnpj] if report.cliente else None,
+        "responsavel": report.responsavel.nome if report.responsavel else None,
+        "categorias": [
+            [
+                categoria.id,
+                categoria.nome,
+                categoria.ordem,
+                [
+                    [
+                        item.id,
+                        item.codigo,
+                        item.descricao_resolvida,
+                        item.resposta.value if item.resposta else None,
+                        item.observacoes,
+                        item.ordem,
+                    ]
+                    for item in categoria.itens
+                ],
+            ]
+            for categoria in report.categorias
+        ],
+    }
+    serialized = json.dumps(content, default=str, ensure_ascii=False, separators=(",", ":"))
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def _cache_path(report_id: int, content_hash: str) -> str:
+    return os.path.join(PDF_CACHE_DIR, f"{report_id}_{content_hash}.pdf")
+
+
+def get_cached_pdf(report_id: int, content_hash: str) -> Optional[bytes]:
+    """Retorna o PDF em cache (ou None) e marca o arquivo como usado recentemente"""
+    path = _cache_path(report_id, content_hash)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+        os.utime(path)
+    except OSError:
+        PDF_CACHE.inc(resultado="miss")
+        return None
+    PDF_CACHE.inc(resultado="hit")
+    return data
+
+
+def store_pdf(report_id: int, content_hash: str, data: bytes):
+    """Grava o PDF no cache e remove os arquivos mais antigos se passar do limite"""
+    with _lock:
+        os.makedirs(PDF_CACHE_DIR, exist_ok=True)
+        
+        # Remove versões anteriores deste relatório
+        _remove_report_files(report_id)
+        
+        # Escrita atômica: arquivo temporário + rename
+        fd, tmp_path = tempfile.mkstemp(dir=PDF_CACHE_DIR, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, _cache_path(report_id, content_hash))
+        
+        _evict()
+
+
+def invalidate_report_pdf(report_id: int):
+    """Remove do cache os PDFs de um relatório"""
+    with _lock:
+        _remove_report_files(report_id)
+
+
+def _remove_report_files(report_id: int):
+    for path in glob.glob(os.path.join(PDF_CACHE_DIR, f"{report_id}_*.pdf")):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+
+def _evict():
+    """Remove os arquivos menos usados recentemente até caber em PDF_CACHE_MAX_MB"""
+    entries = []
+    for path in glob.glob(os.path.join(PDF_CACHE_DIR, "*.pdf")):
+        try:
+            stat = os.stat(path)
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    
+    total = sum(size for _, size, _ in entries)
+    limite = PDF_CACHE_MAX_MB * 1024 * 1024
+    for _, size, path in sorted(entries):
+        if total <= limite:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            pass
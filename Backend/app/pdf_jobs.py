@@ -0,0 +1,298 @@
+"""
+Fila de geração de PDFs em processos separados
+
+A renderização com ReportLab é CPU pura e bloqueia o worker da API; aqui ela roda
+em um ProcessPoolExecutor. Os jobs ficam em memória no processo da API, portanto
+com vários workers do uvicorn cada um tem sua própria fila.
+
+Jobs em lote (vários relatórios) recebem os relatórios já carregados pela API em
+uma única consulta e distribuem um relatório por tarefa entre os processos; o
+resultado é um ZIP ou um único PDF com um marcador por relatório.
+"""
+import io
+import os
+import threading
+import uuid
+import zipfile
+from concurrent.futures import Future, ProcessPoolExecutor
+from datetime import datetime, timedelta
+from functools import partial
+from typing import Dict, Iterator, List, Optional
+
+from dotenv import load_dotenv
+from pypdf import PdfWriter
+
+from app.export import ChunkSink
+from app.models.report import Report, ReportStatus, PdfJobStatus, PdfBatchFormat
+from app.pdf_cache import report_content_hash, get_cached_pdf, store_pdf
+from app.metrics import PDF_RENDER
+
+load_dotenv()
+
+# Configurações da fila
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", "2"))
+PDF_JOB_TTL_MINUTES = int(os.getenv("PDF_JOB_TTL_MINUTES", "30"))
+PDF_BATCH_MAX_REPORTS = int(os.getenv("PDF_BATCH_MAX_REPORTS", "500"))
+
+
+class PdfJob:
+    """
+    Job de geração de PDF de um relatório
+    """
+
+    def __init__(self, report_id: int, future: Future):
+        self.id = uuid.uuid4().hex
+        self.report_id = report_id
+        self.future = future
+        self.criado_em = datetime.utcnow()
+
+    @property
+    def status(self) -> PdfJobStatus:
+        if not self.future.done():
+            return PdfJobStatus.PROCESSANDO if self.future.running() else PdfJobStatus.PENDENTE
+        if self.future.cancelled() or self.future.exception() is not None:
+            return PdfJobStatus.ERRO
+        return PdfJobStatus.CONCLUIDO
+
+    @property
+    def erro(self) -> Optional[str]:
+        if self.status != PdfJobStatus.ERRO:
+            return None
+        if self.future.cancelled():
+            return "Job cancelado"
+        return str(self.future.exception()) or "Falha ao gerar o PDF"
+
+    @property
+    def pdf(self) -> Optional[bytes]:
+        return self.future.result() if self.status == PdfJobStatus.CONCLUIDO else None
+
+
+class PdfBatchPart:
+    """PDF de um relatório dentro do lote"""
+
+    def __init__(self, report: Report, future: Future):
+        self.report_id = report.id
+        self.titulo = f"Relatório {report.id} - {report.descricao}"
+        self.future = future
+
+    @property
+    def filename(self) -> str:
+        return f"relatorio_{self.report_id}.pdf"
+
+
+class PdfBatchJob:
+    """
+    Job de geração dos PDFs de vários relatórios
+    Um future por relatório: o progresso é a quantidade de futures finalizados
+    """
+
+    def __init__(self, formato: PdfBatchFormat, parts: List[PdfBatchPart]):
+        self.id = uuid.uuid4().hex
+        self.formato = formato
+        self.parts = parts
+        self.criado_em = datetime.utcnow()
+
+    @property
+    def report_ids(self) -> List[int]:
+        return [part.report_id for part in self.parts]
+
+    @property
+    def total(self) -> int:
+        return len(self.parts)
+
+    @property
+    def concluidos(self) -> int:
+        return sum(1 for part in self.parts if part.future.done())
+
+    @property
+    def done(self) -> bool:
+        return all(part.future.done() for part in self.parts)
+
+    def _failed(self) -> Optional[PdfBatchPart]:
+        for part in self.parts:
+            if part.future.done() and (part.future.cancelled() or part.future.exception() is not None):
+                return part
+        return None
+
+    @property
+    def status(self) -> PdfJobStatus:
+        if self._failed() is not None:
+            return PdfJobStatus.ERRO
+        if self.done:
+            return PdfJobStatus.CONCLUIDO
+        if any(part.future.running() or part.future.done() for part in self.parts):
+            return PdfJobStatus.PROCESSANDO
+        return PdfJobStatus.PENDENTE
+
+    @property
+    def erro(self) -> Optional[str]:
+        part = self._failed()
+        if part is None:
+            return None
+        if part.future.cancelled():
+            return "Job cancelado"
+        return str(part.future.exception()) or f"Falha ao gerar o PDF do relatório {part.report_id}"
+
+
+def _init_worker():
+    """Descarta as conexões herdadas do processo pai (fork)"""
+    from app.database import engine
+    engine.dispose(close=False)
+
+
+def render_report_pdf(report_id: int) -> bytes:
+    """
+    Executado no processo worker: carrega o relatório e gera o PDF
+    """
+    from app.database import SessionLocal
+    from app.pdf_generator import render_pdf_bytes
+    from app.routers.reports import get_report_tree
+
+    db = SessionLocal()
+    try:
+        report = get_report_tree(db, report_id)
+        return render_pdf_bytes(report)
+    except Exception as exc:
+        # Exceções do FastAPI/SQLAlchemy nem sempre são serializáveis entre processos
+        raise RuntimeError(f"Falha ao gerar o PDF do relatório {report_id}: {exc}") from None
+    finally:
+        db.close()
+
+
+def render_loaded_report_pdf(report: Report) -> bytes:
+    """
+    Executado no processo worker: gera o PDF de um relatório já carregado
+    (recebido serializado com a árvore do checklist, sem acessar o banco)
+    """
+    from app.pdf_generator import render_pdf_bytes
+
+    try:
+        return render_pdf_bytes(report)
+    except Exception as exc:
+        raise RuntimeError(f"Falha ao gerar o PDF do relatório {report.id}: {exc}") from None
+
+
+_executor: Optional[ProcessPoolExecutor] = None
+_jobs: Dict[str, PdfJob] = {}
+_batch_jobs: Dict[str, PdfBatchJob] = {}
+_lock = threading.Lock()
+
+
+def _get_executor() -> ProcessPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ProcessPoolExecutor(max_workers=PDF_WORKERS, initializer=_init_worker)
+    return _executor
+
+
+def _purge_expired_jobs():
+    """Remove da memória os jobs finalizados há mais de PDF_JOB_TTL_MINUTES"""
+    limite = datetime.utcnow() - timedelta(minutes=PDF_JOB_TTL_MINUTES)
+    for job_id in [job_id for job_id, job in _jobs.items() if job.future.done() and job.criado_em < limite]:
+        del _jobs[job_id]
+    for job_id in [job_id for job_id, job in _batch_jobs.items() if job.done and job.criado_em < limite]:
+        del _batch_jobs[job_id]
+
+
+def _observe_render(future: Future):
+    """Registra nas métricas o tempo de renderização medido no processo worker"""
+    if not future.cancelled() and future.exception() is None:
+        PDF_RENDER.observe(getattr(future.result(), "segundos", 0.0), modo="processo")
+
+
+def submit_pdf_job(report_id: int) -> PdfJob:
+    """Enfileira a geração do PDF de um relatório"""
+    with _lock:
+        _purge_expired_jobs()
+        future = _get_executor().submit(render_report_pdf, report_id)
+        future.add_done_callback(_observe_render)
+        job = PdfJob(report_id, future)
+        _jobs[job.id] = job
+    return job
+
+
+def pending_pdf_renders() -> int:
+    """PDFs enfileirados ou em renderização (jobs avulsos e em lote)"""
+    with _lock:
+        pending = sum(1 for job in _jobs.values() if not job.future.done())
+        pending += sum(1 for job in _batch_jobs.values() for part in job.parts if not part.future.done())
+    return pending
+
+
+def get_pdf_job(job_id: str) -> Optional[PdfJob]:
+    """Busca um job pelo ID"""
+    with _lock:
+        return _jobs.get(job_id)
+
+
+def _store_rendered_pdf(report_id: int, content_hash: str, future: Future):
+    if not future.cancelled() and future.exception() is None:
+        store_pdf(report_id, content_hash, future.result())
+
+
+def submit_pdf_batch_job(reports: List[Report], formato: PdfBatchFormat) -> PdfBatchJob:
+    """
+    Enfileira os PDFs de vários relatórios carregados com a árvore do checklist
+    PDFs de relatórios concluídos que já estão no cache em disco não são renderizados
+    de novo; os renderizados entram no cache ao terminar
+    """
+    parts = []
+    pending = []
+    for report in reports:
+        content_hash = report_content_hash(report)
+        cacheable = report.status == ReportStatus.CONCLUIDO
+        pdf_bytes = get_cached_pdf(report.id, content_hash) if cacheable else None
+        future = Future()
+        if pdf_bytes is not None:
+            future.set_result(pdf_bytes)
+        else:
+            pending.append((report, content_hash if cacheable else None, len(parts)))
+        parts.append(PdfBatchPart(report, future))
+
+    with _lock:
+        _purge_expired_jobs()
+        executor = _get_executor()
+        for report, content_hash, index in pending:
+            future = executor.submit(render_loaded_report_pdf, report)
+            future.add_done_callback(_observe_render)
+            if content_hash:
+                future.add_done_callback(partial(_store_rendered_pdf, report.id, content_hash))
+            parts[index].future = future
+        job = PdfBatchJob(formato, parts)
+        _batch_jobs[job.id] = job
+    return job
+
+
+def get_pdf_batch_job(job_id: str) -> Optional[PdfBatchJob]:
+    """Busca um job em lote pelo ID"""
+    with _lock:
+        return _batch_jobs.get(job_id)
+
+
+def stream_batch_zip(job: PdfBatchJob) -> Iterator[bytes]:
+    """ZIP com um PDF por relatório, enviado em streaming (os PDFs já são comprimidos)"""
+    sink = ChunkSink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_STORED) as archive:
+        for part in job.parts:
+            archive.writestr(part.filename, part.future.result())
+            yield sink.take()
+    yield sink.take()
+
+
+def merge_batch_pdf(job: PdfBatchJob) -> bytes:
+    """Um único PDF com os relatórios em sequência e um marcador para cada um"""
+    writer = PdfWriter()
+    for part in job.parts:
+        writer.append(io.BytesIO(part.future.result()), outline_item=part.titulo)
+    output = io.BytesIO()
+    writer.write(output)
+    return output.getvalue()
+
+
+def shutdown_pdf_workers():
+    """Encerra o pool de processos (chamado no shutdown da aplicação)"""
+    global _executor
+    with _lock:
+        if _executor is not None:
+            _executor.shutdown(wait=False, cancel_futures=True)
+            _executor = None
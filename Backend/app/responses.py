@@ -0,0 +1,32 @@
+"""
+Serialização das respostas JSON
+
+O FastAPI converte o retorno dos endpoints com o response_model (validação e
+conversão para dict/list) e depois o serializa com o json da biblioteca padrão.
+Aqui a serialização é feita pelo pydantic-core (Rust), que já é dependência do
+Pydantic: PydanticJSONResponse é a classe padrão da aplicação e model_response devolve
+direto um schema já validado (ex.: model_validate da árvore do ORM), sem a
+conversão do response_model.
+"""
+from typing import Any, Mapping, Optional
+
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSON serializado pelo pydantic-core (aceita schemas, listas de schemas, datas e enums)"""
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+def model_response(model: BaseModel, status_code: int = 200,
+                   headers: Optional[Mapping[str, str]] = None) -> PydanticJSONResponse:
+    """
+    Resposta a partir de um schema já validado
+    Como o endpoint devolve um Response, o FastAPI não valida nem converte o retorno
+    de novo pelo response_model (que continua valendo para a documentação)
+    """
+    return PydanticJSONResponse(model, status_code=status_code, headers=headers)
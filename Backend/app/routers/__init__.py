@@ -1,5 +1,8 @@
 from app.routers.auth import router as auth_router
 from app.routers.clients import router as clients_router
 from app.routers.reports import router as reports_router
+from app.routers.templates import router as templates_router
+from app.routers.sync import router as sync_router
+from app.routers.metrics import router as metrics_router
 
-__all__ = ["auth_router", "clients_router", "reports_router"]
+__all__ = ["auth_router", "clients_router", "reports_router", "templates_router", "sync_router", "metrics_router"]
@@ -1,32 +1,37 @@
 from datetime import timedelta
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status, Query
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import DbSession, get_session, run_db
 from app.models import User
-from app.schemas import UserCreate, UserResponse, UserLogin, UserUpdate, Token, UserSimplified
+from app.schemas import UserCreate, UserResponse, UserLogin, UserUpdate, Token, UserSimplified, DashboardStats
 from app.auth import (
-    get_password_hash,
-    verify_password,
+    get_password_hash_async,
+    verify_password_async,
     authenticate_user,
     create_access_token,
     ACCESS_TOKEN_EXPIRE_MINUTES,
     get_current_user,
+    invalidate_user_cache,
+    user_cache,
 )
-from app.models import Client, Report
+from app.dashboard import load_dashboard
 from typing import List
 
 router = APIRouter(prefix="/auth", tags=["Autenticação"])
 
 
 @router.post("/register", response_model=UserResponse, status_code=status.HTTP_201_CREATED)
-def register(user_data: UserCreate, db: Session = Depends(get_db)):
+async def register(user_data: UserCreate, db: DbSession = Depends(get_session)):
     """
     Registra um novo usuário no sistema
+    O hash da senha roda no executor do bcrypt; as queries, via run_db
     """
     # Verifica se o email já existe
-    existing_user = db.query(User).filter(User.email == user_data.email).first()
+    existing_user = await run_db(
+        db, lambda session: session.query(User).filter(User.email == user_data.email).first()
+    )
     if existing_user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -35,7 +40,9 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     
     # Verifica se o superior existe (se especificado)
     if user_data.superior_id:
-        superior = db.query(User).filter(User.id == user_data.superior_id).first()
+        superior = await run_db(
+            db, lambda session: session.query(User).filter(User.id == user_data.superior_id).first()
+        )
         if not superior:
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -46,25 +53,27 @@ def register(user_data: UserCreate, db: Session = Depends(get_db)):
     new_user = User(
         nome=user_data.nome,
         email=user_data.email,
-        senha_hash=get_password_hash(user_data.senha),
+        senha_hash=await get_password_hash_async(user_data.senha),
         role=user_data.role,
         superior_id=user_data.superior_id
     )
     
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
+    def save(session: Session):
+        session.add(new_user)
+        session.commit()
+        session.refresh(new_user)
+        return UserResponse.model_validate(new_user)
     
-    return new_user
+    return await run_db(db, save)
 
 
 @router.post("/login", response_model=Token)
-def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depends(get_db)):
+async def login(form_data: OAuth2PasswordRequestForm = Depends(), db: DbSession = Depends(get_session)):
     """
     Faz login e retorna um token JWT
     Usa OAuth2PasswordRequestForm para compatibilidade com Swagger
     """
-    user = authenticate_user(db, form_data.username, form_data.password)
+    user = await authenticate_user(db, form_data.username, form_data.password)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -74,19 +83,19 @@ def login(form_data: OAuth2PasswordRequestForm = Depends(), db: Session = Depend
     
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data={"sub": user.email, "uid": user.id}, expires_delta=access_token_expires
     )
     
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 @router.post("/login-json", response_model=Token)
-def login_json(user_data: UserLogin, db: Session = Depends(get_db)):
+async def login_json(user_data: UserLogin, db: DbSession = Depends(get_session)):
     """
     Alternativa de login que aceita JSON
     Útil para frontend
     """
-    user = authenticate_user(db, user_data.email, user_data.senha)
+    user = await authenticate_user(db, user_data.email, user_data.senha)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -96,20 +105,20 @@ def login_json(user_data: UserLogin, db: Session = Depends(get_db)):
     
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.email}, expires_delta=access_token_expires
+        data={"sub": user.email, "uid": user.id}, expires_delta=access_token_expires
     )
     
     return {"access_token": access_token, "token_type": "bearer"}
 
 
 @router.post("/forgot-password")
-def forgot_password(email: str, db: Session = Depends(get_db)):
+async def forgot_password(email: str, db: DbSession = Depends(get_session)):
     """
     Inicia o processo de recuperação de senha
     NOTA: Nesta versão simplificada, apenas retorna uma mensagem
     Em produção, você enviaria um email com link de recuperação
     """
-    user = db.query(User).filter(User.email == email).first()
+    user = await run_db(db, lambda session: session.query(User).filter(User.email == email).first())
     if not user:
         # Por segurança, não revela se o email existe ou não
         return {
@@ -133,14 +142,16 @@ def get_current_user_info(current_user: User = Depends(get_current_user)):
 
 
 @router.put("/me", response_model=UserResponse)
-def update_current_user(
+async def update_current_user(
     user_data: UserUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     Atualiza informações do usuário logado
     """
+    email_anterior = current_user.email
+    
     # Se está tentando trocar a senha
     if user_data.senha_nova:
         if not user_data.senha_atual:
@@ -150,22 +161,25 @@ def update_current_user(
             )
         
         # Verifica se a senha atual está correta
-        if not verify_password(user_data.senha_atual, current_user.senha_hash):
+        if not await verify_password_async(user_data.senha_atual, current_user.senha_hash):
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Senha atual incorreta"
             )
         
         # Atualiza a senha
-        current_user.senha_hash = get_password_hash(user_data.senha_nova)
+        current_user.senha_hash = await get_password_hash_async(user_data.senha_nova)
     
     # Se está tentando trocar o email
     if user_data.email and user_data.email != current_user.email:
         # Verifica se o email já existe
-        existing_user = db.query(User).filter(
-            User.email == user_data.email,
-            User.id != current_user.id
-        ).first()
+        existing_user = await run_db(
+            db,
+            lambda session: session.query(User).filter(
+                User.email == user_data.email,
+                User.id != current_user.id
+            ).first()
+        )
         if existing_user:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -177,53 +191,61 @@ def update_current_user(
     if user_data.nome:
         current_user.nome = user_data.nome
     
-    db.commit()
-    db.refresh(current_user)
+    def save(session: Session):
+        session.commit()
+        session.refresh(current_user)
+        return UserResponse.model_validate(current_user)
     
-    return current_user
+    user = await run_db(db, save)
+    
+    # O cache guarda email e hash da senha: descarta a versão antiga
+    invalidate_user_cache(email_anterior)
+    invalidate_user_cache(user.email)
+    
+    return user
 
 
-@router.get("/dashboard-stats")
-def get_dashboard_stats(
-    db: Session = Depends(get_db),
+@router.get("/cache-stats")
+def get_cache_stats(current_user: User = Depends(get_current_user)):
+    """
+    Retorna os contadores do cache de usuários autenticados
+    """
+    return {"users": user_cache.stats()}
+
+
+@router.get("/dashboard-stats", response_model=DashboardStats)
+async def get_dashboard_stats(
+    meses: int = Query(12, ge=1, le=120, description="Quantidade de meses em relatorios_por_mes"),
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     Retorna estatísticas para o dashboard
+    Lidas dos contadores pré-agregados: o custo não depende do volume de relatórios
     """
-    total_clients = db.query(Client).count()
-    total_reports = db.query(Report).count()
-    
-    return {
-        "user_name": current_user.nome,
-        "total_clients": total_clients,
-        "total_reports": total_reports
-    }
+    return await run_db(db, load_dashboard, current_user.nome, meses)
 
 
 @router.get("/users", response_model=List[UserSimplified])
-def list_all_users(
-    db: Session = Depends(get_db),
+async def list_all_users(
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     Lista todos os usuários do sistema
     """
-    users = db.query(User).all()
-    return users
+    return await run_db(db, lambda session: session.query(User).all())
 
 
 @router.get("/users/subordinados", response_model=List[UserSimplified])
-def list_subordinates(
-    db: Session = Depends(get_db),
+async def list_subordinates(
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     Lista os subordinados do usuário logado (incluindo ele mesmo)
     """
     # Busca todos os usuários que têm este usuário como superior, mais ele mesmo
-    subordinados = db.query(User).filter(
+    return await run_db(db, lambda session: session.query(User).filter(
         (User.superior_id == current_user.id) | (User.id == current_user.id)
-    ).all()
-    
-    return subordinados
+    ).all())
@@ -1,29 +1,28 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+import os
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response, UploadFile, File
 from sqlalchemy.orm import Session
 
-from app.database import get_db
+from app.database import DbSession, get_session, run_db
 from app.models import User, Client, ClientResponsible, ClientCollaborators
 from app.schemas import (
     ClientCreate,
     ClientUpdate,
     ClientResponse,
     ClientListResponse,
+    ClientImportResult,
 )
 from app.auth import get_current_user
+from app.client_import import ImportFormat, FORMAT_EXTENSIONS, import_clients, parse_records
+from app.pagination import paginate
+from app.search import client_search_filter
+from app.etag import weak_etag, not_modified, NO_CACHE
+from app.sync import client_version
 
 router = APIRouter(prefix="/clients", tags=["Clientes"])
 
 
-@router.post("/", response_model=ClientResponse, status_code=status.HTTP_201_CREATED)
-def create_client(
-    client_data: ClientCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
-    """
-    Cria um novo cliente com responsáveis e informações de colaboradores
-    """
+def _create_client(db: Session, client_data: ClientCreate) -> ClientResponse:
     # Verifica se o CNPJ já existe
     existing_client = db.query(Client).filter(Client.cnpj == client_data.cnpj).first()
     if existing_client:
@@ -58,61 +57,124 @@ def create_client(
     db.commit()
     db.refresh(new_client)
     
-    return new_client
+    return ClientResponse.model_validate(new_client)
 
 
-@router.get("/", response_model=List[ClientListResponse])
-def list_clients(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100),
-    search: str = Query(None, description="Busca por nome fantasia ou CNPJ"),
-    db: Session = Depends(get_db),
+@router.post("/", response_model=ClientResponse, status_code=status.HTTP_201_CREATED)
+async def create_client(
+    client_data: ClientCreate,
+    db: DbSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Cria um novo cliente com responsáveis e informações de colaboradores
+    """
+    return await run_db(db, _create_client, client_data)
+
+
+def _import_clients(db: Session, content: str, formato: ImportFormat, atualizar: bool) -> ClientImportResult:
+    return import_clients(db, parse_records(content, formato), atualizar=atualizar)
+
+
+@router.post("/importar", response_model=ClientImportResult)
+async def import_clients_file(
+    arquivo: UploadFile = File(..., description="Arquivo CSV ou JSON Lines (UTF-8)"),
+    formato: Optional[ImportFormat] = Query(None, description="Padrão: pela extensão do arquivo"),
+    atualizar: bool = Query(True, description="Atualiza os clientes cujo CNPJ já está cadastrado"),
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Lista todos os clientes com paginação e busca opcional
+    Importa clientes em lote a partir de um arquivo CSV ou JSON Lines
+    Valida cada linha como no POST /clients e grava em lotes; linhas com erro
+    não impedem as demais e aparecem no relatório com o motivo
     """
+    if formato is None:
+        extensao = os.path.splitext(arquivo.filename or "")[1].lower()
+        formato = FORMAT_EXTENSIONS.get(extensao)
+        if formato is None:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Formato do arquivo não reconhecido: use .csv ou .jsonl, ou informe o parâmetro formato"
+            )
+    
+    try:
+        content = (await arquivo.read()).decode("utf-8-sig")
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="O arquivo deve estar codificado em UTF-8"
+        )
+    
+    return await run_db(db, _import_clients, content, formato, atualizar)
+
+
+def _list_clients(db: Session, response: Response, limit: int, cursor: str, skip: int,
+                  incluir_total: bool, search: str) -> List[ClientListResponse]:
     query = db.query(Client)
     
-    # Busca por nome ou CNPJ
+    # Busca por nome ou CNPJ (usa o índice de busca)
     if search:
-        query = query.filter(
-            (Client.nome_fantasia.ilike(f"%{search}%")) |
-            (Client.cnpj.ilike(f"%{search}%"))
-        )
+        query = query.filter(client_search_filter(search))
     
-    clients = query.offset(skip).limit(limit).all()
-    return clients
+    clients = paginate(query, Client, response, limit, cursor=cursor, skip=skip, incluir_total=incluir_total)
+    return [ClientListResponse.model_validate(client) for client in clients]
 
 
-@router.get("/{client_id}", response_model=ClientResponse)
-def get_client(
-    client_id: int,
-    db: Session = Depends(get_db),
+@router.get("/", response_model=List[ClientListResponse])
+async def list_clients(
+    response: Response,
+    cursor: str = Query(None, description="Cursor da próxima página (cabeçalho X-Next-Cursor)"),
+    skip: int = Query(0, ge=0, deprecated=True, description="Use o cursor"),
+    limit: int = Query(100, ge=1, le=100),
+    incluir_total: bool = Query(False, description="Retorna o total no cabeçalho X-Total-Count"),
+    search: str = Query(None, description="Busca por nome fantasia (sem acentos) ou prefixo do CNPJ"),
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Busca um cliente específico por ID
+    Lista todos os clientes com paginação por cursor e busca opcional
+    Ordenados do mais recente para o mais antigo
     """
+    return await run_db(db, _list_clients, response, limit, cursor, skip, incluir_total, search)
+
+
+def _get_client(db: Session, client_id: int, response: Response, if_none_match: Optional[str]):
+    # ETag pela versão do cliente (inclui responsáveis e colaboradores); 304 sem carregar o cliente
+    versao = client_version(db, client_id)
+    if versao is not None:
+        etag = weak_etag(f"c{client_id}-{versao}")
+        cached = not_modified(if_none_match, etag)
+        if cached is not None:
+            return cached
+        response.headers["ETag"] = etag
+        response.headers["Cache-Control"] = NO_CACHE
+
     client = db.query(Client).filter(Client.id == client_id).first()
     if not client:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Cliente não encontrado"
         )
-    return client
+    return ClientResponse.model_validate(client)
 
 
-@router.put("/{client_id}", response_model=ClientResponse)
-def update_client(
+@router.get("/{client_id}", response_model=ClientResponse)
+async def get_client(
     client_id: int,
-    client_data: ClientUpdate,
-    db: Session = Depends(get_db),
+    response: Response,
+    if_none_match: Optional[str] = Header(None),
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Atualiza um cliente existente
+    Busca um cliente específico por ID
+    Com If-None-Match igual ao ETag atual, responde 304 sem corpo
     """
+    return await run_db(db, _get_client, client_id, response, if_none_match)
+
+
+def _update_client(db: Session, client_id: int, client_data: ClientUpdate) -> ClientResponse:
     client = db.query(Client).filter(Client.id == client_id).first()
     if not client:
         raise HTTPException(
@@ -173,18 +235,23 @@ def update_client(
     db.commit()
     db.refresh(client)
     
-    return client
+    return ClientResponse.model_validate(client)
 
 
-@router.delete("/{client_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_client(
+@router.put("/{client_id}", response_model=ClientResponse)
+async def update_client(
     client_id: int,
-    db: Session = Depends(get_db),
+    client_data: ClientUpdate,
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Deleta um cliente
+    Atualiza um cliente existente
     """
+    return await run_db(db, _update_client, client_id, client_data)
+
+
+def _delete_client(db: Session, client_id: int):
     client = db.query(Client).filter(Client.id == client_id).first()
     if not client:
         raise HTTPException(
@@ -194,5 +261,16 @@ def delete_client(
     
     db.delete(client)
     db.commit()
-    
+
+
+@router.delete("/{client_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_client(
+    client_id: int,
+    db: DbSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Deleta um cliente
+    """
+    await run_db(db, _delete_client, client_id)
     return None
@@ -0,0 +1,68 @@
+import hmac
+from typing import Optional
+
+from anyio import to_thread
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
+
+from app import metrics as metrics_settings
+from app.auth import user_cache
+from app.metrics import CONTENT_TYPE, Gauge, render_metrics
+from app.pdf_jobs import PDF_WORKERS, pending_pdf_renders
+
+router = APIRouter(tags=["Métricas"])
+
+
+def require_metrics_token(authorization: Optional[str] = Header(None)):
+    """
+    Sem METRICS_TOKEN o endpoint não existe (404); com ele, exige
+    Authorization: Bearer <METRICS_TOKEN> (o coletor do Prometheus envia como bearer_token)
+    """
+    token = metrics_settings.METRICS_TOKEN
+    if not token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+
+    scheme, _, credentials = (authorization or "").partition(" ")
+    if scheme.lower() != "bearer" or not hmac.compare_digest(credentials.strip().encode(), token.encode()):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Token de métricas inválido",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+def _threadpool_gauges():
+    """Ocupação do threadpool das rotas síncronas e do acesso ao banco (run_in_threadpool)"""
+    limiter = to_thread.current_default_thread_limiter()
+    return [
+        Gauge("bpa_threadpool_threads", "Limite de threads do threadpool",
+              collect=lambda: [((), limiter.total_tokens)]),
+        Gauge("bpa_threadpool_threads_in_use", "Threads do threadpool ocupadas",
+              collect=lambda: [((), limiter.borrowed_tokens)]),
+        Gauge("bpa_threadpool_tasks_waiting", "Tarefas esperando uma thread livre",
+              collect=lambda: [((), limiter.statistics().tasks_waiting)]),
+        Gauge("bpa_pdf_workers", "Processos da fila de PDFs",
+              collect=lambda: [((), PDF_WORKERS)]),
+        Gauge("bpa_pdf_renders_pending", "PDFs enfileirados ou em renderização",
+              collect=lambda: [((), pending_pdf_renders())]),
+    ]
+
+
+def _cache_gauges():
+    stats = user_cache.stats()
+    return [
+        Gauge("bpa_user_cache_hits_total", "Acertos do cache de usuários autenticados",
+              collect=lambda: [((), stats["hits"])], kind="counter"),
+        Gauge("bpa_user_cache_misses_total", "Falhas do cache de usuários autenticados",
+              collect=lambda: [((), stats["misses"])], kind="counter"),
+        Gauge("bpa_user_cache_size", "Entradas no cache de usuários autenticados",
+              collect=lambda: [((), stats["size"])]),
+    ]
+
+
+@router.get("/metrics", include_in_schema=False, dependencies=[Depends(require_metrics_token)])
+async def metrics():
+    """
+    Métricas no formato texto do Prometheus (latência por rota, consultas SQL,
+    PDFs, threadpool e caches); os valores são do processo que responde
+    """
+    return Response(render_metrics([*_threadpool_gauges(), *_cache_gauges()]), media_type=CONTENT_TYPE)
@@ -1,41 +1,170 @@
-from typing import List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, status, Query, Header, Response
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import StreamingResponse
-from sqlalchemy.orm import Session, joinedload
-from datetime import datetime
+from sqlalchemy import insert, select, update
+from sqlalchemy.orm import Session, joinedload, selectinload
+from datetime import date, datetime
 
-from app.database import get_db
+from app.database import DbSession, get_session, run_db
 from app.models import (
     User,
     Report,
     ChecklistCategory,
     ChecklistItem,
+    ChecklistTemplate,
+    ChecklistTemplateCategory,
+    ChecklistTemplateItem,
     ReportStatus,
+    ChecklistResponse,
+    PdfJobStatus,
+    PdfBatchFormat,
     Client,
 )
 from app.schemas import (
     ReportCreate,
+    ChecklistCategoryCreate,
     ReportUpdate,
     ReportResponse,
     ReportListResponse,
     ChecklistItemUpdate,
+    ChecklistItemBatchUpdate,
+    ChecklistItemBatchResult,
     ChecklistItemResponse,
+    ChecklistSummary,
+    PdfJobResponse,
+    PdfBatchRequest,
+    PdfBatchJobResponse,
 )
 from app.auth import get_current_user
-from app.pdf_generator import generate_report_pdf
+from app.pdf_generator import render_pdf_bytes
+from app.metrics import PDF_RENDER
+from app.pdf_cache import report_content_hash, get_cached_pdf, store_pdf, invalidate_report_pdf
+from app.etag import weak_etag, etag_matches, not_modified, NO_CACHE, REPORT_CACHE_MAX_AGE
+from app.checklist_summary import query_summary
+from app.pagination import paginate
+from app.pdf_jobs import (
+    PdfJob,
+    PdfBatchJob,
+    PDF_BATCH_MAX_REPORTS,
+    submit_pdf_job,
+    get_pdf_job,
+    submit_pdf_batch_job,
+    get_pdf_batch_job,
+    stream_batch_zip,
+    merge_batch_pdf,
+)
+from app.sync import report_version
+from app.responses import model_response
+from app.export import ExportFormat, MEDIA_TYPES, report_ids_statement, stream_export
 
 router = APIRouter(prefix="/reports", tags=["Relatórios"])
 
 
-@router.post("/", response_model=ReportResponse, status_code=status.HTTP_201_CREATED)
-def create_report(
-    report_data: ReportCreate,
-    db: Session = Depends(get_db),
-    current_user: User = Depends(get_current_user)
-):
+def _report_tree_query(db: Session):
     """
-    Cria um novo relatório com categorias e itens de checklist
+    Relatórios com cliente, responsável e toda a árvore do checklist
+    Usa selectinload para as categorias/itens: o número de queries é constante,
+    independente da quantidade de categorias (e de relatórios)
     """
+    return db.query(Report).options(
+        joinedload(Report.cliente),
+        joinedload(Report.responsavel),
+        selectinload(Report.categorias)
+        .selectinload(ChecklistCategory.itens)
+        .selectinload(ChecklistItem.template_item)
+    )
+
+
+def get_report_tree(db: Session, report_id: int) -> Report:
+    """
+    Carrega o relatório com cliente, responsável e toda a árvore do checklist
+    """
+    report = _report_tree_query(db).filter(Report.id == report_id).first()
+    if not report:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Relatório não encontrado"
+        )
+    return report
+
+
+def get_report_trees(db: Session, report_ids: List[int]) -> List[Report]:
+    """
+    Carrega vários relatórios completos de uma vez, na ordem de report_ids
+    """
+    reports = {report.id: report for report in _report_tree_query(db).filter(Report.id.in_(report_ids))}
+    return [reports[report_id] for report_id in report_ids if report_id in reports]
+
+
+def insert_checklist(db: Session, report_id: int, categorias: List[ChecklistCategoryCreate]):
+    """
+    Insere as categorias e os itens do checklist em lote
+    Um INSERT ... RETURNING para todas as categorias e um executemany para todos os itens
+    """
+    category_ids = db.scalars(
+        insert(ChecklistCategory).returning(ChecklistCategory.id, sort_by_parameter_order=True),
+        [
+            {"relatorio_id": report_id, "nome": cat_data.nome, "ordem": cat_data.ordem}
+            for cat_data in categorias
+        ],
+    ).all()
+    
+    items = [
+        {"categoria_id": category_id, **item_data.model_dump()}
+        for category_id, cat_data in zip(category_ids, categorias)
+        for item_data in cat_data.itens
+    ]
+    if items:
+        db.execute(insert(ChecklistItem), items)
+
+
+def insert_checklist_from_template(db: Session, report_id: int, template_id: int):
+    """
+    Monta o checklist do relatório a partir de um template
+    Os itens apenas referenciam o template; a descrição não é copiada
+    """
+    template_categories = db.execute(
+        select(ChecklistTemplateCategory.id, ChecklistTemplateCategory.nome, ChecklistTemplateCategory.ordem)
+        .where(ChecklistTemplateCategory.template_id == template_id)
+        .order_by(ChecklistTemplateCategory.ordem)
+    ).all()
+    if not template_categories:
+        return
+    
+    category_ids = db.scalars(
+        insert(ChecklistCategory).returning(ChecklistCategory.id, sort_by_parameter_order=True),
+        [
+            {"relatorio_id": report_id, "nome": cat.nome, "ordem": cat.ordem}
+            for cat in template_categories
+        ],
+    ).all()
+    category_map = {cat.id: category_id for cat, category_id in zip(template_categories, category_ids)}
+    
+    template_items = db.execute(
+        select(
+            ChecklistTemplateItem.id,
+            ChecklistTemplateItem.categoria_id,
+            ChecklistTemplateItem.codigo,
+            ChecklistTemplateItem.ordem,
+        ).where(ChecklistTemplateItem.categoria_id.in_(category_map))
+    ).all()
+    if template_items:
+        db.execute(
+            insert(ChecklistItem),
+            [
+                {
+                    "categoria_id": category_map[item.categoria_id],
+                    "template_item_id": item.id,
+                    "codigo": item.codigo,
+                    "ordem": item.ordem,
+                }
+                for item in template_items
+            ],
+        )
+
+
+def _create_report(db: Session, report_data: ReportCreate) -> Response:
     # Verifica se o cliente existe
     client = db.query(Client).filter(Client.id == report_data.cliente_id).first()
     if not client:
@@ -52,50 +181,62 @@ def create_report(
             detail="Responsável pela inspeção não encontrado"
         )
     
+    # Verifica o template (se especificado)
+    if report_data.template_id:
+        if report_data.categorias:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Informe o template ou as categorias, não ambos"
+            )
+        template = db.query(ChecklistTemplate).filter(ChecklistTemplate.id == report_data.template_id).first()
+        if not template:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail="Template não encontrado"
+            )
+    
     # Cria o relatório
-    report_dict = report_data.model_dump(exclude={'categorias'})
+    report_dict = report_data.model_dump(exclude={'categorias', 'template_id'})
     new_report = Report(**report_dict)
     db.add(new_report)
     db.flush()
     
     # Adiciona categorias e itens
-    if report_data.categorias:
-        for cat_data in report_data.categorias:
-            category = ChecklistCategory(
-                relatorio_id=new_report.id,
-                nome=cat_data.nome,
-                ordem=cat_data.ordem
-            )
-            db.add(category)
-            db.flush()
-            
-            # Adiciona itens da categoria
-            for item_data in cat_data.itens:
-                item = ChecklistItem(
-                    categoria_id=category.id,
-                    **item_data.model_dump()
-                )
-                db.add(item)
+    if report_data.template_id:
+        insert_checklist_from_template(db, new_report.id, report_data.template_id)
+    elif report_data.categorias:
+        insert_checklist(db, new_report.id, report_data.categorias)
     
     db.commit()
-    db.refresh(new_report)
     
-    return new_report
+    return _report_response(db, new_report.id, status.HTTP_201_CREATED)
 
 
-@router.get("/", response_model=List[ReportListResponse])
-def list_reports(
-    skip: int = Query(0, ge=0),
-    limit: int = Query(100, ge=1, le=100),
-    cliente_id: int = Query(None, description="Filtrar por cliente"),
-    status_filter: ReportStatus = Query(None, description="Filtrar por status"),
-    db: Session = Depends(get_db),
+def _report_response(db: Session, report_id: int, status_code: int = status.HTTP_200_OK,
+                     headers: Optional[dict] = None) -> Response:
+    """
+    Carrega a árvore do relatório, valida uma vez a partir do ORM e já serializa
+    (relatórios grandes: sem a segunda validação do response_model)
+    """
+    return model_response(ReportResponse.model_validate(get_report_tree(db, report_id)), status_code, headers)
+
+
+@router.post("/", response_model=ReportResponse, status_code=status.HTTP_201_CREATED)
+async def create_report(
+    report_data: ReportCreate,
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Lista todos os relatórios com filtros opcionais
+    Cria um novo relatório com categorias e itens de checklist
     """
-    query = db.query(Report)
+    return await run_db(db, _create_report, report_data)
+
+
+def _list_reports(db: Session, response: Response, limit: int, cursor: str, skip: int,
+                  incluir_total: bool, cliente_id: int,
+                  status_filter: ReportStatus) -> List[ReportListResponse]:
+    query = db.query(Report).options(joinedload(Report.cliente))
     
     if cliente_id:
         query = query.filter(Report.cliente_id == cliente_id)
@@ -103,65 +244,164 @@ def list_reports(
     if status_filter:
         query = query.filter(Report.status == status_filter)
     
-    reports = query.offset(skip).limit(limit).all()
-    return reports
+    reports = paginate(query, Report, response, limit, cursor=cursor, skip=skip, incluir_total=incluir_total)
+    return [ReportListResponse.model_validate(report) for report in reports]
 
 
-@router.get("/agenda/calendario", response_model=List[ReportListResponse])
-def get_reports_by_date(
-    mes: int = Query(..., ge=1, le=12, description="Mês (1-12)"),
-    ano: int = Query(..., ge=2000, le=2100, description="Ano"),
-    db: Session = Depends(get_db),
+@router.get("/", response_model=List[ReportListResponse])
+async def list_reports(
+    response: Response,
+    cursor: str = Query(None, description="Cursor da próxima página (cabeçalho X-Next-Cursor)"),
+    skip: int = Query(0, ge=0, deprecated=True, description="Use o cursor"),
+    limit: int = Query(100, ge=1, le=100),
+    incluir_total: bool = Query(False, description="Retorna o total no cabeçalho X-Total-Count"),
+    cliente_id: int = Query(None, description="Filtrar por cliente"),
+    status_filter: ReportStatus = Query(None, description="Filtrar por status"),
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Busca relatórios agendados para um mês específico
+    Lista todos os relatórios com filtros opcionais e paginação por cursor
+    Ordenados do mais recente para o mais antigo
     """
-    from sqlalchemy import extract
+    return await run_db(
+        db, _list_reports, response, limit, cursor, skip, incluir_total, cliente_id, status_filter
+    )
+
+
+def _get_reports_by_date(db: Session, mes: int, ano: int) -> List[ReportListResponse]:
+    # Intervalo semiaberto [início do mês, início do mês seguinte): usa o índice de data_agendada
+    inicio = datetime(ano, mes, 1)
+    fim = datetime(ano + 1, 1, 1) if mes == 12 else datetime(ano, mes + 1, 1)
     
     # Busca relatórios pela data agendada
     reports = (
         db.query(Report)
         .options(joinedload(Report.cliente))
         .filter(
-            extract('month', Report.data_agendada) == mes,
-            extract('year', Report.data_agendada) == ano
+            Report.data_agendada >= inicio,
+            Report.data_agendada < fim
         )
         .order_by(Report.data_agendada)
         .all()
     )
     
-    return reports
+    return [ReportListResponse.model_validate(report) for report in reports]
+
+
+@router.get("/agenda/calendario", response_model=List[ReportListResponse])
+async def get_reports_by_date(
+    mes: int = Query(..., ge=1, le=12, description="Mês (1-12)"),
+    ano: int = Query(..., ge=2000, le=2100, description="Ano"),
+    db: DbSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Busca relatórios agendados para um mês específico
+    """
+    return await run_db(db, _get_reports_by_date, mes, ano)
+
+
+@router.get("/exportar")
+async def export_reports(
+    formato: ExportFormat = Query(ExportFormat.CSV, description="csv ou xlsx"),
+    cliente_id: int = Query(None, description="Filtrar por cliente"),
+    data_inicio: date = Query(None, description="Criados a partir desta data"),
+    data_fim: date = Query(None, description="Criados até esta data (inclusive)"),
+    status_filter: ReportStatus = Query(None, description="Filtrar por status do relatório"),
+    resposta: ChecklistResponse = Query(None, description="Filtrar itens pela resposta (ex: nao_conforme)"),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Exporta os itens de checklist dos relatórios filtrados (uma linha por item)
+    O arquivo é enviado em streaming, lido do banco em lotes: a memória não
+    cresce com a quantidade de relatórios
+    """
+    if data_inicio and data_fim and data_fim < data_inicio:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="data_fim anterior a data_inicio"
+        )
+    
+    filename = f"relatorios_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{formato.value}"
+    
+    return StreamingResponse(
+        stream_export(
+            formato,
+            cliente_id=cliente_id,
+            data_inicio=data_inicio,
+            data_fim=data_fim,
+            status_filter=status_filter,
+            resposta=resposta,
+        ),
+        media_type=MEDIA_TYPES[formato],
+        headers={"Content-Disposition": f"attachment; filename={filename}"}
+    )
+
+
+def _get_report(db: Session, report_id: int, if_none_match: Optional[str]) -> Response:
+    """
+    Resposta condicional: o ETag vem das versões do registro de alterações (relatório,
+    categorias, itens e cliente), lidas antes da árvore; se o cliente já tem a versão
+    atual, responde 304 sem carregar a árvore nem montar o schema
+    """
+    versions = report_version(db, report_id)
+    if versions is None:
+        return _report_response(db, report_id)
+
+    versao, versao_cliente, report_status = versions
+    etag = weak_etag(f"r{report_id}-{versao}-{versao_cliente}")
+    # Relatórios concluídos quase não mudam: o navegador reutiliza sem revalidar por um tempo
+    if report_status == ReportStatus.CONCLUIDO:
+        cache_control = f"private, max-age={REPORT_CACHE_MAX_AGE}"
+    else:
+        cache_control = NO_CACHE
+
+    cached = not_modified(if_none_match, etag, cache_control)
+    if cached is not None:
+        return cached
+
+    return _report_response(db, report_id, headers={"ETag": etag, "Cache-Control": cache_control})
 
 
 @router.get("/{report_id}", response_model=ReportResponse)
-def get_report(
+async def get_report(
     report_id: int,
-    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     Busca um relatório específico por ID com todas as categorias e itens
+    Com If-None-Match igual ao ETag atual, responde 304 sem corpo
     """
-    report = db.query(Report).filter(Report.id == report_id).first()
+    return await run_db(db, _get_report, report_id, if_none_match)
+
+
+def _get_report_summary(db: Session, report_id: int) -> ChecklistSummary:
+    report = db.query(Report.id).filter(Report.id == report_id).first()
     if not report:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Relatório não encontrado"
         )
-    return report
+    
+    return query_summary(db, report_id)
 
 
-@router.put("/{report_id}", response_model=ReportResponse)
-def update_report(
+@router.get("/{report_id}/summary", response_model=ChecklistSummary)
+async def get_report_summary(
     report_id: int,
-    report_data: ReportUpdate,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Atualiza informações básicas do relatório
+    Retorna a contagem de respostas do checklist sem carregar os itens
     """
+    return await run_db(db, _get_report_summary, report_id)
+
+
+def _update_report(db: Session, report_id: int, report_data: ReportUpdate) -> Response:
     report = db.query(Report).filter(Report.id == report_id).first()
     if not report:
         raise HTTPException(
@@ -179,20 +419,25 @@ def update_report(
         report.finalizado_em = datetime.utcnow()
     
     db.commit()
-    db.refresh(report)
+    invalidate_report_pdf(report_id)
     
-    return report
+    return _report_response(db, report_id)
 
 
-@router.delete("/{report_id}", status_code=status.HTTP_204_NO_CONTENT)
-def delete_report(
+@router.put("/{report_id}", response_model=ReportResponse)
+async def update_report(
     report_id: int,
-    db: Session = Depends(get_db),
+    report_data: ReportUpdate,
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Deleta um relatório
+    Atualiza informações básicas do relatório
     """
+    return await run_db(db, _update_report, report_id, report_data)
+
+
+def _delete_report(db: Session, report_id: int):
     report = db.query(Report).filter(Report.id == report_id).first()
     if not report:
         raise HTTPException(
@@ -202,19 +447,23 @@ def delete_report(
     
     db.delete(report)
     db.commit()
-    
-    return None
+    invalidate_report_pdf(report_id)
 
 
-@router.post("/{report_id}/finalizar", response_model=ReportResponse)
-def finalizar_report(
+@router.delete("/{report_id}", status_code=status.HTTP_204_NO_CONTENT)
+async def delete_report(
     report_id: int,
-    db: Session = Depends(get_db),
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Finaliza/Encerra um relatório, impedindo futuras edições
+    Deleta um relatório
     """
+    await run_db(db, _delete_report, report_id)
+    return None
+
+
+def _finalizar_report(db: Session, report_id: int) -> Response:
     report = db.query(Report).filter(Report.id == report_id).first()
     if not report:
         raise HTTPException(
@@ -233,23 +482,25 @@ def finalizar_report(
     report.finalizado_em = datetime.utcnow()
     
     db.commit()
-    db.refresh(report)
     
-    return report
-
+    return _report_response(db, report_id)
 
-# ===== ENDPOINTS PARA CHECKLIST ITEMS =====
 
-@router.put("/items/{item_id}", response_model=ChecklistItemResponse)
-def update_checklist_item(
-    item_id: int,
-    item_data: ChecklistItemUpdate,
-    db: Session = Depends(get_db),
+@router.post("/{report_id}/finalizar", response_model=ReportResponse)
+async def finalizar_report(
+    report_id: int,
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
-    Atualiza a resposta e observações de um item de checklist
+    Finaliza/Encerra um relatório, impedindo futuras edições
     """
+    return await run_db(db, _finalizar_report, report_id)
+
+
+# ===== ENDPOINTS PARA CHECKLIST ITEMS =====
+
+def _update_checklist_item(db: Session, item_id: int, item_data: ChecklistItemUpdate) -> ChecklistItemResponse:
     item = db.query(ChecklistItem).filter(ChecklistItem.id == item_id).first()
     if not item:
         raise HTTPException(
@@ -264,47 +515,327 @@ def update_checklist_item(
         item.observacoes = item_data.observacoes
     
     db.commit()
+    invalidate_report_pdf(item.categoria.relatorio_id)
     db.refresh(item)
     
-    return item
+    return ChecklistItemResponse.model_validate(item)
+
+
+@router.put("/items/{item_id}", response_model=ChecklistItemResponse)
+async def update_checklist_item(
+    item_id: int,
+    item_data: ChecklistItemUpdate,
+    db: DbSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Atualiza a resposta e observações de um item de checklist
+    """
+    return await run_db(db, _update_checklist_item, item_id, item_data)
+
+
+def _update_checklist_items(db: Session, report_id: int,
+                            items_data: List[ChecklistItemBatchUpdate]) -> List[ChecklistItemBatchResult]:
+    report = db.query(Report.id).filter(Report.id == report_id).first()
+    if not report:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Relatório não encontrado"
+        )
+    
+    # Itens do lote que realmente pertencem a este relatório
+    requested_ids = {item_data.item_id for item_data in items_data}
+    valid_ids = set(db.scalars(
+        select(ChecklistItem.id)
+        .join(ChecklistCategory, ChecklistItem.categoria_id == ChecklistCategory.id)
+        .where(ChecklistCategory.relatorio_id == report_id, ChecklistItem.id.in_(requested_ids))
+    ).all())
+    
+    results = []
+    updates = []
+    for item_data in items_data:
+        if item_data.item_id not in valid_ids:
+            results.append(ChecklistItemBatchResult(
+                item_id=item_data.item_id,
+                sucesso=False,
+                erro="Item de checklist não encontrado neste relatório"
+            ))
+            continue
+        
+        # Mesma regra do PUT /items/{item_id}: só atualiza o que foi enviado
+        values = item_data.model_dump(exclude={'item_id'}, exclude_none=True)
+        if values:
+            updates.append({"id": item_data.item_id, **values})
+        results.append(ChecklistItemBatchResult(item_id=item_data.item_id, sucesso=True))
+    
+    if updates:
+        db.execute(update(ChecklistItem), updates)
+        db.commit()
+        invalidate_report_pdf(report_id)
+    
+    return results
+
+
+@router.patch("/{report_id}/items", response_model=List[ChecklistItemBatchResult])
+async def update_checklist_items(
+    report_id: int,
+    items_data: List[ChecklistItemBatchUpdate],
+    db: DbSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Atualiza respostas e observações de vários itens do relatório de uma vez
+    Aplica tudo em uma única transação e retorna o resultado de cada item
+    """
+    return await run_db(db, _update_checklist_items, report_id, items_data)
+
+
+def _render_pdf_response(report: Report, if_none_match: Optional[str]) -> Response:
+    """Monta a resposta do PDF (ETag, cache em disco e renderização); CPU, roda no threadpool"""
+    content_hash = report_content_hash(report)
+    etag = weak_etag(content_hash)
+    if etag_matches(if_none_match, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    
+    # Busca no cache ou gera o PDF
+    cacheable = report.status == ReportStatus.CONCLUIDO
+    pdf_bytes = get_cached_pdf(report.id, content_hash) if cacheable else None
+    if pdf_bytes is None:
+        pdf_bytes = render_pdf_bytes(report)
+        PDF_RENDER.observe(pdf_bytes.segundos, modo="requisicao")
+        if cacheable:
+            store_pdf(report.id, content_hash, pdf_bytes)
+    
+    # Nome do arquivo
+    filename = f"relatorio_{report.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    
+    return Response(
+        content=pdf_bytes,
+        media_type="application/pdf",
+        headers={
+            "Content-Disposition": f"attachment; filename={filename}",
+            "ETag": etag,
+        }
+    )
 
 
 @router.get("/{report_id}/pdf")
-def export_report_pdf(
+async def export_report_pdf(
     report_id: int,
-    db: Session = Depends(get_db),
+    if_none_match: Optional[str] = Header(None),
+    db: DbSession = Depends(get_session),
     current_user: User = Depends(get_current_user)
 ):
     """
     Gera e retorna o PDF do relatório
+    Relatórios concluídos ficam em cache em disco; o ETag é o hash do conteúdo
     """
-    report = (
-        db.query(Report)
-        .options(
-            joinedload(Report.cliente),
-            joinedload(Report.responsavel),
-            joinedload(Report.categorias).joinedload(ChecklistCategory.itens)
-        )
-        .filter(Report.id == report_id)
-        .first()
+    # A árvore é carregada de forma ansiosa: a renderização não faz novas consultas
+    report = await run_db(db, get_report_tree, report_id)
+    return await run_in_threadpool(_render_pdf_response, report, if_none_match)
+
+
+# ===== ENDPOINTS PARA GERAÇÃO ASSÍNCRONA DE PDF =====
+
+def _pdf_job_response(job: PdfJob) -> PdfJobResponse:
+    return PdfJobResponse(
+        job_id=job.id,
+        relatorio_id=job.report_id,
+        status=job.status,
+        criado_em=job.criado_em,
+        erro=job.erro,
     )
+
+
+def _get_report_pdf_job(report_id: int, job_id: str) -> PdfJob:
+    job = get_pdf_job(job_id)
+    if not job or job.report_id != report_id:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job de PDF não encontrado"
+        )
+    return job
+
+
+@router.post("/{report_id}/pdf-jobs", response_model=PdfJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_pdf_job(
+    report_id: int,
+    db: DbSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Enfileira a geração do PDF em um processo separado e retorna o ID do job
+    """
+    report = await run_db(db, lambda session: session.query(Report.id).filter(Report.id == report_id).first())
     if not report:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Relatório não encontrado"
         )
     
-    # Gera o PDF
-    pdf_buffer = generate_report_pdf(report)
+    return _pdf_job_response(submit_pdf_job(report_id))
+
+
+@router.get("/{report_id}/pdf-jobs/{job_id}", response_model=PdfJobResponse)
+def get_pdf_job_status(
+    report_id: int,
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Consulta o status de um job de geração de PDF
+    """
+    return _pdf_job_response(_get_report_pdf_job(report_id, job_id))
+
+
+@router.get("/{report_id}/pdf-jobs/{job_id}/download")
+def download_pdf_job(
+    report_id: int,
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Retorna o PDF gerado pelo job
+    """
+    job = _get_report_pdf_job(report_id, job_id)
     
-    # Nome do arquivo
-    filename = f"relatorio_{report.id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+    if job.status == PdfJobStatus.ERRO:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=job.erro
+        )
+    if job.status != PdfJobStatus.CONCLUIDO:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="O PDF ainda está sendo gerado"
+        )
     
-    # Retorna como StreamingResponse
-    return StreamingResponse(
-        pdf_buffer,
+    filename = f"relatorio_{report_id}_{job.criado_em.strftime('%Y%m%d_%H%M%S')}.pdf"
+    
+    return Response(
+        content=job.pdf,
         media_type="application/pdf",
         headers={
             "Content-Disposition": f"attachment; filename={filename}"
         }
     )
+
+
+# ===== ENDPOINTS PARA PDF DE VÁRIOS RELATÓRIOS =====
+
+def _pdf_batch_job_response(job: PdfBatchJob) -> PdfBatchJobResponse:
+    concluidos = job.concluidos
+    return PdfBatchJobResponse(
+        job_id=job.id,
+        formato=job.formato,
+        status=job.status,
+        total=job.total,
+        concluidos=concluidos,
+        percentual=round(concluidos / job.total * 100),
+        relatorio_ids=job.report_ids,
+        criado_em=job.criado_em,
+        erro=job.erro,
+    )
+
+
+def _create_pdf_batch(db: Session, batch_data: PdfBatchRequest) -> PdfBatchJobResponse:
+    if batch_data.relatorio_ids:
+        report_ids = list(dict.fromkeys(batch_data.relatorio_ids))
+    else:
+        report_ids = db.scalars(
+            report_ids_statement(
+                cliente_id=batch_data.cliente_id,
+                data_inicio=batch_data.data_inicio,
+                data_fim=batch_data.data_fim,
+                status_filter=batch_data.status,
+            ).limit(PDF_BATCH_MAX_REPORTS + 1)
+        ).all()
+    
+    if len(report_ids) > PDF_BATCH_MAX_REPORTS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"O lote pode ter no máximo {PDF_BATCH_MAX_REPORTS} relatórios"
+        )
+    
+    # Todos os relatórios em uma consulta (mais as selectinload da árvore)
+    reports = get_report_trees(db, report_ids)
+    if not reports:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Nenhum relatório encontrado"
+        )
+    if len(reports) < len(report_ids):
+        missing = sorted(set(report_ids) - {report.id for report in reports})
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Relatórios não encontrados: {', '.join(map(str, missing))}"
+        )
+    
+    return _pdf_batch_job_response(submit_pdf_batch_job(reports, batch_data.formato))
+
+
+@router.post("/pdf-lote", response_model=PdfBatchJobResponse, status_code=status.HTTP_202_ACCEPTED)
+async def create_pdf_batch(
+    batch_data: PdfBatchRequest,
+    db: DbSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Enfileira os PDFs de vários relatórios (lista de IDs ou cliente e período)
+    Os PDFs são gerados em paralelo nos processos da fila; acompanhe o progresso
+    pelo job e baixe um ZIP ou um único PDF ao final
+    """
+    return await run_db(db, _create_pdf_batch, batch_data)
+
+
+def _get_pdf_batch_job(job_id: str) -> PdfBatchJob:
+    job = get_pdf_batch_job(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Job de PDF não encontrado"
+        )
+    return job
+
+
+@router.get("/pdf-lote/{job_id}", response_model=PdfBatchJobResponse)
+def get_pdf_batch_status(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Consulta o status e o progresso (relatórios concluídos) de um job em lote
+    """
+    return _pdf_batch_job_response(_get_pdf_batch_job(job_id))
+
+
+@router.get("/pdf-lote/{job_id}/download")
+async def download_pdf_batch(
+    job_id: str,
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Retorna os PDFs do job: ZIP (em streaming) ou um único PDF com marcadores
+    """
+    job = _get_pdf_batch_job(job_id)
+    
+    if job.status == PdfJobStatus.ERRO:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=job.erro
+        )
+    if job.status != PdfJobStatus.CONCLUIDO:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=f"Os PDFs ainda estão sendo gerados ({job.concluidos} de {job.total})"
+        )
+    
+    filename = f"relatorios_{job.criado_em.strftime('%Y%m%d_%H%M%S')}.{job.formato.value}"
+    headers = {"Content-Disposition": f"attachment; filename={filename}"}
+    
+    if job.formato == PdfBatchFormat.ZIP:
+        return StreamingResponse(stream_batch_zip(job), media_type="application/zip", headers=headers)
+    
+    # Juntar os PDFs é CPU: roda no threadpool
+    pdf_bytes = await run_in_threadpool(merge_batch_pdf, job)
+    return Response(content=pdf_bytes, media_type="application/pdf", headers=headers)
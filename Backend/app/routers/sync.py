@@ -0,0 +1,61 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy.orm import Session
+
+from app.database import DbSession, get_session, run_db
+from app.models import User
+from app.schemas import SyncResponse, SyncPush, SyncPushResult
+from app.auth import get_current_user
+from app.pdf_cache import invalidate_report_pdf
+from app.sync import apply_changes, load_changes, sync_enabled
+from app.responses import model_response
+
+router = APIRouter(prefix="/sync", tags=["Sincronização"])
+
+
+def _require_sync():
+    if not sync_enabled():
+        raise HTTPException(
+            status_code=status.HTTP_501_NOT_IMPLEMENTED,
+            detail="Sincronização incremental indisponível neste banco (requer os triggers da migração 0007)"
+        )
+
+
+@router.get("/", response_model=SyncResponse)
+async def pull_changes(
+    since: int = Query(0, ge=0, description="Token da última sincronização (0 para a carga inicial)"),
+    relatorio_id: int = Query(None, description="Somente as alterações de um relatório"),
+    limit: int = Query(1000, ge=1, le=5000, description="Máximo de alterações na resposta"),
+    db: DbSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Retorna os relatórios, categorias e itens alterados ou excluídos desde o token
+    Guarde o `token` da resposta para a próxima chamada; com `mais` = true chame de novo
+    """
+    _require_sync()
+    # O SyncResponse é montado já validado: serializa direto, sem o response_model
+    return model_response(await run_db(db, load_changes, since, relatorio_id, limit))
+
+
+def _push_changes(db: Session, push: SyncPush) -> List[SyncPushResult]:
+    results, changed_reports = apply_changes(db, push)
+    for report_id in changed_reports:
+        invalidate_report_pdf(report_id)
+    return results
+
+
+@router.post("/", response_model=List[SyncPushResult])
+async def push_changes(
+    push: SyncPush,
+    db: DbSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Aplica as alterações feitas offline em uma única transação
+    Cada alteração informa a versão que o tablet conhecia (versao_base); se o registro
+    mudou no servidor depois disso, ela não é aplicada e volta como conflito com o
+    registro atual (envie de novo com forcar = true para sobrescrever)
+    """
+    _require_sync()
+    return await run_db(db, _push_changes, push)
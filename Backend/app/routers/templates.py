@@ -0,0 +1,146 @@
+from typing import List
+from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import insert, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, selectinload
+
+from app.database import DbSession, get_session, run_db
+from app.models import User, ChecklistTemplate, ChecklistTemplateCategory, ChecklistTemplateItem
+from app.schemas import (
+    ChecklistTemplateCreate,
+    ChecklistTemplateResponse,
+    ChecklistTemplateListResponse,
+)
+from app.auth import get_current_user
+
+router = APIRouter(prefix="/templates", tags=["Templates de Checklist"])
+
+
+def _get_template(db: Session, template_id: int) -> ChecklistTemplateResponse:
+    template = (
+        db.query(ChecklistTemplate)
+        .options(selectinload(ChecklistTemplate.categorias).selectinload(ChecklistTemplateCategory.itens))
+        .filter(ChecklistTemplate.id == template_id)
+        .first()
+    )
+    if not template:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Template não encontrado"
+        )
+    return ChecklistTemplateResponse.model_validate(template)
+
+
+# Tentativas de criar a versão quando outra requisição grava o mesmo nome ao mesmo tempo
+TEMPLATE_VERSION_ATTEMPTS = 3
+
+
+def _next_template_version(db: Session, nome: str) -> int:
+    ultima_versao = db.query(func.max(ChecklistTemplate.versao)).filter(
+        ChecklistTemplate.nome == nome
+    ).scalar()
+    return (ultima_versao or 0) + 1
+
+
+def _insert_template_version(db: Session, template_data: ChecklistTemplateCreate) -> ChecklistTemplate:
+    """Grava a próxima versão do template (ainda sem categorias) e desativa as anteriores"""
+    versao = _next_template_version(db, template_data.nome)
+
+    if versao > 1:
+        db.query(ChecklistTemplate).filter(
+            ChecklistTemplate.nome == template_data.nome
+        ).update({ChecklistTemplate.ativo: False})
+
+    new_template = ChecklistTemplate(
+        nome=template_data.nome,
+        descricao=template_data.descricao,
+        versao=versao,
+        ativo=True,
+    )
+    db.add(new_template)
+    db.flush()
+    return new_template
+
+
+def _create_template(db: Session, template_data: ChecklistTemplateCreate) -> ChecklistTemplateResponse:
+    for _ in range(TEMPLATE_VERSION_ATTEMPTS):
+        try:
+            new_template = _insert_template_version(db, template_data)
+            break
+        except IntegrityError:
+            # Outra requisição gravou a mesma versão entre a leitura e o insert: recalcula
+            db.rollback()
+    else:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Outra versão deste template foi criada ao mesmo tempo; tente novamente"
+        )
+    
+    # Adiciona categorias e itens em lote
+    if template_data.categorias:
+        category_ids = db.scalars(
+            insert(ChecklistTemplateCategory).returning(ChecklistTemplateCategory.id, sort_by_parameter_order=True),
+            [
+                {"template_id": new_template.id, "nome": cat_data.nome, "ordem": cat_data.ordem}
+                for cat_data in template_data.categorias
+            ],
+        ).all()
+        
+        items = [
+            {"categoria_id": category_id, **item_data.model_dump()}
+            for category_id, cat_data in zip(category_ids, template_data.categorias)
+            for item_data in cat_data.itens
+        ]
+        if items:
+            db.execute(insert(ChecklistTemplateItem), items)
+    
+    db.commit()
+    
+    return _get_template(db, new_template.id)
+
+
+@router.post("/", response_model=ChecklistTemplateResponse, status_code=status.HTTP_201_CREATED)
+async def create_template(
+    template_data: ChecklistTemplateCreate,
+    db: DbSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Cria um template de checklist
+    Se já existir um template com o mesmo nome, cria a próxima versão e desativa as anteriores
+    """
+    return await run_db(db, _create_template, template_data)
+
+
+def _list_templates(db: Session, incluir_inativos: bool) -> List[ChecklistTemplateListResponse]:
+    query = db.query(ChecklistTemplate)
+    
+    if not incluir_inativos:
+        query = query.filter(ChecklistTemplate.ativo.is_(True))
+    
+    templates = query.order_by(ChecklistTemplate.nome, ChecklistTemplate.versao.desc()).all()
+    return [ChecklistTemplateListResponse.model_validate(template) for template in templates]
+
+
+@router.get("/", response_model=List[ChecklistTemplateListResponse])
+async def list_templates(
+    incluir_inativos: bool = Query(False, description="Incluir versões antigas/inativas"),
+    db: DbSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Lista os templates de checklist (por padrão apenas a versão ativa de cada um)
+    """
+    return await run_db(db, _list_templates, incluir_inativos)
+
+
+@router.get("/{template_id}", response_model=ChecklistTemplateResponse)
+async def get_template(
+    template_id: int,
+    db: DbSession = Depends(get_session),
+    current_user: User = Depends(get_current_user)
+):
+    """
+    Busca um template específico com todas as categorias e itens
+    """
+    return await run_db(db, _get_template, template_id)
@@ -18,6 +18,8 @@ from app.schemas.client import (
     ClientResponsibleResponse,
     ClientCollaboratorsCreate,
     ClientCollaboratorsResponse,
+    ClientImportRowResult,
+    ClientImportResult,
 )
 from app.schemas.report import (
     ReportBase,
@@ -29,7 +31,38 @@ from app.schemas.report import (
     ChecklistCategoryResponse,
     ChecklistItemCreate,
     ChecklistItemUpdate,
+    ChecklistItemBatchUpdate,
+    ChecklistItemBatchResult,
     ChecklistItemResponse,
+    ChecklistSummary,
+    PdfJobResponse,
+    PdfBatchRequest,
+    PdfBatchJobResponse,
+)
+from app.schemas.template import (
+    ChecklistTemplateCreate,
+    ChecklistTemplateResponse,
+    ChecklistTemplateListResponse,
+    ChecklistTemplateCategoryCreate,
+    ChecklistTemplateCategoryResponse,
+    ChecklistTemplateItemCreate,
+    ChecklistTemplateItemResponse,
+)
+from app.schemas.sync import (
+    SyncReport,
+    SyncCategory,
+    SyncItem,
+    SyncDeleted,
+    SyncResponse,
+    SyncReportChange,
+    SyncItemChange,
+    SyncPush,
+    SyncPushResult,
+)
+from app.schemas.dashboard import (
+    DashboardStats,
+    DashboardMonthCount,
+    DashboardInspectorCount,
 )
 
 __all__ = [
@@ -50,6 +83,8 @@ __all__ = [
     "ClientResponsibleResponse",
     "ClientCollaboratorsCreate",
     "ClientCollaboratorsResponse",
+    "ClientImportRowResult",
+    "ClientImportResult",
     "ReportBase",
     "ReportCreate",
     "ReportUpdate",
@@ -59,5 +94,30 @@ __all__ = [
     "ChecklistCategoryResponse",
     "ChecklistItemCreate",
     "ChecklistItemUpdate",
+    "ChecklistItemBatchUpdate",
+    "ChecklistItemBatchResult",
     "ChecklistItemResponse",
+    "ChecklistSummary",
+    "PdfJobResponse",
+    "PdfBatchRequest",
+    "PdfBatchJobResponse",
+    "ChecklistTemplateCreate",
+    "ChecklistTemplateResponse",
+    "ChecklistTemplateListResponse",
+    "ChecklistTemplateCategoryCreate",
+    "ChecklistTemplateCategoryResponse",
+    "ChecklistTemplateItemCreate",
+    "ChecklistTemplateItemResponse",
+    "SyncReport",
+    "SyncCategory",
+    "SyncItem",
+    "SyncDeleted",
+    "SyncResponse",
+    "SyncReportChange",
+    "SyncItemChange",
+    "SyncPush",
+    "SyncPushResult",
+    "DashboardStats",
+    "DashboardMonthCount",
+    "DashboardInspectorCount",
 ]
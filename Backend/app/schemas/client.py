@@ -130,3 +130,23 @@ class ClientListResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# ===== Importação =====
+class ClientImportRowResult(BaseModel):
+    """Resultado de uma linha da importação"""
+    linha: int
+    cnpj: Optional[str] = None
+    sucesso: bool
+    cliente_id: Optional[int] = None
+    acao: Optional[str] = None  # "criado" ou "atualizado"
+    erros: List[str] = []
+
+
+class ClientImportResult(BaseModel):
+    """Relatório da importação de clientes"""
+    total_linhas: int
+    criados: int
+    atualizados: int
+    com_erro: int
+    linhas: List[ClientImportRowResult]
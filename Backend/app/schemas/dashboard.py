@@ -0,0 +1,30 @@
+from pydantic import BaseModel
+from typing import Dict, List
+
+from app.schemas.report import ChecklistSummary
+
+
+class DashboardMonthCount(BaseModel):
+    """Relatórios criados em um mês (AAAA-MM)"""
+    mes: str
+    total: int
+
+
+class DashboardInspectorCount(BaseModel):
+    """Relatórios de um responsável pela inspeção"""
+    responsavel_id: int
+    nome: str
+    total: int
+
+
+class DashboardStats(BaseModel):
+    """Estatísticas do dashboard"""
+    user_name: str
+    total_clients: int
+    total_reports: int
+    checklist_summary: ChecklistSummary
+    taxa_conformidade: float  # conformes / (conformes + não conformes), em %
+    relatorios_por_status: Dict[str, int]
+    relatorios_por_mes: List[DashboardMonthCount]
+    relatorios_por_inspetor: List[DashboardInspectorCount]
+    relatorios_por_categoria_cliente: Dict[str, int]
@@ -1,7 +1,7 @@
-from pydantic import BaseModel, Field
-from datetime import datetime
+from pydantic import BaseModel, Field, AliasChoices, model_validator
+from datetime import date, datetime
 from typing import Optional, List
-from app.models.report import ReportStatus, ChecklistResponse
+from app.models.report import ReportStatus, ChecklistResponse, PdfJobStatus, PdfBatchFormat
 
 
 # ===== Checklist Item =====
@@ -25,10 +25,25 @@ class ChecklistItemUpdate(BaseModel):
     observacoes: Optional[str] = None
 
 
+class ChecklistItemBatchUpdate(ChecklistItemUpdate):
+    """Schema de um item na atualização em lote"""
+    item_id: int
+
+
+class ChecklistItemBatchResult(BaseModel):
+    """Resultado da atualização de um item no lote"""
+    item_id: int
+    sucesso: bool
+    erro: Optional[str] = None
+
+
 class ChecklistItemResponse(ChecklistItemBase):
     """Schema de resposta do item de checklist"""
     id: int
     categoria_id: int
+    template_item_id: Optional[int] = None
+    # Itens criados a partir de template não copiam a descrição
+    descricao: str = Field(..., validation_alias=AliasChoices("descricao_resolvida", "descricao"))
 
     class Config:
         from_attributes = True
@@ -76,7 +91,12 @@ class ReportBase(BaseModel):
 
 
 class ReportCreate(ReportBase):
-    """Schema para criar relatório"""
+    """
+    Schema para criar relatório
+    Informe `template_id` para montar o checklist a partir de um template
+    ou envie as `categorias` completas
+    """
+    template_id: Optional[int] = None
     categorias: List[ChecklistCategoryCreate] = []
 
 
@@ -114,3 +134,57 @@ class ReportListResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# ===== Resumo do Checklist =====
+class ChecklistSummary(BaseModel):
+    """Contagem das respostas do checklist (percentuais sobre o total de itens)"""
+    total_itens: int
+    conforme: int
+    nao_conforme: int
+    na: int
+    sem_resposta: int
+    percentual_conforme: int
+    percentual_nao_conforme: int
+    percentual_na: int
+
+
+# ===== PDF Job =====
+class PdfJobResponse(BaseModel):
+    """Schema de resposta do job de geração de PDF"""
+    job_id: str
+    relatorio_id: int
+    status: PdfJobStatus
+    criado_em: datetime
+    erro: Optional[str] = None
+
+
+class PdfBatchRequest(BaseModel):
+    """Schema para gerar os PDFs de vários relatórios (lista de IDs ou filtros)"""
+    relatorio_ids: Optional[List[int]] = Field(None, min_length=1)
+    cliente_id: Optional[int] = None
+    data_inicio: Optional[date] = None
+    data_fim: Optional[date] = None
+    status: Optional[ReportStatus] = None
+    formato: PdfBatchFormat = PdfBatchFormat.ZIP
+
+    @model_validator(mode="after")
+    def _check_selection(self):
+        if not self.relatorio_ids and not self.cliente_id:
+            raise ValueError("Informe relatorio_ids ou cliente_id")
+        if self.data_inicio and self.data_fim and self.data_fim < self.data_inicio:
+            raise ValueError("data_fim deve ser igual ou posterior a data_inicio")
+        return self
+
+
+class PdfBatchJobResponse(BaseModel):
+    """Schema de resposta do job de PDFs em lote (com progresso)"""
+    job_id: str
+    formato: PdfBatchFormat
+    status: PdfJobStatus
+    total: int
+    concluidos: int
+    percentual: int
+    relatorio_ids: List[int]
+    criado_em: datetime
+    erro: Optional[str] = None
@@ -0,0 +1,101 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Optional, List, Union
+from app.models.report import ReportStatus, ChecklistResponse
+
+
+# ===== Pull (GET /sync) =====
+class SyncReport(BaseModel):
+    """Relatório alterado (sem a árvore do checklist)"""
+    id: int
+    descricao: str
+    cliente_id: int
+    categoria: Optional[str] = None
+    responsavel_inspecao_id: int
+    status: ReportStatus
+    data_agendada: Optional[datetime] = None
+    criado_em: Optional[datetime] = None
+    finalizado_em: Optional[datetime] = None
+    versao: int
+
+
+class SyncCategory(BaseModel):
+    """Categoria de checklist alterada"""
+    id: int
+    relatorio_id: int
+    nome: str
+    ordem: int
+    versao: int
+
+
+class SyncItem(BaseModel):
+    """Item de checklist alterado (descrição já resolvida pelo template)"""
+    id: int
+    categoria_id: int
+    template_item_id: Optional[int] = None
+    codigo: str
+    descricao: str
+    resposta: Optional[ChecklistResponse] = None
+    observacoes: Optional[str] = None
+    ordem: int
+    versao: int
+
+
+class SyncDeleted(BaseModel):
+    """IDs excluídos no servidor"""
+    relatorios: List[int] = []
+    categorias: List[int] = []
+    itens: List[int] = []
+
+
+class SyncResponse(BaseModel):
+    """
+    Alterações desde o token informado
+    Envie `token` no próximo GET /sync; com `mais` = true ainda há alterações
+    """
+    token: int
+    mais: bool
+    relatorios: List[SyncReport] = []
+    categorias: List[SyncCategory] = []
+    itens: List[SyncItem] = []
+    excluidos: SyncDeleted = SyncDeleted()
+
+
+# ===== Push (POST /sync) =====
+class SyncReportChange(BaseModel):
+    """Alteração offline de um relatório"""
+    id: int
+    versao_base: int = Field(..., ge=0, description="Versão do relatório na última sincronização")
+    descricao: Optional[str] = Field(None, max_length=255)
+    categoria: Optional[str] = None
+    status: Optional[ReportStatus] = None
+    forcar: bool = False  # Sobrescreve mesmo se houve alteração no servidor
+
+
+class SyncItemChange(BaseModel):
+    """Alteração offline de um item de checklist"""
+    id: int
+    versao_base: int = Field(..., ge=0, description="Versão do item na última sincronização")
+    resposta: Optional[ChecklistResponse] = None
+    observacoes: Optional[str] = None
+    forcar: bool = False  # Sobrescreve mesmo se houve alteração no servidor
+
+
+class SyncPush(BaseModel):
+    """Fila de alterações feitas offline, aplicadas em uma transação"""
+    relatorios: List[SyncReportChange] = []
+    itens: List[SyncItemChange] = []
+
+
+class SyncPushResult(BaseModel):
+    """
+    Resultado de uma alteração enviada
+    Em conflito, `atual` traz o registro como está no servidor
+    """
+    tabela: str
+    id: int
+    sucesso: bool
+    conflito: bool = False
+    versao: Optional[int] = None
+    erro: Optional[str] = None
+    atual: Optional[Union[SyncReport, SyncItem]] = None
@@ -0,0 +1,85 @@
+from pydantic import BaseModel, Field
+from datetime import datetime
+from typing import Optional, List
+
+
+# ===== Template Item =====
+class ChecklistTemplateItemBase(BaseModel):
+    """Schema base do item de template"""
+    codigo: str = Field(..., max_length=20)
+    descricao: str
+    ordem: int = Field(..., ge=1)
+
+
+class ChecklistTemplateItemCreate(ChecklistTemplateItemBase):
+    """Schema para criar item de template"""
+    pass
+
+
+class ChecklistTemplateItemResponse(ChecklistTemplateItemBase):
+    """Schema de resposta do item de template"""
+    id: int
+    categoria_id: int
+
+    class Config:
+        from_attributes = True
+
+
+# ===== Template Category =====
+class ChecklistTemplateCategoryBase(BaseModel):
+    """Schema base da categoria de template"""
+    nome: str = Field(..., max_length=255)
+    ordem: int = Field(..., ge=1)
+
+
+class ChecklistTemplateCategoryCreate(ChecklistTemplateCategoryBase):
+    """Schema para criar categoria de template"""
+    itens: List[ChecklistTemplateItemCreate] = []
+
+
+class ChecklistTemplateCategoryResponse(ChecklistTemplateCategoryBase):
+    """Schema de resposta da categoria de template"""
+    id: int
+    template_id: int
+    itens: List[ChecklistTemplateItemResponse] = []
+
+    class Config:
+        from_attributes = True
+
+
+# ===== Template =====
+class ChecklistTemplateBase(BaseModel):
+    """Schema base do template de checklist"""
+    nome: str = Field(..., min_length=1, max_length=255)
+    descricao: Optional[str] = Field(None, max_length=255)
+
+
+class ChecklistTemplateCreate(ChecklistTemplateBase):
+    """
+    Schema para criar template
+    Se já existir um template com o mesmo nome, uma nova versão é criada
+    """
+    categorias: List[ChecklistTemplateCategoryCreate] = []
+
+
+class ChecklistTemplateResponse(ChecklistTemplateBase):
+    """Schema de resposta completa do template"""
+    id: int
+    versao: int
+    ativo: bool
+    criado_em: datetime
+    categorias: List[ChecklistTemplateCategoryResponse] = []
+
+    class Config:
+        from_attributes = True
+
+
+class ChecklistTemplateListResponse(ChecklistTemplateBase):
+    """Schema para lista simplificada de templates"""
+    id: int
+    versao: int
+    ativo: bool
+    criado_em: datetime
+
+    class Config:
+        from_attributes = True
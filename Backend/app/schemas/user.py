@@ -62,3 +62,4 @@ class Token(BaseModel):
 class TokenData(BaseModel):
     """Schema para dados dentro do token"""
     email: Optional[str] = None
+    user_id: Optional[int] = None
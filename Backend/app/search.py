@@ -0,0 +1,73 @@
+"""
+Índice de busca de clientes
+
+- Nome fantasia: normalizado sem acentos e em minúsculas na coluna `nome_busca`.
+  No SQLite é indexado em uma tabela FTS5 (mantida por triggers); no PostgreSQL
+  em um índice trigram (pg_trgm), que atende buscas por trecho com ILIKE.
+- CNPJ: somente dígitos na coluna `cnpj_digitos`, buscado por prefixo como um
+  intervalo (>= prefixo, < próximo prefixo), o que usa o índice B-tree.
+
+As colunas e os índices são criados pela migração 0004 do Alembic.
+"""
+import re
+
+from sqlalchemy import Integer, column, text, and_, false
+from sqlalchemy.engine import Engine
+
+from app.models.client import Client
+from app.text_utils import normalize_text, only_digits
+
+_fts_enabled = False
+
+# Termo de busca formado apenas por dígitos e pontuação de CNPJ
+_CNPJ_SEARCH = re.compile(r"^[\d./\-\s]+$")
+
+
+def _escape_like(value: str) -> str:
+    """Escapa os curingas do LIKE (com escape='\\')"""
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def init_search_index(engine: Engine):
+    """
+    Verifica se o índice FTS5 existe (chamado na inicialização da aplicação)
+    O índice é criado pela migração; sem ele a busca usa LIKE em nome_busca
+    """
+    global _fts_enabled
+
+    if engine.dialect.name != "sqlite":
+        return
+
+    with engine.connect() as conn:
+        _fts_enabled = conn.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'clients_fts'"
+        )).first() is not None
+
+
+def client_search_filter(search: str):
+    """
+    Monta o filtro da busca de clientes
+    Termos só com dígitos/pontuação buscam pelo prefixo do CNPJ; os demais, pelo nome
+    """
+    if _CNPJ_SEARCH.match(search):
+        digitos = only_digits(search)
+        if digitos:
+            # Intervalo [prefixo, próximo prefixo): ex. "1234" -> >= "1234" e < "1235"
+            proximo = digitos[:-1] + chr(ord(digitos[-1]) + 1)
+            return and_(Client.cnpj_digitos >= digitos, Client.cnpj_digitos < proximo)
+
+    termo = normalize_text(search)
+    tokens = re.findall(r"\w+", termo)
+    if not tokens:
+        return false()
+
+    if _fts_enabled:
+        # Cada palavra como prefixo: "sao jo" encontra "São João"
+        match = " ".join(f'"{token}"*' for token in tokens)
+        fts_ids = text("SELECT rowid FROM clients_fts WHERE clients_fts MATCH :match").bindparams(
+            match=match
+        ).columns(column("rowid", Integer))
+        return Client.id.in_(fts_ids)
+
+    # PostgreSQL (índice trigram) ou fallback: % e _ do termo são literais, como no FTS5
+    return Client.nome_busca.ilike(f"%{_escape_like(termo)}%", escape="\\")
@@ -0,0 +1,304 @@
+"""
+Sincronização incremental dos relatórios (tablets offline)
+
+Cada escrita em reports, checklist_categories e checklist_items registra a linha em
+sync_changes com uma nova versão (AUTOINCREMENT). O registro é compactado: guarda só
+a última alteração de cada linha, então cresce com o número de registros e não com
+o de escritas. Os triggers rodam na mesma transação da escrita, inclusive nos
+inserts/updates em lote que não passam pelos eventos do ORM.
+
+O token da sincronização é a maior versão já recebida pelo cliente. No SQLite as
+escritas são serializadas, portanto as versões crescem na ordem dos commits.
+
+As escritas em clients, client_responsibles e client_collaborators também são
+registradas (uma linha por cliente), mas não entram na sincronização: servem de
+versão para os ETags de GET /clients/{id} e GET /reports/{id}.
+
+A tabela e os triggers (só no SQLite) são criados pelas migrações 0007 (relatórios)
+e 0008 (clientes) do Alembic; sem os triggers a sincronização incremental e os ETags
+ficam indisponíveis.
+"""
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import func, select, text, update
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.models import Client, Report, ChecklistCategory, ChecklistItem, ChecklistTemplateItem, ReportStatus, SyncChange
+from app.schemas.sync import (
+    SyncReport,
+    SyncCategory,
+    SyncItem,
+    SyncDeleted,
+    SyncResponse,
+    SyncPush,
+    SyncPushResult,
+)
+
+# Nome de cada tabela no registro e na API
+RELATORIOS = "relatorios"
+CATEGORIAS = "categorias"
+ITENS = "itens"
+
+# Registrado pelos triggers da migração 0008 (versão dos clientes para os ETags)
+CLIENTES = "clientes"
+
+_sync_enabled = False
+
+
+def init_sync(engine: Engine):
+    """
+    Verifica se os triggers do registro de alterações existem (chamado na inicialização da aplicação)
+    """
+    global _sync_enabled
+
+    if engine.dialect.name != "sqlite":
+        return
+
+    with engine.connect() as conn:
+        _sync_enabled = conn.execute(text(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'sync_checklist_items_ad'"
+        )).first() is not None
+
+
+def sync_enabled() -> bool:
+    return _sync_enabled
+
+
+# ===== Versões para os ETags =====
+
+def report_version(db: Session, report_id: int) -> Optional[Tuple[int, int, ReportStatus]]:
+    """
+    Versão do relatório (maior versão entre ele, as categorias e os itens), versão do
+    cliente e status, em uma única consulta
+    None se o relatório não existe ou o registro de alterações está indisponível
+    """
+    if not _sync_enabled:
+        return None
+
+    versao = (
+        select(func.max(SyncChange.versao))
+        .where(SyncChange.relatorio_id == Report.id)
+        .scalar_subquery()
+    )
+    versao_cliente = (
+        select(SyncChange.versao)
+        .where(SyncChange.tabela == CLIENTES, SyncChange.registro_id == Report.cliente_id)
+        .scalar_subquery()
+    )
+    row = db.execute(select(versao, versao_cliente, Report.status).where(Report.id == report_id)).first()
+    return (row[0] or 0, row[1] or 0, row[2]) if row else None
+
+
+def client_version(db: Session, client_id: int) -> Optional[int]:
+    """
+    Versão do cliente (inclui responsáveis e colaboradores)
+    None se o cliente não existe ou o registro de alterações está indisponível
+    """
+    if not _sync_enabled:
+        return None
+
+    versao = (
+        select(SyncChange.versao)
+        .where(SyncChange.tabela == CLIENTES, SyncChange.registro_id == Client.id)
+        .scalar_subquery()
+    )
+    row = db.execute(select(versao).where(Client.id == client_id)).first()
+    return (row[0] or 0) if row else None
+
+
+# ===== Leitura das linhas =====
+
+def _report_rows(db: Session, ids) -> Dict[int, dict]:
+    stmt = select(
+        Report.id,
+        Report.descricao,
+        Report.cliente_id,
+        Report.categoria,
+        Report.responsavel_inspecao_id,
+        Report.status,
+        Report.data_agendada,
+        Report.criado_em,
+        Report.finalizado_em,
+    ).where(Report.id.in_(ids))
+    return {row.id: dict(row._mapping) for row in db.execute(stmt)}
+
+
+def _category_rows(db: Session, ids) -> Dict[int, dict]:
+    stmt = select(
+        ChecklistCategory.id,
+        ChecklistCategory.relatorio_id,
+        ChecklistCategory.nome,
+        ChecklistCategory.ordem,
+    ).where(ChecklistCategory.id.in_(ids))
+    return {row.id: dict(row._mapping) for row in db.execute(stmt)}
+
+
+def _item_rows(db: Session, ids) -> Dict[int, dict]:
+    stmt = (
+        select(
+            ChecklistItem.id,
+            ChecklistItem.categoria_id,
+            ChecklistItem.template_item_id,
+            ChecklistItem.codigo,
+            # Itens criados a partir de template só referenciam o texto
+            func.coalesce(ChecklistItem.descricao, ChecklistTemplateItem.descricao, "").label("descricao"),
+            ChecklistItem.resposta,
+            ChecklistItem.observacoes,
+            ChecklistItem.ordem,
+        )
+        .outerjoin(ChecklistTemplateItem, ChecklistItem.template_item_id == ChecklistTemplateItem.id)
+        .where(ChecklistItem.id.in_(ids))
+    )
+    return {row.id: dict(row._mapping) for row in db.execute(stmt)}
+
+
+def load_changes(db: Session, since: int, relatorio_id: Optional[int] = None, limit: int = 1000) -> SyncResponse:
+    """
+    Linhas alteradas depois da versão `since`, em ordem de versão, até `limit` alterações
+    Com relatorio_id, só as do relatório (inclusive as categorias e itens)
+    """
+    stmt = select(
+        SyncChange.versao, SyncChange.tabela, SyncChange.registro_id, SyncChange.excluido
+    ).where(SyncChange.versao > since, SyncChange.tabela.in_((RELATORIOS, CATEGORIAS, ITENS)))
+    if relatorio_id is not None:
+        stmt = stmt.where(SyncChange.relatorio_id == relatorio_id)
+    changes = db.execute(stmt.order_by(SyncChange.versao).limit(limit + 1)).all()
+
+    mais = len(changes) > limit
+    changes = changes[:limit]
+
+    excluidos = SyncDeleted()
+    versoes: Dict[str, Dict[int, int]] = {RELATORIOS: {}, CATEGORIAS: {}, ITENS: {}}
+    for versao, tabela, registro_id, excluido in changes:
+        if excluido:
+            getattr(excluidos, tabela).append(registro_id)
+        else:
+            versoes[tabela][registro_id] = versao
+
+    # Uma consulta por tabela; a ordem segue a das versões
+    relatorios = _report_rows(db, list(versoes[RELATORIOS])) if versoes[RELATORIOS] else {}
+    categorias = _category_rows(db, list(versoes[CATEGORIAS])) if versoes[CATEGORIAS] else {}
+    itens = _item_rows(db, list(versoes[ITENS])) if versoes[ITENS] else {}
+
+    return SyncResponse(
+        token=changes[-1].versao if changes else since,
+        mais=mais,
+        # Linhas excluídas depois da leitura do registro chegam como exclusão na próxima sincronização
+        relatorios=[
+            SyncReport(**relatorios[registro_id], versao=versao)
+            for registro_id, versao in versoes[RELATORIOS].items() if registro_id in relatorios
+        ],
+        categorias=[
+            SyncCategory(**categorias[registro_id], versao=versao)
+            for registro_id, versao in versoes[CATEGORIAS].items() if registro_id in categorias
+        ],
+        itens=[
+            SyncItem(**itens[registro_id], versao=versao)
+            for registro_id, versao in versoes[ITENS].items() if registro_id in itens
+        ],
+        excluidos=excluidos,
+    )
+
+
+# ===== Envio das alterações offline =====
+
+def _current_versions(db: Session, tabela: str, ids) -> Dict[int, Tuple[int, bool, Optional[int]]]:
+    """registro_id -> (versão, excluído, relatório) no registro de alterações"""
+    stmt = select(
+        SyncChange.registro_id, SyncChange.versao, SyncChange.excluido, SyncChange.relatorio_id
+    ).where(SyncChange.tabela == tabela, SyncChange.registro_id.in_(ids))
+    return {registro_id: (versao, excluido, relatorio) for registro_id, versao, excluido, relatorio in db.execute(stmt)}
+
+
+def _check_changes(tabela: str, nome: str, changes, rows: Dict[int, dict], versions, schema):
+    """
+    Separa as alterações aplicáveis das com erro ou conflito
+    Conflito: o registro mudou no servidor depois da versão que o cliente conhecia
+    Retorna o resultado de cada alteração (None nas aplicáveis) e as aplicáveis
+    """
+    results: List[Optional[SyncPushResult]] = []
+    accepted = []
+    for change in changes:
+        versao, excluido, _ = versions.get(change.id, (0, False, None))
+        row = rows.get(change.id)
+        if row is None:
+            results.append(SyncPushResult(
+                tabela=tabela, id=change.id, sucesso=False, conflito=excluido,
+                erro=f"{nome} excluído no servidor" if excluido else f"{nome} não encontrado",
+            ))
+        elif versao > change.versao_base and not change.forcar:
+            results.append(SyncPushResult(
+                tabela=tabela, id=change.id, sucesso=False, conflito=True, versao=versao,
+                erro=f"{nome} alterado no servidor depois da última sincronização",
+                atual=schema(**row, versao=versao),
+            ))
+        else:
+            results.append(None)
+            accepted.append((change, row))
+    return results, accepted
+
+
+def _change_values(change) -> dict:
+    """Mesma regra dos endpoints de edição: só atualiza o que foi enviado"""
+    return change.model_dump(exclude={"id", "versao_base", "forcar"}, exclude_none=True)
+
+
+def apply_changes(db: Session, push: SyncPush) -> Tuple[List[SyncPushResult], List[int]]:
+    """
+    Aplica as alterações sem conflito em uma única transação
+    Retorna o resultado de cada alteração (na ordem enviada) e os relatórios alterados
+    """
+    report_ids = [change.id for change in push.relatorios]
+    item_ids = [change.id for change in push.itens]
+    report_rows = _report_rows(db, report_ids) if report_ids else {}
+    item_rows = _item_rows(db, item_ids) if item_ids else {}
+    versions = {
+        RELATORIOS: _current_versions(db, RELATORIOS, report_ids) if report_ids else {},
+        ITENS: _current_versions(db, ITENS, item_ids) if item_ids else {},
+    }
+
+    report_results, reports_ok = _check_changes(
+        RELATORIOS, "Relatório", push.relatorios, report_rows, versions[RELATORIOS], SyncReport
+    )
+    item_results, items_ok = _check_changes(ITENS, "Item", push.itens, item_rows, versions[ITENS], SyncItem)
+
+    report_updates = []
+    for change, row in reports_ok:
+        values = _change_values(change)
+        if values.get("status") == ReportStatus.CONCLUIDO and not row["finalizado_em"]:
+            values["finalizado_em"] = datetime.utcnow()
+        if values:
+            report_updates.append({"id": change.id, **values})
+
+    item_updates = []
+    for change, _ in items_ok:
+        values = _change_values(change)
+        if values:
+            item_updates.append({"id": change.id, **values})
+
+    if report_updates:
+        db.execute(update(Report), report_updates)
+        # Novas versões (geradas pelos triggers) para o cliente guardar
+        versions[RELATORIOS].update(_current_versions(db, RELATORIOS, [values["id"] for values in report_updates]))
+    if item_updates:
+        db.execute(update(ChecklistItem), item_updates)
+        versions[ITENS].update(_current_versions(db, ITENS, [values["id"] for values in item_updates]))
+    db.commit()
+
+    results = []
+    for tabela, changes, partial in (
+        (RELATORIOS, push.relatorios, report_results),
+        (ITENS, push.itens, item_results),
+    ):
+        for change, result in zip(changes, partial):
+            if result is None:
+                result = SyncPushResult(
+                    tabela=tabela, id=change.id, sucesso=True, versao=versions[tabela][change.id][0]
+                )
+            results.append(result)
+
+    changed_reports = {values["id"] for values in report_updates}
+    changed_reports |= {versions[ITENS][values["id"]][2] for values in item_updates}
+    return results, sorted(report_id for report_id in changed_reports if report_id is not None)
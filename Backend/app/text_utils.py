@@ -0,0 +1,22 @@
+"""
+Normalização de textos usados em buscas
+"""
+import re
+import unicodedata
+from typing import Optional
+
+
+def normalize_text(value: Optional[str]) -> Optional[str]:
+    """Remove acentos, converte para minúsculas e normaliza espaços"""
+    if value is None:
+        return None
+    decomposed = unicodedata.normalize("NFKD", value)
+    without_accents = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(without_accents.lower().split())
+
+
+def only_digits(value: Optional[str]) -> Optional[str]:
+    """Mantém apenas os dígitos (ex: CNPJ sem pontuação)"""
+    if value is None:
+        return None
+    return re.sub(r"\D", "", value)
@@ -0,0 +1,79 @@
+"""
+Benchmark de requisições concorrentes: sessão síncrona (threadpool) vs. AsyncSession
+Cada modo roda em um processo separado, pois DB_ASYNC é lido na importação
+Execute (no diretório Backend/): python -m benchmarks.bench_async_db [requisições concorrentes]
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+CONCORRENCIA = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+RODADAS = 3
+
+
+async def run_mode():
+    """Executado no processo filho, com DATABASE_URL e DB_ASYNC já definidos"""
+    import httpx
+    from app.main import app
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        await client.post("/auth/register", json={"nome": "Bench", "email": "bench@example.com", "senha": "123456"})
+        token = (await client.post(
+            "/auth/login-json", json={"email": "bench@example.com", "senha": "123456"}
+        )).json()["access_token"]
+        headers = {"Authorization": f"Bearer {token}"}
+
+        cliente = (await client.post("/clients/", headers=headers, json={
+            "status": "ativo", "nome_fantasia": "Bench", "categoria": "restaurante",
+            "razao_social": "Bench Ltda", "cnpj": "00.000.000/0001-00",
+        })).json()
+        categorias = [
+            {"nome": f"Categoria {c}", "ordem": c + 1, "itens": [
+                {"codigo": f"{c}.{i}", "descricao": "Item de verificação", "ordem": i + 1} for i in range(10)
+            ]}
+            for c in range(5)
+        ]
+        report = (await client.post("/reports/", headers=headers, json={
+            "descricao": "Bench", "cliente_id": cliente["id"], "responsavel_inspecao_id": 1,
+            "categorias": categorias,
+        })).json()
+
+        melhor = 0.0
+        for _ in range(RODADAS):
+            inicio = time.perf_counter()
+            respostas = await asyncio.gather(*[
+                client.get(f"/reports/{report['id']}", headers=headers) for _ in range(CONCORRENCIA)
+            ])
+            duracao = time.perf_counter() - inicio
+            assert all(r.status_code == 200 for r in respostas)
+            melhor = max(melhor, CONCORRENCIA / duracao)
+    print(f"{melhor:.0f}")
+
+
+def main():
+    print(f"{CONCORRENCIA} GET /reports/{{id}} concorrentes (melhor de {RODADAS})")
+    for modo in ("false", "true"):
+        with tempfile.TemporaryDirectory() as tmp:
+            env = dict(
+                os.environ,
+                DB_ASYNC=modo,
+                DATABASE_URL=f"sqlite:///{os.path.join(tmp, 'bench.db')}",
+                BENCH_CHILD="1",
+            )
+            saida = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_async_db", str(CONCORRENCIA)],
+                env=env, capture_output=True, text=True, check=True,
+            ).stdout.strip().splitlines()[-1]
+        nome = "AsyncSession (DB_ASYNC=true)" if modo == "true" else "Session + threadpool"
+        print(f"{nome:<30} {saida:>6} req/s")
+
+
+if __name__ == "__main__":
+    if os.getenv("BENCH_CHILD"):
+        asyncio.run(run_mode())
+    else:
+        main()
@@ -0,0 +1,98 @@
+"""
+Importação de clientes: um POST /clients por cliente x importação em lote
+Usa um banco SQLite em arquivo com as migrações aplicadas (índice de busca e
+contadores do dashboard mantidos por triggers, como em produção)
+Execute (no diretório Backend/): python -m benchmarks.bench_client_import
+"""
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.client_import import import_clients
+from app.migrations import upgrade_database
+from app.routers.clients import _create_client
+from app.schemas import ClientCreate
+
+TAMANHOS = [100, 500, 2000]
+
+
+def build_records(total: int, inicio: int = 0):
+    def cnpj(n: int) -> str:
+        s = f"{n:014d}"
+        return f"{s[:2]}.{s[2:5]}.{s[5:8]}/{s[8:12]}-{s[12:]}"
+
+    return [
+        (n + 1, {
+            "status": "ativo",
+            "nome_fantasia": f"Restaurante Franquia Unidade {n}",
+            "categoria": "restaurante",
+            "razao_social": f"Franquia Alimentos Ltda - Filial {n}",
+            "cnpj": cnpj(inicio + n),
+            "email": f"unidade{n}@franquia.com.br",
+            "cidade": "São Paulo",
+            "estado": "SP",
+            "responsaveis": [
+                {"tipo": "responsavel_estabelecimento", "nome_completo": f"Gerente {n}"},
+                {"tipo": "responsavel_tecnico", "nome_completo": f"Nutricionista {n}", "cpf": "000.000.000-00"},
+            ],
+            "colaboradores_info": {"numero_total_colaboradores": 20, "numero_manipuladores_alimentos": 8},
+        })
+        for n in range(total)
+    ]
+
+
+def one_by_one(db, records):
+    """O que o cliente faz hoje: um POST /clients (SELECT do CNPJ, flush e commit) por linha"""
+    for _, record in records:
+        _create_client(db, ClientCreate.model_validate(record))
+
+
+def bulk(db, records):
+    result = import_clients(db, records)
+    assert result.com_erro == 0, result.linhas[:3]
+
+
+def measure(fn, records) -> float:
+    """Tempo (ms) em um banco novo"""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        upgrade_database(engine)
+        db = sessionmaker(bind=engine, autoflush=False)()
+        inicio = time.perf_counter()
+        fn(db, records)
+        ms = (time.perf_counter() - inicio) * 1000
+        db.close()
+        engine.dispose()
+    return ms
+
+
+def measure_upsert(records) -> float:
+    """Tempo (ms) da reimportação do mesmo arquivo (todas as linhas viram UPDATE)"""
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        upgrade_database(engine)
+        db = sessionmaker(bind=engine, autoflush=False)()
+        bulk(db, records)
+        inicio = time.perf_counter()
+        bulk(db, records)
+        ms = (time.perf_counter() - inicio) * 1000
+        db.close()
+        engine.dispose()
+    return ms
+
+
+def main():
+    print(f"{'clientes':>8} | {'um a um (ms)':>12} | {'lote (ms)':>9} | {'ganho':>6} | {'reimportação (ms)':>17}")
+    for total in TAMANHOS:
+        records = build_records(total)
+        antes = measure(one_by_one, records)
+        depois = measure(bulk, records)
+        upsert = measure_upsert(records)
+        print(f"{total:>8} | {antes:>12.0f} | {depois:>9.0f} | {antes / depois:>5.1f}x | {upsert:>17.0f}")
+
+
+if __name__ == "__main__":
+    main()
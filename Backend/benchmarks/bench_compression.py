@@ -0,0 +1,100 @@
+"""
+Compressão de GET /reports/{id} (relatório com 300 itens)
+Para cada Accept-Encoding: tamanho transferido, tempo no servidor (inclui a compressão)
+e tempo total estimado em redes móveis (servidor + transferência na banda indicada)
+Execute (no diretório Backend/): python -m benchmarks.bench_compression
+"""
+import os
+import tempfile
+import time
+
+TMP = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(TMP.name, 'bench.db')}"
+os.environ["PDF_CACHE_DIR"] = os.path.join(TMP.name, "pdf_cache")
+
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import insert  # noqa: E402
+
+from app.database import engine  # noqa: E402
+from app.migrations import upgrade_database  # noqa: E402
+from app.models import (  # noqa: E402
+    Client, Report, ChecklistCategory, ChecklistItem, ClientStatus, ClientCategory, ChecklistResponse,
+)
+
+upgrade_database(engine)
+
+from app.compression import available_encodings  # noqa: E402
+from app.main import app  # noqa: E402
+
+CATEGORIAS = 12
+ITENS_POR_CATEGORIA = 25
+REPETICOES = 50
+# Banda de download (Mbit/s) de uma conexão móvel fraca e de uma típica
+REDES = [("3G", 1.5), ("4G", 10.0)]
+DESCRICOES = [
+    "Os manipuladores higienizam as mãos antes de iniciar as atividades e após qualquer interrupção.",
+    "As superfícies que entram em contato com os alimentos são mantidas íntegras e de fácil higienização.",
+    "Os alimentos preparados são armazenados sob refrigeração em temperatura igual ou inferior a 5 °C.",
+    "O estabelecimento possui Manual de Boas Práticas e POPs acessíveis aos funcionários.",
+]
+RESPOSTAS = [ChecklistResponse.CONFORME, ChecklistResponse.NAO_CONFORME, ChecklistResponse.NA]
+
+
+def populate(client: TestClient) -> dict:
+    client.post("/auth/register", json={"nome": "Inspetor", "email": "inspetor@example.com", "senha": "123456"})
+    token = client.post(
+        "/auth/login-json", json={"email": "inspetor@example.com", "senha": "123456"}
+    ).json()["access_token"]
+    with engine.begin() as conn:
+        conn.execute(insert(Client), [{
+            "status": ClientStatus.ATIVO, "nome_fantasia": "Restaurante Sabor da Terra",
+            "razao_social": "Sabor da Terra Alimentos Ltda", "categoria": ClientCategory.RESTAURANTE,
+            "cnpj": "00.000.000/0001-00", "nome_busca": "restaurante sabor da terra", "cnpj_digitos": "00000000000100",
+        }])
+        conn.execute(insert(Report), [
+            {"id": 1, "descricao": "Inspeção mensal", "cliente_id": 1, "responsavel_inspecao_id": 1}
+        ])
+        conn.execute(insert(ChecklistCategory), [
+            {"id": c + 1, "relatorio_id": 1, "nome": f"Categoria {c + 1}", "ordem": c + 1}
+            for c in range(CATEGORIAS)
+        ])
+        conn.execute(insert(ChecklistItem), [
+            {
+                "categoria_id": c + 1, "codigo": f"{c + 1}.{i + 1}",
+                "descricao": DESCRICOES[(c + i) % len(DESCRICOES)],
+                "resposta": RESPOSTAS[(c * i) % len(RESPOSTAS)],
+                "observacoes": "Verificado no local." if i % 3 == 0 else None,
+                "ordem": i + 1,
+            }
+            for c in range(CATEGORIAS)
+            for i in range(ITENS_POR_CATEGORIA)
+        ])
+    return {"Authorization": f"Bearer {token}"}
+
+
+def main():
+    client = TestClient(app)
+    headers = populate(client)
+
+    print(f"GET /reports/1 ({CATEGORIAS * ITENS_POR_CATEGORIA} itens), codificações disponíveis: {available_encodings()}")
+    print(f"{'Accept-Encoding':>15} | {'bytes':>7} | {'servidor':>8} | " + " | ".join(f"{nome:>10}" for nome, _ in REDES))
+    for accept in ["identity", "gzip", "br"]:
+        request_headers = {**headers, "Accept-Encoding": accept}
+        response = client.get("/reports/1", headers=request_headers)
+        # Tamanho no fio (o TestClient já devolve o corpo descomprimido)
+        tamanho = int(response.headers["content-length"])
+        inicio = time.perf_counter()
+        for _ in range(REPETICOES):
+            client.get("/reports/1", headers=request_headers)
+        servidor = (time.perf_counter() - inicio) * 1000 / REPETICOES
+        totais = [servidor + tamanho * 8 / (mbps * 1000) for _, mbps in REDES]
+        print(f"{response.headers.get('content-encoding', accept):>15} | {tamanho:>7} | {servidor:>5.2f} ms | "
+              + " | ".join(f"{ms:>7.1f} ms" for ms in totais))
+
+    client.close()
+    engine.dispose()
+    TMP.cleanup()
+
+
+if __name__ == "__main__":
+    main()
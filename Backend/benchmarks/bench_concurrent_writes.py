@@ -0,0 +1,103 @@
+"""
+Benchmark de escrita concorrente: atualizações de checklist em paralelo no SQLite
+Compara o engine com as opções padrão do SQLite e com os pragmas de create_db_engine
+Execute (no diretório Backend/): python -m benchmarks.bench_concurrent_writes [threads]
+"""
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy import update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base, create_db_engine, sqlite_pragmas
+from app.models import User, Client, Report, ChecklistItem, ChecklistResponse, ClientStatus, ClientCategory
+from app.routers.reports import insert_checklist
+from benchmarks.bench_report_create import build_checklist
+
+THREADS = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+ATUALIZACOES_POR_THREAD = 200
+RELATORIOS = 20
+CONFIGURACOES = {
+    "padrão (journal DELETE, synchronous FULL)": {},
+    "pragmas do create_db_engine (WAL, NORMAL)": sqlite_pragmas(),
+}
+
+
+def populate(Session) -> list:
+    """Cria relatórios com checklist e devolve os IDs dos itens"""
+    db = Session()
+    user = User(nome="Bench", email="bench@example.com", senha_hash="x")
+    client = Client(
+        status=ClientStatus.ATIVO, nome_fantasia="Bench", categoria=ClientCategory.RESTAURANTE,
+        razao_social="Bench Ltda", cnpj="00000000000000",
+    )
+    db.add_all([user, client])
+    db.flush()
+    for n in range(RELATORIOS):
+        report = Report(descricao=f"Relatório {n}", cliente_id=client.id, responsavel_inspecao_id=user.id)
+        db.add(report)
+        db.flush()
+        insert_checklist(db, report.id, build_checklist(200))
+    db.commit()
+    ids = [item_id for (item_id,) in db.query(ChecklistItem.id)]
+    db.close()
+    return ids
+
+
+def worker(Session, item_ids: list, resultado: dict):
+    """Cada atualização é uma transação (como um PATCH de item)"""
+    rnd = random.Random()
+    respostas = list(ChecklistResponse)
+    for _ in range(ATUALIZACOES_POR_THREAD):
+        db = Session()
+        try:
+            db.execute(
+                update(ChecklistItem)
+                .where(ChecklistItem.id == rnd.choice(item_ids))
+                .values(resposta=rnd.choice(respostas), observacoes="bench")
+            )
+            db.commit()
+            resultado["ok"] += 1
+        except OperationalError:
+            db.rollback()
+            resultado["erros"] += 1
+        finally:
+            db.close()
+
+
+def run(pragmas: dict):
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}", pragmas=pragmas)
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        item_ids = populate(Session)
+
+        resultado = {"ok": 0, "erros": 0}
+        threads = [
+            threading.Thread(target=worker, args=(Session, item_ids, resultado))
+            for _ in range(THREADS)
+        ]
+        inicio = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        duracao = time.perf_counter() - inicio
+        engine.dispose()
+    return resultado["ok"] / duracao, resultado["erros"]
+
+
+def main():
+    print(f"{THREADS} threads x {ATUALIZACOES_POR_THREAD} atualizações")
+    for nome, pragmas in CONFIGURACOES.items():
+        vazao, erros = run(pragmas)
+        print(f"{nome:<45} {vazao:>8.0f} escritas/s  {erros} erros")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+GET /reports/{id} e GET /clients/{id} com e sem If-None-Match
+- 200: carrega o objeto inteiro, monta o schema e serializa
+- 304: só a consulta da versão no registro de alterações
+Execute (no diretório Backend/): python -m benchmarks.bench_conditional_get
+"""
+import os
+import tempfile
+import time
+
+from fastapi import Response
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.migrations import upgrade_database
+from app.models import (
+    User, Client, ClientResponsible, Report, ChecklistCategory, ChecklistItem,
+    ClientStatus, ClientCategory, ResponsibleType,
+)
+from app.routers.clients import _get_client
+from app.routers.reports import _get_report
+from app.sync import init_sync
+
+CATEGORIAS = 12
+ITENS_POR_CATEGORIA = 25
+REPETICOES = 200
+
+
+def populate(engine):
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"nome": "Inspetor", "email": "inspetor@example.com", "senha_hash": "-"}])
+        conn.execute(insert(Client), [{
+            "status": ClientStatus.ATIVO, "nome_fantasia": "Cliente", "razao_social": "Cliente",
+            "categoria": ClientCategory.RESTAURANTE, "cnpj": "00.000.000/0001-00",
+            "nome_busca": "cliente", "cnpj_digitos": "00000000000100",
+        }])
+        conn.execute(insert(ClientResponsible), [
+            {"cliente_id": 1, "tipo": ResponsibleType.RESPONSAVEL_ESTABELECIMENTO, "nome_completo": "Gerente"},
+            {"cliente_id": 1, "tipo": ResponsibleType.RESPONSAVEL_TECNICO, "nome_completo": "Nutricionista"},
+        ])
+        conn.execute(insert(Report), [
+            {"id": 1, "descricao": "Inspeção", "cliente_id": 1, "responsavel_inspecao_id": 1}
+        ])
+        conn.execute(insert(ChecklistCategory), [
+            {"id": c + 1, "relatorio_id": 1, "nome": f"Categoria {c + 1}", "ordem": c + 1}
+            for c in range(CATEGORIAS)
+        ])
+        conn.execute(insert(ChecklistItem), [
+            {
+                "categoria_id": c + 1, "codigo": f"{c + 1}.{i + 1}",
+                "descricao": "O estabelecimento mantém os procedimentos exigidos pela RDC 216.",
+                "ordem": i + 1,
+            }
+            for c in range(CATEGORIAS)
+            for i in range(ITENS_POR_CATEGORIA)
+        ])
+
+
+def request(db, fn, record_id: int, if_none_match=None):
+    """Chama o endpoint como o FastAPI faria e devolve (status, corpo serializado, ETag)"""
+    response = Response()
+    result = fn(db, record_id, response, if_none_match)
+    db.expunge_all()
+    if isinstance(result, Response):
+        return result.status_code, result.body, result.headers["ETag"]
+    return 200, result.model_dump_json().encode(), response.headers["ETag"]
+
+
+def timed(fn) -> float:
+    """Tempo médio (ms) de REPETICOES execuções"""
+    inicio = time.perf_counter()
+    for _ in range(REPETICOES):
+        fn()
+    return (time.perf_counter() - inicio) * 1000 / REPETICOES
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        upgrade_database(engine)
+        populate(engine)
+        init_sync(engine)
+        db = sessionmaker(bind=engine, autoflush=False)()
+
+        for nome, fn in [
+            (f"GET /reports/{{id}} ({CATEGORIAS * ITENS_POR_CATEGORIA} itens)", _get_report),
+            ("GET /clients/{id}", _get_client),
+        ]:
+            _, _, etag = request(db, fn, 1)
+            print(nome)
+            for caso, if_none_match in [("200 (sem If-None-Match)", None), ("304 (If-None-Match)", etag)]:
+                status_code, body, _ = request(db, fn, 1, if_none_match)
+                ms = timed(lambda: request(db, fn, 1, if_none_match))
+                print(f"  {caso:26s} {status_code}  {len(body) / 1024:7.1f} KiB  {ms:6.2f} ms")
+
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
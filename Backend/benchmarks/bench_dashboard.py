@@ -0,0 +1,123 @@
+"""
+Benchmark do dashboard: contadores pré-agregados vs. agregação na hora
+Mede também o custo dos triggers na criação de um relatório com checklist
+Execute (no diretório Backend/): python -m benchmarks.bench_dashboard [relatórios]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+
+from app import dashboard
+from app.database import Base, create_db_engine
+from app.migrations import revision_module
+from app.models import (
+    User, Client, Report, ChecklistCategory, ChecklistItem,
+    ClientStatus, ClientCategory, ReportStatus, ChecklistResponse,
+)
+from app.routers.reports import insert_checklist
+from benchmarks.bench_report_create import build_checklist
+
+RELATORIOS = int(sys.argv[1]) if len(sys.argv) > 1 else 20_000
+ITENS_POR_RELATORIO = 20
+REPETICOES = 5
+
+
+def populate(Session):
+    """Insere usuários, clientes, relatórios e itens em lote (antes dos triggers)"""
+    rnd = random.Random(42)
+    db = Session()
+    db.execute(insert(User), [
+        {"nome": f"Inspetor {n}", "email": f"inspetor{n}@example.com", "senha_hash": "-"} for n in range(20)
+    ])
+    db.execute(insert(Client), [
+        {
+            "status": ClientStatus.ATIVO, "nome_fantasia": f"Cliente {n}", "razao_social": f"Cliente {n}",
+            "categoria": rnd.choice(list(ClientCategory)), "cnpj": f"{n:014d}",
+        }
+        for n in range(500)
+    ])
+    inicio = datetime(2020, 1, 1)
+    db.execute(insert(Report), [
+        {
+            "descricao": f"Relatório {n}", "cliente_id": rnd.randint(1, 500),
+            "responsavel_inspecao_id": rnd.randint(1, 20), "status": rnd.choice(list(ReportStatus)),
+            "criado_em": inicio + timedelta(hours=n),
+        }
+        for n in range(RELATORIOS)
+    ])
+    db.execute(insert(ChecklistCategory), [
+        {"relatorio_id": n + 1, "nome": "Categoria", "ordem": 1} for n in range(RELATORIOS)
+    ])
+    respostas = list(ChecklistResponse) + [None]
+    db.execute(insert(ChecklistItem), [
+        {"categoria_id": n + 1, "codigo": str(i), "descricao": "Item", "ordem": i + 1, "resposta": rnd.choice(respostas)}
+        for n in range(RELATORIOS)
+        for i in range(ITENS_POR_RELATORIO)
+    ])
+    db.commit()
+    db.close()
+
+
+def measure(fn) -> float:
+    tempos = []
+    for _ in range(REPETICOES):
+        inicio = time.perf_counter()
+        fn()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+    return sum(tempos) / len(tempos)
+
+
+def create_report(Session, checklist) -> None:
+    db = Session()
+    report = Report(descricao="Benchmark", cliente_id=1, responsavel_inspecao_id=1)
+    db.add(report)
+    db.flush()
+    insert_checklist(db, report.id, checklist)
+    db.commit()
+    db.close()
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        populate(Session)
+        checklist = build_checklist(200)
+
+        sem_triggers = measure(lambda: create_report(Session, checklist))
+
+        inicio = time.perf_counter()
+        with engine.begin() as conn:
+            revision_module("0005").create_dashboard_triggers(conn)
+        carga = (time.perf_counter() - inicio) * 1000
+
+        com_triggers = measure(lambda: create_report(Session, checklist))
+
+        def load(enabled: bool):
+            dashboard._counters_enabled = enabled
+            db = Session()
+            dashboard.load_dashboard(db, "Benchmark")
+            db.close()
+
+        ao_vivo = measure(lambda: load(False))
+        contadores = measure(lambda: load(True))
+        dashboard._counters_enabled = True
+        engine.dispose()
+
+    print(f"{RELATORIOS} relatórios, {RELATORIOS * ITENS_POR_RELATORIO} itens")
+    print(f"dashboard agregando na hora:      {ao_vivo:8.2f} ms")
+    print(f"dashboard com contadores:         {contadores:8.2f} ms")
+    print(f"carga inicial dos contadores:     {carga:8.2f} ms (uma vez)")
+    print(f"criar relatório (200 itens) sem triggers: {sem_triggers:6.2f} ms")
+    print(f"criar relatório (200 itens) com triggers: {com_triggers:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
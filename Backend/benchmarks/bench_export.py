@@ -0,0 +1,154 @@
+"""
+Exportação dos itens de checklist: streaming (CSV/XLSX) x GET /reports/{id} um a um
+Mede tempo e pico de memória (tracemalloc) para duas quantidades de relatórios:
+no streaming o pico não deve crescer com o volume
+Execute (no diretório Backend/): python -m benchmarks.bench_export [relatórios]
+"""
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+
+# O gerador da exportação usa a SessionLocal da aplicação: aponta para um banco temporário
+TMP = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(TMP.name, 'bench.db')}"
+
+from sqlalchemy import insert, select  # noqa: E402
+from sqlalchemy.dialects import sqlite  # noqa: E402
+
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models import (  # noqa: E402
+    User, Client, Report, ChecklistCategory, ChecklistItem,
+    ClientStatus, ClientCategory, ReportStatus, ChecklistResponse,
+)
+from app.export import ExportFormat, items_statement, report_ids_statement, stream_export  # noqa: E402
+from app.routers.reports import get_report_tree  # noqa: E402
+from app.schemas import ReportResponse  # noqa: E402
+
+RELATORIOS = int(sys.argv[1]) if len(sys.argv) > 1 else 2_000
+CATEGORIAS_POR_RELATORIO = 4
+ITENS_POR_CATEGORIA = 25
+RESPOSTAS = [ChecklistResponse.CONFORME, ChecklistResponse.NAO_CONFORME, ChecklistResponse.NA, None]
+
+
+def populate(inicio_id: int, quantidade: int):
+    db = SessionLocal()
+    inicio = datetime(2024, 1, 1)
+    db.execute(insert(Report), [
+        {
+            "id": n, "descricao": f"Relatório {n}", "cliente_id": 1, "responsavel_inspecao_id": 1,
+            "status": ReportStatus.CONCLUIDO, "criado_em": inicio + timedelta(hours=n),
+        }
+        for n in range(inicio_id, inicio_id + quantidade)
+    ])
+    db.execute(insert(ChecklistCategory), [
+        {"id": n * 10 + c, "relatorio_id": n, "nome": f"Categoria {c}", "ordem": c + 1}
+        for n in range(inicio_id, inicio_id + quantidade)
+        for c in range(CATEGORIAS_POR_RELATORIO)
+    ])
+    db.execute(insert(ChecklistItem), [
+        {
+            "categoria_id": n * 10 + c, "codigo": f"{c + 1}.{i + 1}", "descricao": f"Item {i} da categoria {c}",
+            "resposta": RESPOSTAS[(n + i) % len(RESPOSTAS)], "ordem": i + 1,
+        }
+        for n in range(inicio_id, inicio_id + quantidade)
+        for c in range(CATEGORIAS_POR_RELATORIO)
+        for i in range(ITENS_POR_CATEGORIA)
+    ])
+    db.commit()
+    db.close()
+
+
+def measure(fn):
+    """
+    Executa fn duas vezes: uma para o tempo e outra sob tracemalloc para o pico de memória
+    fn devolve (bytes gerados, ms até o primeiro bloco)
+    """
+    inicio = time.perf_counter()
+    tamanho, primeiro = fn()
+    ms = (time.perf_counter() - inicio) * 1000
+
+    tracemalloc.start()
+    fn()
+    pico = tracemalloc.get_traced_memory()[1] / 1024 / 1024
+    tracemalloc.stop()
+    return tamanho, primeiro, ms, pico
+
+
+def export_streaming(formato: ExportFormat, **filtros):
+    inicio = time.perf_counter()
+    primeiro = None
+    total = 0
+    for chunk in stream_export(formato, **filtros):
+        if primeiro is None and chunk:
+            primeiro = (time.perf_counter() - inicio) * 1000
+        total += len(chunk)
+    return total, primeiro
+
+
+def export_one_by_one() -> int:
+    """O que o cliente faz hoje: lista os ids e busca cada relatório completo"""
+    db = SessionLocal()
+    ids = db.execute(select(Report.id).order_by(Report.criado_em, Report.id)).scalars().all()
+    documentos = []
+    for report_id in ids:
+        documentos.append(ReportResponse.model_validate(get_report_tree(db, report_id)).model_dump_json())
+        db.expunge_all()
+    db.close()
+    # A resposta só fica completa depois do último relatório
+    return sum(len(documento) for documento in documentos), None
+
+
+def run(relatorios: int):
+    print(f"\n== {relatorios} relatórios, {relatorios * CATEGORIAS_POR_RELATORIO * ITENS_POR_CATEGORIA} itens ==")
+    casos = [
+        ("streaming CSV", lambda: export_streaming(ExportFormat.CSV)),
+        ("streaming XLSX", lambda: export_streaming(ExportFormat.XLSX)),
+        ("streaming CSV (só não conformes)", lambda: export_streaming(
+            ExportFormat.CSV, resposta=ChecklistResponse.NAO_CONFORME
+        )),
+        ("GET /reports/{id} um a um (JSON)", export_one_by_one),
+    ]
+    for nome, fn in casos:
+        tamanho, primeiro, ms, pico = measure(fn)
+        primeiro = f"{primeiro:6.0f} ms" if primeiro is not None else "     -   "
+        print(
+            f"{nome:36s} {ms:7.0f} ms  1º bloco {primeiro}  "
+            f"{tamanho / 1024 / 1024:6.1f} MiB gerados  pico {pico:5.1f} MiB"
+        )
+
+
+def main():
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"nome": "Inspetor", "email": "inspetor@example.com", "senha_hash": "-"}])
+        conn.execute(insert(Client), [{
+            "status": ClientStatus.ATIVO, "nome_fantasia": "Cliente", "razao_social": "Cliente",
+            "categoria": ClientCategory.RESTAURANTE, "cnpj": "00000000000000",
+        }])
+
+    with engine.connect() as conn:
+        consultas = [
+            ("ids dos relatórios (cursor)", report_ids_statement()),
+            ("itens de um lote", items_statement([1, 2, 3])),
+        ]
+        for nome, stmt in consultas:
+            sql = str(stmt.compile(dialect=sqlite.dialect(), compile_kwargs={"literal_binds": True}))
+            print(f"Plano - {nome}:")
+            for linha in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + sql):
+                print(f"    {linha[-1]}")
+
+    metade = RELATORIOS // 4
+    populate(1, metade)
+    run(metade)
+    populate(metade + 1, RELATORIOS - metade)
+    run(RELATORIOS)
+
+    engine.dispose()
+    TMP.cleanup()
+
+
+if __name__ == "__main__":
+    main()
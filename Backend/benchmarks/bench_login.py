@@ -0,0 +1,59 @@
+"""
+Benchmark de vazão do login (verificação bcrypt) por custo e tamanho do pool
+Simula o pico de logins da manhã: LOGINS verificações de senha concorrentes
+Execute (no diretório Backend/): python -m benchmarks.bench_login
+"""
+import asyncio
+import time
+
+import bcrypt
+
+from app import auth
+
+LOGINS = 32
+CUSTOS = [10, 12]
+EXECUTORES = ["thread", "process"]
+WORKERS = [1, 2, 4]
+SENHA = "senha-de-teste"
+
+
+async def login_burst(hashed: str) -> float:
+    """Retorna logins/s para LOGINS verificações simultâneas"""
+    inicio = time.perf_counter()
+    resultados = await asyncio.gather(*[
+        auth.verify_password_async(SENHA, hashed) for _ in range(LOGINS)
+    ])
+    assert all(resultados)
+    return LOGINS / (time.perf_counter() - inicio)
+
+
+async def event_loop_latency(hashed: str) -> float:
+    """Maior atraso (ms) do event loop enquanto os logins são processados"""
+    atraso_max = 0.0
+    burst = asyncio.ensure_future(login_burst(hashed))
+    while not burst.done():
+        inicio = time.perf_counter()
+        await asyncio.sleep(0.01)
+        atraso_max = max(atraso_max, (time.perf_counter() - inicio - 0.01) * 1000)
+    await burst
+    return atraso_max
+
+
+def main():
+    print(f"{LOGINS} logins concorrentes")
+    print(f"{'custo':>5} | {'executor':>8} | {'workers':>7} | {'logins/s':>9} | {'atraso loop (ms)':>16}")
+    for custo in CUSTOS:
+        hashed = bcrypt.hashpw(SENHA.encode("utf-8"), bcrypt.gensalt(rounds=custo)).decode("utf-8")
+        for kind in EXECUTORES:
+            for workers in WORKERS:
+                auth.configure_bcrypt_executor(kind, workers)
+                # Aquece o pool (processos são criados sob demanda)
+                asyncio.run(login_burst(hashed))
+                vazao = asyncio.run(login_burst(hashed))
+                atraso = asyncio.run(event_loop_latency(hashed))
+                print(f"{custo:>5} | {kind:>8} | {workers:>7} | {vazao:>9.1f} | {atraso:>16.2f}")
+    auth.shutdown_bcrypt_executor()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark da listagem de clientes: OFFSET vs. cursor (keyset) em uma tabela grande
+Execute (no diretório Backend/): python -m benchmarks.bench_pagination [linhas]
+"""
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from fastapi import Response
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import Client, ClientStatus, ClientCategory
+from app.pagination import paginate, encode_cursor
+
+LINHAS = int(sys.argv[1]) if len(sys.argv) > 1 else 500_000
+LIMITE = 100
+PROFUNDIDADES = [0, 0.1, 0.5, 0.99]  # Fração da tabela já percorrida
+REPETICOES = 5
+
+
+def populate(Session):
+    """Insere LINHAS clientes com criado_em crescente (vários por segundo)"""
+    inicio = datetime(2020, 1, 1)
+    db = Session()
+    lote = 10_000
+    for base in range(0, LINHAS, lote):
+        db.execute(insert(Client), [
+            {
+                "status": ClientStatus.ATIVO,
+                "nome_fantasia": f"Cliente {n}",
+                "categoria": ClientCategory.RESTAURANTE,
+                "razao_social": f"Cliente {n} Ltda",
+                "cnpj": f"{n:014d}",
+                "criado_em": inicio + timedelta(seconds=n // 4),
+            }
+            for n in range(base, min(base + lote, LINHAS))
+        ])
+    db.commit()
+    db.close()
+
+
+def measure(Session, **kwargs) -> float:
+    """Tempo médio (ms) para buscar uma página"""
+    tempos = []
+    for _ in range(REPETICOES):
+        db = Session()
+        inicio = time.perf_counter()
+        paginate(db.query(Client), Client, Response(), LIMITE, **kwargs)
+        tempos.append((time.perf_counter() - inicio) * 1000)
+        db.close()
+    return sum(tempos) / len(tempos)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+
+        print(f"Populando {LINHAS} clientes...")
+        populate(Session)
+
+        print(f"{'página':>8} | {'offset (ms)':>11} | {'cursor (ms)':>11}")
+        for fracao in PROFUNDIDADES:
+            skip = int(LINHAS * fracao)
+            # A ordem é (criado_em, id) decrescente: o último da página anterior tem este ID
+            cursor = encode_cursor(LINHAS - skip + 1) if skip else None
+            offset_ms = measure(Session, skip=skip)
+            cursor_ms = measure(Session, cursor=cursor)
+            print(f"{skip // LIMITE + 1:>8} | {offset_ms:>11.2f} | {cursor_ms:>11.2f}")
+
+        total_ms = measure(Session, incluir_total=True) - measure(Session)
+        print(f"Custo adicional de incluir_total (COUNT): {total_ms:.2f} ms")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+PDFs de vários relatórios: um GET /reports/{id}/pdf por relatório x job em lote
+- um a um: uma carga da árvore e uma renderização por relatório, em sequência
+- lote: uma consulta para todos os relatórios e renderização nos processos da fila
+O ganho do lote depende dos núcleos disponíveis (PDF_WORKERS)
+Execute (no diretório Backend/): python -m benchmarks.bench_pdf_batch [relatórios]
+"""
+import os
+import sys
+import tempfile
+import time
+
+TMP = tempfile.TemporaryDirectory()
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(TMP.name, 'bench.db')}"
+os.environ["PDF_CACHE_DIR"] = os.path.join(TMP.name, "pdf_cache")
+
+from sqlalchemy import event, insert  # noqa: E402
+
+from app.database import Base, SessionLocal, engine  # noqa: E402
+from app.models import (  # noqa: E402
+    User, Client, Report, ChecklistCategory, ChecklistItem,
+    ClientStatus, ClientCategory, ReportStatus, ChecklistResponse, PdfBatchFormat,
+)
+from app.pdf_generator import generate_report_pdf  # noqa: E402
+from app.pdf_jobs import (  # noqa: E402
+    PDF_WORKERS, merge_batch_pdf, shutdown_pdf_workers, stream_batch_zip, submit_pdf_batch_job,
+)
+from app.routers.reports import get_report_tree, get_report_trees  # noqa: E402
+
+RELATORIOS = int(sys.argv[1]) if len(sys.argv) > 1 else 40
+CATEGORIAS_POR_RELATORIO = 8
+ITENS_POR_CATEGORIA = 12
+RESPOSTAS = [ChecklistResponse.CONFORME, ChecklistResponse.NAO_CONFORME, ChecklistResponse.NA]
+
+
+def populate():
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"nome": "Inspetor", "email": "inspetor@example.com", "senha_hash": "-"}])
+        conn.execute(insert(Client), [{
+            "status": ClientStatus.ATIVO, "nome_fantasia": "Cliente", "razao_social": "Cliente",
+            "categoria": ClientCategory.RESTAURANTE, "cnpj": "00.000.000/0001-00",
+        }])
+        conn.execute(insert(Report), [
+            {"id": n, "descricao": f"Inspeção mensal {n}", "cliente_id": 1, "responsavel_inspecao_id": 1,
+             "status": ReportStatus.EM_ANDAMENTO}
+            for n in range(1, RELATORIOS + 1)
+        ])
+        conn.execute(insert(ChecklistCategory), [
+            {"id": n * 100 + c, "relatorio_id": n, "nome": f"Categoria {c + 1}", "ordem": c + 1}
+            for n in range(1, RELATORIOS + 1)
+            for c in range(CATEGORIAS_POR_RELATORIO)
+        ])
+        conn.execute(insert(ChecklistItem), [
+            {
+                "categoria_id": n * 100 + c, "codigo": f"{c + 1}.{i + 1}",
+                "descricao": "O estabelecimento mantém os procedimentos exigidos pela RDC 216.",
+                "resposta": RESPOSTAS[(n + i) % len(RESPOSTAS)], "ordem": i + 1,
+            }
+            for n in range(1, RELATORIOS + 1)
+            for c in range(CATEGORIAS_POR_RELATORIO)
+            for i in range(ITENS_POR_CATEGORIA)
+        ])
+
+
+class QueryCounter:
+    def __init__(self):
+        self.total = 0
+        event.listen(engine, "before_cursor_execute", self._count)
+
+    def _count(self, *args):
+        self.total += 1
+
+    def reset(self) -> int:
+        total, self.total = self.total, 0
+        return total
+
+
+def one_by_one(report_ids):
+    db = SessionLocal()
+    total = 0
+    for report_id in report_ids:
+        total += len(generate_report_pdf(get_report_tree(db, report_id)).getvalue())
+        db.expunge_all()
+    db.close()
+    return total
+
+
+def batch(report_ids, formato: PdfBatchFormat):
+    db = SessionLocal()
+    job = submit_pdf_batch_job(get_report_trees(db, report_ids), formato)
+    db.close()
+    for part in job.parts:
+        part.future.result()
+    if formato == PdfBatchFormat.ZIP:
+        return sum(len(chunk) for chunk in stream_batch_zip(job))
+    return len(merge_batch_pdf(job))
+
+
+def main():
+    populate()
+    report_ids = list(range(1, RELATORIOS + 1))
+    counter = QueryCounter()
+
+    # Aquece o pool de processos (criação dos workers fora da medição)
+    batch(report_ids[:PDF_WORKERS], PdfBatchFormat.ZIP)
+    counter.reset()
+
+    print(f"{RELATORIOS} relatórios, {os.cpu_count()} CPU(s), PDF_WORKERS={PDF_WORKERS}")
+    casos = [
+        ("um a um (GET /{id}/pdf)", lambda: one_by_one(report_ids)),
+        ("lote ZIP", lambda: batch(report_ids, PdfBatchFormat.ZIP)),
+        ("lote PDF único", lambda: batch(report_ids, PdfBatchFormat.PDF)),
+    ]
+    for nome, fn in casos:
+        inicio = time.perf_counter()
+        tamanho = fn()
+        ms = (time.perf_counter() - inicio) * 1000
+        print(f"{nome:26s} {ms:7.0f} ms  {counter.reset():5d} consultas  {tamanho / 1024:8.0f} KiB")
+
+    shutdown_pdf_workers()
+    engine.dispose()
+    TMP.cleanup()
+
+
+if __name__ == "__main__":
+    main()
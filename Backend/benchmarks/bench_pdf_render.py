@@ -0,0 +1,81 @@
+"""
+Microbenchmark da renderização de PDF com estilos compartilhados
+Mede quanto custava montar os estilos a cada render (e a cada categoria)
+em comparação com o tempo total de renderização de um relatório de 20 categorias
+Execute (no diretório Backend/): python -m benchmarks.bench_pdf_render
+"""
+import time
+from datetime import datetime
+
+from reportlab.lib import colors
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.platypus import TableStyle
+
+from app.models import Report, ChecklistCategory, ChecklistItem, ReportStatus, ChecklistResponse
+from app.pdf_generator import ReportPdfRenderer, default_renderer
+
+CATEGORIAS = 20
+ITENS_POR_CATEGORIA = 10
+REPETICOES = 20
+
+
+def build_report() -> Report:
+    """Monta um relatório em memória (sem banco de dados)"""
+    respostas = [ChecklistResponse.CONFORME, ChecklistResponse.NAO_CONFORME, ChecklistResponse.NA, None]
+    report = Report(
+        id=1,
+        descricao="Benchmark",
+        cliente_id=1,
+        status=ReportStatus.CONCLUIDO,
+        criado_em=datetime(2025, 1, 1, 12, 0),
+    )
+    for c in range(CATEGORIAS):
+        categoria = ChecklistCategory(nome=f"Categoria {c + 1}", ordem=c + 1)
+        for i in range(ITENS_POR_CATEGORIA):
+            categoria.itens.append(ChecklistItem(
+                codigo=f"{c + 1}.{i + 1}",
+                descricao="O estabelecimento mantém os procedimentos exigidos pela RDC 216.",
+                resposta=respostas[i % len(respostas)],
+                ordem=i + 1,
+            ))
+        report.categorias.append(categoria)
+    return report
+
+
+def timeit(fn, repeticoes=REPETICOES) -> float:
+    """Tempo médio (ms) de uma chamada"""
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        fn()
+    return (time.perf_counter() - inicio) * 1000 / repeticoes
+
+
+SAMPLE_STYLES = getSampleStyleSheet()
+ITEMS_TABLE_COMMANDS = default_renderer.items_table_style.getCommands()
+
+
+def per_category_styles():
+    """O que o gerador antigo criava dentro do loop de categorias"""
+    ParagraphStyle('CategoryTitle', parent=SAMPLE_STYLES['Heading3'], fontSize=12,
+                   textColor=colors.HexColor('#16A085'), spaceAfter=8, spaceBefore=12,
+                   fontName='Helvetica-Bold')
+    TableStyle(ITEMS_TABLE_COMMANDS)
+
+
+def main():
+    report = build_report()
+
+    por_render = timeit(ReportPdfRenderer)
+    por_categoria = timeit(per_category_styles, repeticoes=REPETICOES * 10)
+    render = timeit(lambda: default_renderer.render(report))
+    economia = por_render + CATEGORIAS * por_categoria
+
+    print(f"Relatório: {CATEGORIAS} categorias x {ITENS_POR_CATEGORIA} itens")
+    print(f"  montagem dos estilos por render:     {por_render:8.3f} ms")
+    print(f"  montagem dos estilos por categoria:  {por_categoria:8.3f} ms")
+    print(f"  render com estilos compartilhados:   {render:8.3f} ms")
+    print(f"  economia estimada por render:        {economia:8.3f} ms ({economia * 100 / (render + economia):.1f}%)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+"""
+Benchmark da criação de relatórios: inserção item a item vs. inserção em lote
+Execute (no diretório Backend/): python -m benchmarks.bench_report_create
+"""
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.database import Base
+from app.models import User, Client, Report, ChecklistCategory, ChecklistItem, ClientStatus, ClientCategory
+from app.schemas import ChecklistCategoryCreate, ChecklistItemCreate
+from app.routers.reports import insert_checklist
+
+TAMANHOS = [50, 200, 1000]
+CATEGORIAS = 12
+REPETICOES = 5
+
+
+def build_checklist(total_itens: int):
+    """Monta um checklist com `total_itens` distribuídos em CATEGORIAS categorias"""
+    por_categoria = max(1, total_itens // CATEGORIAS)
+    return [
+        ChecklistCategoryCreate(
+            nome=f"Categoria {c + 1}",
+            ordem=c + 1,
+            itens=[
+                ChecklistItemCreate(
+                    codigo=f"{c + 1}.{i + 1}",
+                    descricao="O estabelecimento mantém os procedimentos exigidos pela RDC 216. " * 3,
+                    ordem=i + 1,
+                )
+                for i in range(por_categoria)
+            ],
+        )
+        for c in range(CATEGORIAS)
+    ]
+
+
+def insert_legacy(db, report_id, categorias):
+    """Caminho antigo: um flush por categoria e um objeto ORM por item"""
+    for cat_data in categorias:
+        category = ChecklistCategory(relatorio_id=report_id, nome=cat_data.nome, ordem=cat_data.ordem)
+        db.add(category)
+        db.flush()
+        for item_data in cat_data.itens:
+            db.add(ChecklistItem(categoria_id=category.id, **item_data.model_dump()))
+
+
+def measure(Session, insert_fn, categorias) -> float:
+    """Retorna o tempo médio (ms) de criação de um relatório completo"""
+    tempos = []
+    for _ in range(REPETICOES):
+        db = Session()
+        inicio = time.perf_counter()
+        report = Report(descricao="Benchmark", cliente_id=1, responsavel_inspecao_id=1)
+        db.add(report)
+        db.flush()
+        insert_fn(db, report.id, categorias)
+        db.commit()
+        tempos.append((time.perf_counter() - inicio) * 1000)
+        db.close()
+    return sum(tempos) / len(tempos)
+
+
+def main():
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(bind=engine, autoflush=False)
+
+    db = Session()
+    db.add(User(nome="Benchmark", email="bench@example.com", senha_hash="-"))
+    db.add(Client(
+        status=ClientStatus.ATIVO,
+        nome_fantasia="Benchmark",
+        categoria=ClientCategory.RESTAURANTE,
+        razao_social="Benchmark",
+        cnpj="00.000.000/0001-00",
+    ))
+    db.commit()
+    db.close()
+
+    print(f"{'itens':>6} | {'antes (ms)':>11} | {'depois (ms)':>11} | {'ganho':>6}")
+    for total in TAMANHOS:
+        categorias = build_checklist(total)
+        antes = measure(Session, insert_legacy, categorias)
+        depois = measure(Session, insert_checklist, categorias)
+        print(f"{total:>6} | {antes:>11.2f} | {depois:>11.2f} | {antes / depois:>5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
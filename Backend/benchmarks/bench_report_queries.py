@@ -0,0 +1,144 @@
+"""
+Planos de execução (EXPLAIN QUERY PLAN) e tempos das consultas de relatórios
+Executa as funções reais dos routers, captura o SQL emitido e mostra o plano de cada
+consulta com e sem os índices compostos / de chave estrangeira
+Execute (no diretório Backend/): python -m benchmarks.bench_report_queries [relatórios]
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from fastapi import Response
+from sqlalchemy import event, extract, insert, text
+from sqlalchemy.orm import joinedload, sessionmaker
+
+from app.database import Base, create_db_engine
+from app.models import (
+    User, Client, Report, ChecklistCategory, ChecklistItem,
+    ClientStatus, ClientCategory, ReportStatus,
+)
+from app.routers.reports import _get_reports_by_date, _list_reports, get_report_tree
+
+RELATORIOS = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+CLIENTES = 500
+CATEGORIAS_POR_RELATORIO = 4
+ITENS_POR_CATEGORIA = 5
+REPETICOES = 5
+
+# Índices adicionados para estas consultas (removidos para medir o "antes")
+NOVOS_INDICES = [
+    "idx_reports_cliente_criado_em_id",
+    "idx_reports_status_criado_em_id",
+    "idx_checklist_categories_relatorio_ordem",
+    "idx_checklist_items_categoria_ordem",
+]
+
+
+def populate(Session):
+    rnd = random.Random(42)
+    db = Session()
+    db.execute(insert(User), [{"nome": "Inspetor", "email": "inspetor@example.com", "senha_hash": "-"}])
+    db.execute(insert(Client), [
+        {
+            "status": ClientStatus.ATIVO, "nome_fantasia": f"Cliente {n}", "razao_social": f"Cliente {n}",
+            "categoria": ClientCategory.RESTAURANTE, "cnpj": f"{n:014d}",
+        }
+        for n in range(CLIENTES)
+    ])
+    inicio = datetime(2020, 1, 1)
+    db.execute(insert(Report), [
+        {
+            "descricao": f"Relatório {n}", "cliente_id": rnd.randint(1, CLIENTES), "responsavel_inspecao_id": 1,
+            "status": ReportStatus.CONCLUIDO if rnd.random() < 0.9 else ReportStatus.EM_ANDAMENTO,
+            "criado_em": inicio + timedelta(minutes=30 * n),
+            "data_agendada": inicio + timedelta(minutes=30 * n + rnd.randint(0, 60 * 24 * 30)),
+        }
+        for n in range(RELATORIOS)
+    ])
+    db.execute(insert(ChecklistCategory), [
+        {"relatorio_id": n + 1, "nome": f"Categoria {c}", "ordem": c + 1}
+        for n in range(RELATORIOS)
+        for c in range(CATEGORIAS_POR_RELATORIO)
+    ])
+    db.execute(insert(ChecklistItem), [
+        {"categoria_id": c + 1, "codigo": str(i), "descricao": "Item", "ordem": i + 1}
+        for c in range(RELATORIOS * CATEGORIAS_POR_RELATORIO)
+        for i in range(ITENS_POR_CATEGORIA)
+    ])
+    db.commit()
+    db.close()
+
+
+def calendario_extract(db, mes, ano):
+    """Versão anterior da agenda: extract() em data_agendada"""
+    return (
+        db.query(Report)
+        .options(joinedload(Report.cliente))
+        .filter(extract('month', Report.data_agendada) == mes, extract('year', Report.data_agendada) == ano)
+        .order_by(Report.data_agendada)
+        .all()
+    )
+
+
+CONSULTAS = {
+    "agenda (extract)": lambda db: calendario_extract(db, 6, 2021),
+    "agenda (intervalo)": lambda db: _get_reports_by_date(db, 6, 2021),
+    "listagem por cliente": lambda db: _list_reports(db, Response(), 100, None, 0, False, 42, None),
+    "listagem por status": lambda db: _list_reports(db, Response(), 100, None, 0, False, None, ReportStatus.EM_ANDAMENTO),
+    "árvore do relatório": lambda db: get_report_tree(db, RELATORIOS // 2),
+}
+
+
+def run(engine, Session, titulo):
+    print(f"\n=== {titulo} ===")
+    for nome, consulta in CONSULTAS.items():
+        statements = []
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            statements.append((statement, parameters))
+
+        event.listen(engine, "before_cursor_execute", capture)
+        db = Session()
+        consulta(db)
+        db.close()
+        event.remove(engine, "before_cursor_execute", capture)
+
+        tempos = []
+        for _ in range(REPETICOES):
+            db = Session()
+            inicio = time.perf_counter()
+            consulta(db)
+            tempos.append((time.perf_counter() - inicio) * 1000)
+            db.close()
+
+        print(f"{nome}: {sum(tempos) / len(tempos):.2f} ms")
+        with engine.connect() as conn:
+            for statement, parameters in statements:
+                for linha in conn.exec_driver_sql("EXPLAIN QUERY PLAN " + statement, parameters):
+                    print(f"    {linha[-1]}")
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_db_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine, autoflush=False)
+        populate(Session)
+
+        with engine.begin() as conn:
+            conn.execute(text("ANALYZE"))
+        run(engine, Session, "com os índices")
+
+        with engine.begin() as conn:
+            for indice in NOVOS_INDICES:
+                conn.execute(text(f"DROP INDEX {indice}"))
+            conn.execute(text("ANALYZE"))
+        run(engine, Session, "sem os índices compostos / de chave estrangeira")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
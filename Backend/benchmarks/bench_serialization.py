@@ -0,0 +1,109 @@
+"""
+Serialização de GET /reports/{id}: caminho padrão do FastAPI x model_response
+- padrão: response_model (validação + conversão para dict) e json.dumps (JSONResponse)
+- orjson: o mesmo caminho com ORJSONResponse (só se o orjson estiver instalado)
+- model_response: schema validado uma vez do ORM e serializado pelo pydantic-core
+A validação a partir do ORM (model_validate) é comum aos três e medida à parte
+Execute (no diretório Backend/): python -m benchmarks.bench_serialization
+"""
+import asyncio
+import os
+import tempfile
+import time
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+
+from app.migrations import upgrade_database
+from app.models import User, Client, Report, ChecklistCategory, ChecklistItem, ClientStatus, ClientCategory
+from app.responses import model_response
+from app.routers.reports import get_report_tree
+from app.schemas import ReportResponse
+
+try:
+    import orjson  # noqa: F401
+except ImportError:
+    orjson = None
+
+TAMANHOS = [100, 500, 2000]
+ITENS_POR_CATEGORIA = 25
+REPETICOES = 20
+
+RESPONSE_FIELD = create_response_field(name="Response_get_report", type_=ReportResponse)
+LOOP = asyncio.new_event_loop()
+
+
+def populate(engine):
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"nome": "Inspetor", "email": "inspetor@example.com", "senha_hash": "-"}])
+        conn.execute(insert(Client), [{
+            "status": ClientStatus.ATIVO, "nome_fantasia": "Cliente", "razao_social": "Cliente",
+            "categoria": ClientCategory.RESTAURANTE, "cnpj": "00.000.000/0001-00",
+            "nome_busca": "cliente", "cnpj_digitos": "00000000000100",
+        }])
+        conn.execute(insert(Report), [
+            {"id": n, "descricao": f"Inspeção {n}", "cliente_id": 1, "responsavel_inspecao_id": 1}
+            for n in TAMANHOS
+        ])
+        conn.execute(insert(ChecklistCategory), [
+            {"id": n * 100 + c, "relatorio_id": n, "nome": f"Categoria {c + 1}", "ordem": c + 1}
+            for n in TAMANHOS
+            for c in range(n // ITENS_POR_CATEGORIA)
+        ])
+        conn.execute(insert(ChecklistItem), [
+            {
+                "categoria_id": n * 100 + c, "codigo": f"{c + 1}.{i + 1}",
+                "descricao": "O estabelecimento mantém os procedimentos exigidos pela RDC 216.",
+                "observacoes": "Verificado no local.", "ordem": i + 1,
+            }
+            for n in TAMANHOS
+            for c in range(n // ITENS_POR_CATEGORIA)
+            for i in range(ITENS_POR_CATEGORIA)
+        ])
+
+
+def fastapi_default(model, response_class) -> bytes:
+    """O que o FastAPI faz com o retorno de um endpoint async com response_model"""
+    content = LOOP.run_until_complete(serialize_response(field=RESPONSE_FIELD, response_content=model))
+    return response_class(content).body
+
+
+def timed(fn) -> float:
+    """Tempo médio (ms) de REPETICOES execuções"""
+    inicio = time.perf_counter()
+    for _ in range(REPETICOES):
+        fn()
+    return (time.perf_counter() - inicio) * 1000 / REPETICOES
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{os.path.join(tmp, 'bench.db')}")
+        upgrade_database(engine)
+        populate(engine)
+        db = sessionmaker(bind=engine, autoflush=False)()
+
+        casos = [("padrão (json)", lambda model: fastapi_default(model, JSONResponse))]
+        if orjson is not None:
+            casos.append(("padrão (orjson)", lambda model: fastapi_default(model, ORJSONResponse)))
+        casos.append(("model_response", lambda model: model_response(model).body))
+
+        print(f"{'itens':>5} | {'KiB':>6} | {'model_validate':>14} | " + " | ".join(f"{nome:>15}" for nome, _ in casos))
+        for total in TAMANHOS:
+            report = get_report_tree(db, total)
+            model = ReportResponse.model_validate(report)
+            validacao = timed(lambda: ReportResponse.model_validate(report))
+            tamanho = len(model_response(model).body) / 1024
+            tempos = [timed(lambda: fn(model)) for _, fn in casos]
+            print(f"{total:>5} | {tamanho:>6.0f} | {validacao:>11.2f} ms | " + " | ".join(f"{ms:>12.2f} ms" for ms in tempos))
+            db.expunge_all()
+
+        db.close()
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Sincronização incremental x releitura do relatório completo
+- leitura: GET /reports/{id} (árvore inteira) x GET /sync?since=<token> depois de
+  alterar um item, em bytes e tempo
+- escrita: custo dos triggers do registro de alterações na atualização em lote
+Execute (no diretório Backend/): python -m benchmarks.bench_sync
+"""
+import os
+import tempfile
+import time
+
+from sqlalchemy import create_engine, insert, update
+from sqlalchemy.orm import sessionmaker
+
+from app.migrations import revision_module, upgrade_database
+from app.models import (
+    User, Client, Report, ChecklistCategory, ChecklistItem,
+    ClientStatus, ClientCategory, ChecklistResponse,
+)
+from app.routers.reports import get_report_tree
+from app.schemas import ReportResponse
+from app.sync import load_changes
+
+CATEGORIAS = 12
+ITENS_POR_CATEGORIA = 25
+RELATORIOS = 200
+REPETICOES = 50
+
+
+def populate(engine):
+    with engine.begin() as conn:
+        conn.execute(insert(User), [{"nome": "Inspetor", "email": "inspetor@example.com", "senha_hash": "-"}])
+        conn.execute(insert(Client), [{
+            "status": ClientStatus.ATIVO, "nome_fantasia": "Cliente", "razao_social": "Cliente",
+            "categoria": ClientCategory.RESTAURANTE, "cnpj": "00.000.000/0001-00",
+            "nome_busca": "cliente", "cnpj_digitos": "00000000000100",
+        }])
+        conn.execute(insert(Report), [
+            {"id": n, "descricao": f"Inspeção {n}", "cliente_id": 1, "responsavel_inspecao_id": 1}
+            for n in range(1, RELATORIOS + 1)
+        ])
+        conn.execute(insert(ChecklistCategory), [
+            {"id": n * 100 + c, "relatorio_id": n, "nome": f"Categoria {c + 1}", "ordem": c + 1}
+            for n in range(1, RELATORIOS + 1)
+            for c in range(CATEGORIAS)
+        ])
+        conn.execute(insert(ChecklistItem), [
+            {
+                "categoria_id": n * 100 + c, "codigo": f"{c + 1}.{i + 1}",
+                "descricao": "O estabelecimento mantém os procedimentos exigidos pela RDC 216.",
+                "ordem": i + 1,
+            }
+            for n in range(1, RELATORIOS + 1)
+            for c in range(CATEGORIAS)
+            for i in range(ITENS_POR_CATEGORIA)
+        ])
+
+
+def timed(fn) -> float:
+    """Tempo médio (ms) de REPETICOES execuções"""
+    inicio = time.perf_counter()
+    for _ in range(REPETICOES):
+        fn()
+    return (time.perf_counter() - inicio) * 1000 / REPETICOES
+
+
+def bench_read(Session):
+    db = Session()
+    token = load_changes(db, 0, limit=10**7).token
+    item_id = db.query(ChecklistItem.id).join(ChecklistCategory).filter(ChecklistCategory.relatorio_id == 1).first()[0]
+    db.execute(update(ChecklistItem), [{"id": item_id, "resposta": ChecklistResponse.CONFORME}])
+    db.commit()
+
+    def full():
+        document = ReportResponse.model_validate(get_report_tree(db, 1)).model_dump_json()
+        db.expunge_all()
+        return document
+
+    def delta():
+        return load_changes(db, token, relatorio_id=1).model_dump_json()
+
+    print(f"Leitura depois de alterar 1 item ({CATEGORIAS * ITENS_POR_CATEGORIA} itens no relatório):")
+    for nome, fn in [("GET /reports/{id}", full), ("GET /sync?since=token", delta)]:
+        print(f"  {nome:24s} {len(fn().encode()) / 1024:7.1f} KiB  {timed(fn):6.2f} ms")
+    db.close()
+
+
+def bench_write(Session, nome: str):
+    db = Session()
+    ids = [row[0] for row in db.query(ChecklistItem.id).limit(CATEGORIAS * ITENS_POR_CATEGORIA)]
+    respostas = [ChecklistResponse.CONFORME, ChecklistResponse.NAO_CONFORME]
+    rodada = [0]
+
+    def batch_update():
+        rodada[0] += 1
+        db.execute(update(ChecklistItem), [
+            {"id": item_id, "resposta": respostas[(item_id + rodada[0]) % 2]} for item_id in ids
+        ])
+        db.commit()
+
+    print(f"  {nome:24s} {timed(batch_update):6.2f} ms por lote de {len(ids)} itens")
+    db.close()
+
+
+def main():
+    with tempfile.TemporaryDirectory() as tmp:
+        engines = {}
+        for nome in ("com", "sem"):
+            engine = create_engine(f"sqlite:///{os.path.join(tmp, nome + '.db')}")
+            upgrade_database(engine)
+            populate(engine)
+            engines[nome] = engine
+        with engines["sem"].begin() as conn:
+            revision_module("0007").drop_sync_triggers(conn)
+
+        bench_read(sessionmaker(bind=engines["com"], autoflush=False))
+
+        print("Atualização em lote (PATCH /reports/{id}/items):")
+        bench_write(sessionmaker(bind=engines["sem"], autoflush=False), "sem registro de alterações")
+        bench_write(sessionmaker(bind=engines["com"], autoflush=False), "com registro de alterações")
+
+        for engine in engines.values():
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
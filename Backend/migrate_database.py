@@ -1,93 +1,191 @@
 """
-Script de migração para adicionar novos campos ao banco de dados
+Script de migração do banco de dados
 Execute: python migrate_database.py
+
+Aplica as migrações pendentes do Alembic (o mesmo que `alembic upgrade head`).
+Bancos criados antes das migrações (pelo create_all da aplicação, sem a tabela
+alembic_version) são antes completados até o esquema da revisão 0006 e marcados
+com ela, para que as revisões seguintes rodem normalmente.
 """
-import sqlite3
-import os
+from sqlalchemy import inspect, text
 
-# Caminho do banco de dados
-DB_PATH = "database.db"
+from app.database import Base, engine
+import app.models  # noqa: F401  (registra os modelos em Base.metadata)
+from app.migrations import (
+    LEGACY_REVISION,
+    current_revision,
+    head_revision,
+    revision_module,
+    stamp_database,
+    upgrade_database,
+)
+from app.text_utils import normalize_text, only_digits
 
-def migrate():
-    if not os.path.exists(DB_PATH):
-        print(f"❌ Banco de dados não encontrado: {DB_PATH}")
-        print("💡 Certifique-se de estar no diretório Backend/")
-        return False
+# Tabelas que existiam antes das migrações (criadas pelo create_all)
+LEGACY_TABLES = (
+    "users",
+    "clients",
+    "client_responsibles",
+    "client_collaborators",
+    "reports",
+    "checklist_categories",
+    "checklist_items",
+    "checklist_templates",
+    "checklist_template_categories",
+    "checklist_template_items",
+    "dashboard_counters",
+)
+
+# Índices criados pelo antigo migrate_database.py
+LEGACY_INDEXES = [
+    "CREATE INDEX IF NOT EXISTS idx_users_superior_id ON users(superior_id)",
+    "CREATE INDEX IF NOT EXISTS idx_reports_data_agendada ON reports(data_agendada)",
+    "CREATE INDEX IF NOT EXISTS idx_reports_criado_em_id ON reports(criado_em, id)",
+    "CREATE INDEX IF NOT EXISTS idx_clients_criado_em_id ON clients(criado_em, id)",
+    "CREATE INDEX IF NOT EXISTS ix_clients_cnpj_digitos ON clients(cnpj_digitos)",
+    "CREATE INDEX IF NOT EXISTS idx_reports_cliente_criado_em_id ON reports(cliente_id, criado_em, id)",
+    "CREATE INDEX IF NOT EXISTS idx_reports_status_criado_em_id ON reports(status, criado_em, id)",
+    "CREATE INDEX IF NOT EXISTS idx_checklist_categories_relatorio_ordem ON checklist_categories(relatorio_id, ordem)",
+    "CREATE INDEX IF NOT EXISTS idx_checklist_items_categoria_ordem ON checklist_items(categoria_id, ordem)",
+]
+
+
+def _columns(conn, table: str) -> dict:
+    return {col[1]: col for col in conn.execute(text(f"PRAGMA table_info({table})"))}
+
+
+def _exists(conn, type_: str, name: str) -> bool:
+    return conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = :type AND name = :name"),
+        {"type": type_, "name": name},
+    ).first() is not None
+
+
+def _complete_legacy_schema(conn):
+    """Leva um banco SQLite anterior às migrações até o esquema da revisão 0006"""
+    # Tabelas que o create_all da versão antiga ainda não tinha criado
+    Base.metadata.create_all(conn, tables=[Base.metadata.tables[name] for name in LEGACY_TABLES])
+
+    reports_columns = _columns(conn, "reports")
+    if "data_agendada" not in reports_columns:
+        print("  ➕ Adicionando coluna 'data_agendada' em reports...")
+        conn.execute(text("ALTER TABLE reports ADD COLUMN data_agendada TIMESTAMP"))
+
+    users_columns = _columns(conn, "users")
+    if "role" not in users_columns:
+        print("  ➕ Adicionando coluna 'role' em users...")
+        conn.execute(text("ALTER TABLE users ADD COLUMN role VARCHAR(8) DEFAULT 'OPERADOR'"))
+    # Enum grava o nome do membro; o script antigo gravava o valor ('operador')
+    conn.execute(text("UPDATE users SET role = 'OPERADOR' WHERE role IS NULL OR role = 'operador'"))
+    if "superior_id" not in users_columns:
+        print("  ➕ Adicionando coluna 'superior_id' em users...")
+        conn.execute(text("ALTER TABLE users ADD COLUMN superior_id INTEGER REFERENCES users(id)"))
+
+    clients_columns = _columns(conn, "clients")
+    for column, ddl in [("nome_busca", "VARCHAR(255)"), ("cnpj_digitos", "VARCHAR(14)")]:
+        if column not in clients_columns:
+            print(f"  ➕ Adicionando coluna '{column}' em clients...")
+            conn.execute(text(f"ALTER TABLE clients ADD COLUMN {column} {ddl}"))
+
+    pendentes = conn.execute(text(
+        "SELECT id, nome_fantasia, cnpj FROM clients WHERE nome_busca IS NULL OR cnpj_digitos IS NULL"
+    )).all()
+    if pendentes:
+        print(f"  🔤 Preenchendo a busca de {len(pendentes)} cliente(s)...")
+        conn.execute(
+            text("UPDATE clients SET nome_busca = :nome_busca, cnpj_digitos = :cnpj_digitos WHERE id = :id"),
+            [
+                {"id": client_id, "nome_busca": normalize_text(nome), "cnpj_digitos": only_digits(cnpj)}
+                for client_id, nome, cnpj in pendentes
+            ],
+        )
+
+    # SQLite não permite remover NOT NULL com ALTER TABLE: recria a tabela
+    items_columns = _columns(conn, "checklist_items")
+    if "template_item_id" not in items_columns or items_columns["descricao"][3]:
+        print("  🔧 Recriando checklist_items (template_item_id e 'descricao' opcional)...")
+        template_item_id = "template_item_id" if "template_item_id" in items_columns else "NULL"
+        conn.execute(text("""
+            CREATE TABLE checklist_items_new (
+                id INTEGER NOT NULL PRIMARY KEY,
+                categoria_id INTEGER NOT NULL REFERENCES checklist_categories(id),
+                codigo VARCHAR(20) NOT NULL,
+                descricao TEXT,
+                resposta VARCHAR(12),
+                observacoes TEXT,
+                ordem INTEGER NOT NULL,
+                template_item_id INTEGER,
+                CONSTRAINT fk_checklist_items_template_item_id
+                    FOREIGN KEY(template_item_id) REFERENCES checklist_template_items(id)
+            )
+        """))
+        conn.execute(text(f"""
+            INSERT INTO checklist_items_new
+                (id, categoria_id, codigo, descricao, resposta, observacoes, ordem, template_item_id)
+            SELECT id, categoria_id, codigo, descricao, resposta, observacoes, ordem, {template_item_id}
+            FROM checklist_items
+        """))
+        conn.execute(text("DROP TABLE checklist_items"))
+        conn.execute(text("ALTER TABLE checklist_items_new RENAME TO checklist_items"))
+        conn.execute(text("CREATE INDEX IF NOT EXISTS ix_checklist_items_id ON checklist_items(id)"))
+
+    print("  📊 Criando índices...")
+    for sql in LEGACY_INDEXES:
+        conn.execute(text(sql))
 
+    if not _exists(conn, "table", "clients_fts"):
+        print("  🔎 Criando o índice de busca de clientes...")
+        revision_module("0004").create_search_index(conn)
+
+    # Os triggers de checklist_items somem se a tabela foi recriada acima
+    if not _exists(conn, "trigger", "dashboard_items_au"):
+        print("  📈 Criando os contadores do dashboard...")
+        revision_module("0005").create_dashboard_triggers(conn)
+
+
+def migrate() -> bool:
     try:
-        conn = sqlite3.connect(DB_PATH)
-        cursor = conn.cursor()
-        
-        print("🔄 Iniciando migração...")
-        
-        # Verifica se as colunas já existem antes de adicionar
-        cursor.execute("PRAGMA table_info(reports)")
-        reports_columns = [col[1] for col in cursor.fetchall()]
-        
-        if 'data_agendada' not in reports_columns:
-            print("  ➕ Adicionando coluna 'data_agendada' em reports...")
-            cursor.execute("ALTER TABLE reports ADD COLUMN data_agendada TIMESTAMP")
-            print("  ✅ Coluna 'data_agendada' adicionada")
-        else:
-            print("  ⏭️  Coluna 'data_agendada' já existe")
-        
-        cursor.execute("PRAGMA table_info(users)")
-        users_columns = [col[1] for col in cursor.fetchall()]
-        
-        if 'role' not in users_columns:
-            print("  ➕ Adicionando coluna 'role' em users...")
-            cursor.execute("ALTER TABLE users ADD COLUMN role VARCHAR(20) DEFAULT 'operador'")
-            # Atualiza valores NULL para o padrão
-            cursor.execute("UPDATE users SET role = 'operador' WHERE role IS NULL")
-            print("  ✅ Coluna 'role' adicionada")
-        else:
-            print("  ⏭️  Coluna 'role' já existe")
-        
-        if 'superior_id' not in users_columns:
-            print("  ➕ Adicionando coluna 'superior_id' em users...")
-            cursor.execute("ALTER TABLE users ADD COLUMN superior_id INTEGER")
-            print("  ✅ Coluna 'superior_id' adicionada")
-        else:
-            print("  ⏭️  Coluna 'superior_id' já existe")
-        
-        # Criar índices
-        print("  📊 Criando índices...")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_superior_id ON users(superior_id)")
-        cursor.execute("CREATE INDEX IF NOT EXISTS idx_reports_data_agendada ON reports(data_agendada)")
-        print("  ✅ Índices criados")
-        
-        conn.commit()
-        print("\n✨ Migração concluída com sucesso!")
-        
+        tabelas = inspect(engine).get_table_names()
+
+        if "users" in tabelas and "alembic_version" not in tabelas:
+            if engine.dialect.name != "sqlite":
+                print(f"❌ Banco sem controle de versão. Confira o esquema e marque-o com `alembic stamp {LEGACY_REVISION}`.")
+                return False
+
+            print("🔄 Banco criado antes das migrações: completando o esquema...")
+            with engine.begin() as conn:
+                _complete_legacy_schema(conn)
+            stamp_database(engine, LEGACY_REVISION)
+            print(f"  ✅ Banco marcado com a revisão {LEGACY_REVISION}")
+
+        print(f"🔄 Aplicando migrações (revisão atual: {current_revision(engine) or 'nenhuma'})...")
+        upgrade_database(engine)
+        print(f"\n✨ Banco na revisão {head_revision()}!")
+
         # Mostra estatísticas
-        cursor.execute("SELECT COUNT(*) FROM users")
-        user_count = cursor.fetchone()[0]
-        cursor.execute("SELECT COUNT(*) FROM reports")
-        report_count = cursor.fetchone()[0]
-        
-        print(f"\n📊 Estatísticas do banco:")
+        with engine.connect() as conn:
+            user_count = conn.execute(text("SELECT COUNT(*) FROM users")).scalar()
+            report_count = conn.execute(text("SELECT COUNT(*) FROM reports")).scalar()
+
+        print("\n📊 Estatísticas do banco:")
         print(f"   👥 Usuários: {user_count}")
         print(f"   📋 Relatórios: {report_count}")
-        
-        conn.close()
         return True
-        
-    except sqlite3.Error as e:
-        print(f"\n❌ Erro durante a migração: {e}")
-        return False
+
     except Exception as e:
-        print(f"\n❌ Erro inesperado: {e}")
+        print(f"\n❌ Erro durante a migração: {e}")
         return False
 
+
 if __name__ == "__main__":
     print("=" * 60)
     print("🗄️  Migração do Banco de Dados - BPA 2.0")
     print("=" * 60)
     print()
-    
+
     if migrate():
         print("\n✅ Tudo pronto! Você pode reiniciar o servidor agora.")
     else:
         print("\n❌ Migração falhou. Verifique os erros acima.")
-    
+
     print("\n" + "=" * 60)
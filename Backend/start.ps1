@@ -46,6 +46,10 @@ python -m pip install --upgrade pip setuptools wheel
 Write-Host "Instalando dependências do requirements.txt..." -ForegroundColor Yellow
 pip install -r requirements.txt
 
+# Criar/atualizar o banco de dados (migrações do Alembic)
+Write-Host "Aplicando migrações do banco..." -ForegroundColor Yellow
+python migrate_database.py
+
 # Iniciar o servidor
 Write-Host "Iniciando Uvicorn em http://127.0.0.1:8000 ..." -ForegroundColor Green
 Write-Host "Pressione Ctrl+C para parar o servidor" -ForegroundColor Yellow
@@ -0,0 +1,140 @@
+"""
+Fixtures dos testes
+
+Cada teste usa um banco SQLite em memória criado pelas migrações do Alembic
+(alembic upgrade head), com os mesmos índices e triggers de produção. A aplicação
+é importada com um banco em arquivo temporário (a inicialização confere a revisão
+do esquema) e os endpoints recebem a sessão do banco em memória.
+"""
+import os
+import tempfile
+
+_TMP = tempfile.mkdtemp(prefix="bpa_tests_")
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(_TMP, 'app.db')}"
+os.environ["DB_ASYNC"] = "false"
+os.environ["BCRYPT_ROUNDS"] = "4"
+os.environ["PDF_CACHE_DIR"] = os.path.join(_TMP, "pdf_cache")
+
+import pytest  # noqa: E402
+from fastapi.testclient import TestClient  # noqa: E402
+from sqlalchemy import create_engine, event, insert  # noqa: E402
+from sqlalchemy.orm import sessionmaker  # noqa: E402
+from sqlalchemy.pool import StaticPool  # noqa: E402
+
+from app import database  # noqa: E402
+from app.migrations import upgrade_database  # noqa: E402
+from app.auth import user_cache  # noqa: E402
+from app.models import (  # noqa: E402
+    User, Client, Report, ChecklistCategory, ChecklistItem,
+    ChecklistTemplate, ChecklistTemplateCategory, ChecklistTemplateItem,
+    ClientStatus, ClientCategory,
+)
+
+upgrade_database(database.engine)
+
+from app.main import app  # noqa: E402
+
+
+class QueryCounter:
+    """Conta as consultas executadas no engine (evento before_cursor_execute)"""
+
+    def __init__(self, engine):
+        self.engine = engine
+        self.statements = []
+
+    def __enter__(self):
+        event.listen(self.engine, "before_cursor_execute", self._count)
+        return self
+
+    def __exit__(self, *exc):
+        event.remove(self.engine, "before_cursor_execute", self._count)
+
+    def _count(self, conn, cursor, statement, parameters, context, executemany):
+        self.statements.append(statement)
+
+    @property
+    def total(self) -> int:
+        return len(self.statements)
+
+
+ITENS_POR_CATEGORIA = 5
+
+
+def create_report(db, report_id: int, categorias: int, **values) -> int:
+    """Relatório com itens próprios e itens que referenciam o texto do template"""
+    if db.get(User, 1) is None:
+        db.execute(insert(User), [{"nome": "Inspetor", "email": "inspetor@example.com", "senha_hash": "-"}])
+    if db.get(Client, 1) is None:
+        db.execute(insert(Client), [{
+            "status": ClientStatus.ATIVO, "nome_fantasia": "Cliente", "razao_social": "Cliente",
+            "categoria": ClientCategory.RESTAURANTE, "cnpj": "00.000.000/0001-00",
+            "nome_busca": "cliente", "cnpj_digitos": "00000000000100",
+        }])
+        db.execute(insert(ChecklistTemplate), [{"id": 1, "nome": "RDC 216", "versao": 1}])
+        db.execute(insert(ChecklistTemplateCategory), [{"id": 1, "template_id": 1, "nome": "Higiene", "ordem": 1}])
+        db.execute(insert(ChecklistTemplateItem), [
+            {"id": 1, "categoria_id": 1, "codigo": "1.1", "descricao": "Texto do template", "ordem": 1}
+        ])
+
+    db.execute(insert(Report), [
+        {"id": report_id, "descricao": f"Inspeção {report_id}", "cliente_id": 1, "responsavel_inspecao_id": 1,
+         **values}
+    ])
+    db.execute(insert(ChecklistCategory), [
+        {"id": report_id * 100 + c, "relatorio_id": report_id, "nome": f"Categoria {c + 1}", "ordem": c + 1}
+        for c in range(categorias)
+    ])
+    db.execute(insert(ChecklistItem), [
+        {
+            "categoria_id": report_id * 100 + c, "codigo": f"{c + 1}.{i + 1}", "ordem": i + 1,
+            **({"template_item_id": 1} if i == 0 else {"descricao": "Texto próprio"}),
+        }
+        for c in range(categorias)
+        for i in range(ITENS_POR_CATEGORIA)
+    ])
+    db.commit()
+    return report_id
+
+
+@pytest.fixture
+def engine():
+    """Banco em memória (uma única conexão compartilhada) com as migrações aplicadas"""
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    upgrade_database(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(engine):
+    session = sessionmaker(bind=engine, autoflush=False)()
+    yield session
+    session.close()
+
+
+@pytest.fixture
+def client(engine):
+    """TestClient com os endpoints usando o banco em memória"""
+    Session = sessionmaker(bind=engine, autocommit=False, autoflush=False)
+
+    def get_test_session():
+        session = Session()
+        try:
+            yield session
+        finally:
+            session.close()
+
+    app.dependency_overrides[database.get_session] = get_test_session
+    with TestClient(app) as test_client:
+        yield test_client
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def auth_headers(client):
+    user_cache.clear()
+    client.post("/auth/register", json={"nome": "Inspetor", "email": "inspetor@example.com", "senha": "123456"})
+    response = client.post("/auth/login-json", json={"email": "inspetor@example.com", "senha": "123456"})
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
@@ -0,0 +1,41 @@
+"""
+Busca de clientes pelo LIKE (PostgreSQL ou SQLite sem FTS5): curingas do termo são literais
+"""
+import pytest
+from sqlalchemy import insert
+
+from app import search
+from app.models import Client, ClientStatus, ClientCategory
+from app.text_utils import normalize_text
+
+NOMES = ["Padaria Pão Quente", "Bar 100% Natural", "Lanchonete do_Zé"]
+
+
+@pytest.fixture
+def clients(db, monkeypatch):
+    monkeypatch.setattr(search, "_fts_enabled", False)
+    db.execute(insert(Client), [
+        {
+            "status": ClientStatus.ATIVO, "nome_fantasia": nome, "razao_social": nome,
+            "categoria": ClientCategory.RESTAURANTE, "cnpj": f"00.000.000/0001-0{n}",
+            "nome_busca": normalize_text(nome),
+        }
+        for n, nome in enumerate(NOMES)
+    ])
+    db.commit()
+
+
+def nomes(client, auth_headers, termo):
+    response = client.get("/clients/", params={"search": termo}, headers=auth_headers)
+    return sorted(cliente["nome_fantasia"] for cliente in response.json())
+
+
+@pytest.mark.parametrize("termo, esperado", [
+    ("pao", ["Padaria Pão Quente"]),
+    ("_", ["Lanchonete do_Zé"]),
+    ("100% n", ["Bar 100% Natural"]),
+    ("a%e", []),
+    ("a_a", []),
+])
+def test_like_search_escapes_wildcards(clients, client, auth_headers, termo, esperado):
+    assert nomes(client, auth_headers, termo) == esperado
@@ -0,0 +1,48 @@
+"""
+CompressionMiddleware: Vary: Accept-Encoding em toda resposta de tipo comprimível
+"""
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response
+from fastapi.testclient import TestClient
+
+from app.compression import CompressionMiddleware
+
+GRANDE = "conforme " * 500
+
+
+def build_client() -> TestClient:
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, encodings=["gzip"], minimum_size=1024)
+
+    @app.get("/grande")
+    def grande():
+        return PlainTextResponse(GRANDE)
+
+    @app.get("/pequeno")
+    def pequeno():
+        return PlainTextResponse("ok", headers={"Vary": "Origin"})
+
+    @app.get("/pdf")
+    def pdf():
+        return Response(b"%PDF" * 1000, media_type="application/pdf")
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("path, accept, encoding, vary", [
+    ("/grande", "gzip", "gzip", "Accept-Encoding"),
+    ("/grande", "identity", None, "Accept-Encoding"),
+    ("/grande", "gzip;q=0", None, "Accept-Encoding"),
+    ("/pequeno", "gzip", None, "Origin, Accept-Encoding"),
+    ("/pequeno", "identity", None, "Origin, Accept-Encoding"),
+    ("/pdf", "gzip", None, None),
+])
+def test_vary_on_every_compressible_response(path, accept, encoding, vary):
+    response = build_client().get(path, headers={"Accept-Encoding": accept})
+
+    assert response.status_code == 200
+    assert response.headers.get("content-encoding") == encoding
+    assert response.headers.get("vary") == vary
+    if path == "/grande":
+        assert response.text == GRANDE
@@ -0,0 +1,66 @@
+"""
+GET condicional (ETag / If-None-Match) de relatórios e clientes
+"""
+import pytest
+
+from conftest import create_report
+
+
+@pytest.fixture
+def report(db):
+    return create_report(db, 1, 2)
+
+
+def get(client, auth_headers, path: str, etag: str = None):
+    headers = {**auth_headers, "If-None-Match": etag} if etag else auth_headers
+    return client.get(path, headers=headers)
+
+
+def assert_changed(response, etag: str):
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert response.content
+
+
+def test_report_if_none_match_returns_304(client, auth_headers, report):
+    primeira = get(client, auth_headers, f"/reports/{report}")
+    etag = primeira.headers["ETag"]
+
+    cached = get(client, auth_headers, f"/reports/{report}", etag)
+
+    assert primeira.status_code == 200
+    assert cached.status_code == 304
+    assert cached.headers["ETag"] == etag
+    assert cached.content == b""
+
+
+def test_report_etag_changes_with_checklist_item(client, auth_headers, report):
+    primeira = get(client, auth_headers, f"/reports/{report}")
+    item_id = primeira.json()["categorias"][0]["itens"][0]["id"]
+
+    client.put(f"/reports/items/{item_id}", json={"resposta": "conforme"}, headers=auth_headers)
+    response = get(client, auth_headers, f"/reports/{report}", primeira.headers["ETag"])
+
+    assert_changed(response, primeira.headers["ETag"])
+    assert response.json()["categorias"][0]["itens"][0]["resposta"] == "conforme"
+
+
+def test_report_etag_changes_with_its_client(client, auth_headers, report):
+    primeira = get(client, auth_headers, f"/reports/{report}")
+    cliente_id = primeira.json()["cliente_id"]
+
+    client.put(f"/clients/{cliente_id}", json={"nome_fantasia": "Cliente Renomeado"}, headers=auth_headers)
+    response = get(client, auth_headers, f"/reports/{report}", primeira.headers["ETag"])
+
+    assert_changed(response, primeira.headers["ETag"])
+    assert response.json()["cliente"]["nome_fantasia"] == "Cliente Renomeado"
+
+
+def test_client_if_none_match_and_change(client, auth_headers, report):
+    primeira = get(client, auth_headers, "/clients/1")
+    etag = primeira.headers["ETag"]
+
+    assert get(client, auth_headers, "/clients/1", etag).status_code == 304
+
+    client.put("/clients/1", json={"nome_fantasia": "Cliente Renomeado"}, headers=auth_headers)
+    assert_changed(get(client, auth_headers, "/clients/1", etag), etag)
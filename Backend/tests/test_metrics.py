@@ -0,0 +1,34 @@
+"""
+GET /metrics: desligado sem METRICS_TOKEN e protegido pelo token quando configurado
+"""
+import pytest
+
+from app import metrics
+
+
+@pytest.fixture
+def metrics_token(monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_TOKEN", "segredo-de-teste")
+    return "segredo-de-teste"
+
+
+def test_metrics_disabled_without_token(client, monkeypatch):
+    monkeypatch.setattr(metrics, "METRICS_TOKEN", "")
+    assert client.get("/metrics").status_code == 404
+    assert client.get("/metrics", headers={"Authorization": "Bearer qualquer"}).status_code == 404
+
+
+def test_metrics_requires_token(client, metrics_token):
+    assert client.get("/metrics").status_code == 401
+    assert client.get("/metrics", headers={"Authorization": "Bearer errado"}).status_code == 401
+    # Só o esquema Bearer é aceito
+    assert client.get("/metrics", headers={"Authorization": f"Basic {metrics_token}"}).status_code == 401
+
+
+def test_metrics_with_token(client, auth_headers, metrics_token):
+    assert client.get("/auth/me", headers=auth_headers).status_code == 200
+
+    response = client.get("/metrics", headers={"Authorization": f"Bearer {metrics_token}"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert 'bpa_http_requests_total{method="GET",route="/auth/me",status="200"}' in response.text
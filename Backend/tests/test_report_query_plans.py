@@ -0,0 +1,103 @@
+"""
+Planos de execução (EXPLAIN QUERY PLAN) das consultas de relatórios
+
+Executa as funções reais dos routers, captura o SQL emitido e confere que o SQLite
+usa os índices criados pelas migrações (o banco vem de `alembic upgrade head`).
+"""
+from datetime import datetime
+
+from fastapi import Response
+from sqlalchemy import event
+
+from app.models import ReportStatus
+from app.pagination import NEXT_CURSOR_HEADER
+from app.routers.reports import _get_reports_by_date, _list_reports, get_report_tree
+
+from conftest import create_report
+
+
+def captured_plans(engine, db, fn, *args):
+    """Executa fn(db, *args) e devolve o plano de cada consulta emitida ([(sql, [linhas do plano])])"""
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        fn(db, *args)
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    connection = db.connection()
+    return [
+        (statement, [row[3] for row in connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)])
+        for statement, parameters in statements
+    ]
+
+
+def plan_for(plans, fragment: str):
+    """Plano da consulta cujo SQL contém o trecho"""
+    matches = [plan for statement, plan in plans if fragment in statement]
+    assert matches, [statement for statement, _ in plans]
+    return matches[0]
+
+
+def populate(db):
+    for report_id in range(1, 4):
+        create_report(
+            db, report_id, 2,
+            data_agendada=datetime(2026, 5, report_id * 5),
+            status=ReportStatus.CONCLUIDO,
+        )
+
+
+def test_calendar_uses_data_agendada_index(engine, db):
+    populate(db)
+    plans = captured_plans(engine, db, _get_reports_by_date, 5, 2026)
+
+    plan = plan_for(plans, "FROM reports")
+    assert any("USING INDEX idx_reports_data_agendada" in line for line in plan), plan
+    assert not any(line.startswith("SCAN reports") for line in plan), plan
+
+
+def test_list_by_cliente_uses_composite_index(engine, db):
+    populate(db)
+    response = Response()
+    plans = captured_plans(engine, db, _list_reports, response, 1, None, 0, False, 1, None)
+    plan = plan_for(plans, "FROM reports")
+    assert any("USING INDEX idx_reports_cliente_criado_em_id" in line for line in plan), plan
+    assert not any("TEMP B-TREE" in line for line in plan), plan
+
+    # Página seguinte (cursor): mesmo índice, como intervalo
+    cursor = response.headers[NEXT_CURSOR_HEADER]
+    plans = captured_plans(engine, db, _list_reports, Response(), 1, cursor, 0, False, 1, None)
+    plan = plan_for(plans, "ORDER BY reports.criado_em DESC")
+    assert any("USING INDEX idx_reports_cliente_criado_em_id" in line for line in plan), plan
+
+
+def test_list_by_status_uses_composite_index(engine, db):
+    populate(db)
+    response = Response()
+    plans = captured_plans(engine, db, _list_reports, response, 1, None, 0, False, None, ReportStatus.CONCLUIDO)
+    plan = plan_for(plans, "FROM reports")
+    assert any("USING INDEX idx_reports_status_criado_em_id" in line for line in plan), plan
+    assert not any("TEMP B-TREE" in line for line in plan), plan
+
+    cursor = response.headers[NEXT_CURSOR_HEADER]
+    plans = captured_plans(engine, db, _list_reports, Response(), 1, cursor, 0, False, None, ReportStatus.CONCLUIDO)
+    plan = plan_for(plans, "ORDER BY reports.criado_em DESC")
+    assert any("USING INDEX idx_reports_status_criado_em_id" in line for line in plan), plan
+
+
+def test_report_tree_uses_checklist_indexes(engine, db):
+    populate(db)
+    plans = captured_plans(engine, db, get_report_tree, 1)
+
+    categories = plan_for(plans, "FROM checklist_categories")
+    assert any("USING INDEX idx_checklist_categories_relatorio_ordem (relatorio_id=?)" in line
+               for line in categories), categories
+
+    items = plan_for(plans, "FROM checklist_items")
+    assert any("USING INDEX idx_checklist_items_categoria_ordem (categoria_id=?)" in line
+               for line in items), items
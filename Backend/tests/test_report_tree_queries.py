@@ -0,0 +1,61 @@
+"""
+A árvore do relatório (cliente, responsável, categorias, itens e textos dos templates)
+é carregada com um número fixo de consultas, qualquer que seja o número de categorias
+"""
+import pytest
+
+from app.routers.reports import get_report_tree
+from app.schemas import ReportResponse
+
+from conftest import ITENS_POR_CATEGORIA, QueryCounter, create_report
+
+# relatório + cliente + responsável (joinedload), categorias, itens e itens de template (selectinload)
+TREE_QUERIES = 4
+# GET /reports/{id}: versão do relatório (ETag) + árvore; o usuário vem do cache de autenticação
+ENDPOINT_QUERIES = 1 + TREE_QUERIES
+
+
+@pytest.mark.parametrize("categorias", [2, 12])
+def test_get_report_tree_fixed_queries(engine, db, categorias):
+    report_id = create_report(db, 1, categorias)
+
+    with QueryCounter(engine) as counter:
+        report = get_report_tree(db, report_id)
+        # A conversão para o schema não pode disparar lazy loading
+        response = ReportResponse.model_validate(report)
+
+    assert len(response.categorias) == categorias
+    assert all(len(categoria.itens) == ITENS_POR_CATEGORIA for categoria in response.categorias)
+    assert response.categorias[0].itens[0].descricao == "Texto do template"
+    assert counter.total == TREE_QUERIES, counter.statements
+
+
+def test_get_report_tree_same_queries_for_small_and_large_reports(engine, db):
+    small = create_report(db, 1, 2)
+    large = create_report(db, 2, 12)
+
+    totals = []
+    for report_id in (small, large):
+        db.expunge_all()
+        with QueryCounter(engine) as counter:
+            ReportResponse.model_validate(get_report_tree(db, report_id))
+        totals.append(counter.total)
+
+    assert totals == [TREE_QUERIES, TREE_QUERIES]
+
+
+def test_get_report_endpoint_same_queries_for_small_and_large_reports(engine, db, client, auth_headers):
+    small = create_report(db, 1, 2)
+    large = create_report(db, 2, 12)
+    # Aquece o cache de usuários (a primeira requisição do token consulta o usuário)
+    assert client.get("/auth/me", headers=auth_headers).status_code == 200
+
+    totals = []
+    for report_id, categorias in ((small, 2), (large, 12)):
+        with QueryCounter(engine) as counter:
+            response = client.get(f"/reports/{report_id}", headers=auth_headers)
+        assert response.status_code == 200
+        assert len(response.json()["categorias"]) == categorias
+        totals.append(counter.total)
+
+    assert totals == [ENDPOINT_QUERIES, ENDPOINT_QUERIES]
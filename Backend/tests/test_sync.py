@@ -0,0 +1,93 @@
+"""
+Sincronização incremental (GET/POST /sync): conflitos, exclusões e token
+"""
+import pytest
+from sqlalchemy import delete
+
+from app.models import ChecklistItem
+
+from conftest import ITENS_POR_CATEGORIA, create_report
+
+CATEGORIAS = 2
+
+
+@pytest.fixture
+def report(db):
+    return create_report(db, 1, CATEGORIAS)
+
+
+def pull(client, auth_headers, since: int = 0, **params) -> dict:
+    response = client.get("/sync/", params={"since": since, **params}, headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def push(client, auth_headers, **changes) -> list:
+    response = client.post("/sync/", json=changes, headers=auth_headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+def test_stale_push_conflicts_until_forced(client, auth_headers, report):
+    item = pull(client, auth_headers)["itens"][0]
+    # Alterado no servidor depois da sincronização do tablet
+    client.put(f"/reports/items/{item['id']}", json={"resposta": "conforme"}, headers=auth_headers)
+
+    alteracao = {"id": item["id"], "versao_base": item["versao"], "resposta": "nao_conforme"}
+    [conflito] = push(client, auth_headers, itens=[alteracao])
+
+    assert conflito["sucesso"] is False
+    assert conflito["conflito"] is True
+    assert conflito["versao"] > item["versao"]
+    assert conflito["atual"]["resposta"] == "conforme"
+
+    [forcado] = push(client, auth_headers, itens=[{**alteracao, "forcar": True}])
+
+    assert forcado["sucesso"] is True
+    assert forcado["versao"] > conflito["versao"]
+    itens = client.get(f"/reports/{report}", headers=auth_headers).json()["categorias"][0]["itens"]
+    assert next(i for i in itens if i["id"] == item["id"])["resposta"] == "nao_conforme"
+
+
+def test_push_with_current_version_applies(client, auth_headers, report):
+    item = pull(client, auth_headers)["itens"][0]
+
+    [resultado] = push(client, auth_headers, itens=[
+        {"id": item["id"], "versao_base": item["versao"], "observacoes": "Verificado offline"}
+    ])
+
+    assert resultado["sucesso"] is True
+    assert resultado["conflito"] is False
+
+
+def test_deleted_item_is_a_tombstone_in_the_next_pull(client, auth_headers, db, report):
+    inicial = pull(client, auth_headers)
+    item_id = inicial["itens"][0]["id"]
+    db.execute(delete(ChecklistItem).where(ChecklistItem.id == item_id))
+    db.commit()
+
+    changes = pull(client, auth_headers, since=inicial["token"])
+
+    assert changes["excluidos"]["itens"] == [item_id]
+    assert changes["itens"] == []
+    assert changes["token"] > inicial["token"]
+
+
+def test_pulling_with_the_returned_token_has_no_repeats(client, auth_headers, report):
+    vistos = []
+    token, mais = 0, True
+    while mais:
+        changes = pull(client, auth_headers, since=token, limit=4)
+        vistos += [(tabela, row["id"]) for tabela in ("relatorios", "categorias", "itens") for row in changes[tabela]]
+        token, mais = changes["token"], changes["mais"]
+
+    assert len(vistos) == len(set(vistos)) == 1 + CATEGORIAS + CATEGORIAS * ITENS_POR_CATEGORIA
+
+    vazio = pull(client, auth_headers, since=token)
+    assert (vazio["token"], vazio["relatorios"], vazio["categorias"], vazio["itens"]) == (token, [], [], [])
+
+    item_id = vistos[-1][1]
+    client.put(f"/reports/items/{item_id}", json={"resposta": "na"}, headers=auth_headers)
+    changes = pull(client, auth_headers, since=token)
+    assert [item["id"] for item in changes["itens"]] == [item_id]
+    assert changes["relatorios"] == changes["categorias"] == []
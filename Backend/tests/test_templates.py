@@ -0,0 +1,65 @@
+"""
+Templates de checklist: versão calculada sob concorrência e ordem da árvore
+"""
+from app.routers import templates
+
+TEMPLATE = {
+    "nome": "RDC 216",
+    "categorias": [
+        {"nome": "Segunda", "ordem": 2, "itens": [{"codigo": "2.1", "descricao": "Item 2.1", "ordem": 1}]},
+        {
+            "nome": "Primeira",
+            "ordem": 1,
+            "itens": [
+                {"codigo": "1.2", "descricao": "Item 1.2", "ordem": 2},
+                {"codigo": "1.1", "descricao": "Item 1.1", "ordem": 1},
+            ],
+        },
+    ],
+}
+
+
+def stale_version(monkeypatch, vezes: int):
+    """As primeiras leituras da última versão ficam desatualizadas (outra requisição gravou antes)"""
+    next_version = templates._next_template_version
+    chamadas = []
+
+    def fake(db, nome):
+        chamadas.append(nome)
+        versao = next_version(db, nome)
+        return versao - 1 if len(chamadas) <= vezes else versao
+
+    monkeypatch.setattr(templates, "_next_template_version", fake)
+    return chamadas
+
+
+def test_template_tree_is_returned_in_order(client, auth_headers):
+    template_id = client.post("/templates/", json=TEMPLATE, headers=auth_headers).json()["id"]
+
+    template = client.get(f"/templates/{template_id}", headers=auth_headers).json()
+
+    assert [categoria["nome"] for categoria in template["categorias"]] == ["Primeira", "Segunda"]
+    assert [item["codigo"] for item in template["categorias"][0]["itens"]] == ["1.1", "1.2"]
+
+
+def test_concurrent_version_is_retried(client, auth_headers, monkeypatch):
+    client.post("/templates/", json=TEMPLATE, headers=auth_headers)
+    chamadas = stale_version(monkeypatch, vezes=1)
+
+    response = client.post("/templates/", json=TEMPLATE, headers=auth_headers)
+
+    assert response.status_code == 201
+    assert response.json()["versao"] == 2
+    assert len(response.json()["categorias"]) == 2
+    assert len(chamadas) == 2
+
+
+def test_concurrent_version_conflict_returns_409(client, auth_headers, monkeypatch):
+    client.post("/templates/", json=TEMPLATE, headers=auth_headers)
+    stale_version(monkeypatch, vezes=templates.TEMPLATE_VERSION_ATTEMPTS)
+
+    response = client.post("/templates/", json=TEMPLATE, headers=auth_headers)
+
+    assert response.status_code == 409
+    versoes = client.get("/templates/", params={"incluir_inativos": True}, headers=auth_headers).json()
+    assert [(template["versao"], template["ativo"]) for template in versoes] == [(1, True)]
@@ -1,4 +1,5 @@
 import api from './api';
+import { ChecklistSummary } from './reportService';
 
 export interface LoginData {
   email: string;
@@ -36,6 +37,12 @@ export interface DashboardStats {
   user_name: string;
   total_clients: number;
   total_reports: number;
+  checklist_summary: ChecklistSummary;
+  taxa_conformidade: number;
+  relatorios_por_status: Record<string, number>;
+  relatorios_por_mes: { mes: string; total: number }[];
+  relatorios_por_inspetor: { responsavel_id: number; nome: string; total: number }[];
+  relatorios_por_categoria_cliente: Record<string, number>;
 }
 
 export const authService = {
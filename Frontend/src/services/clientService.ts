@@ -39,6 +39,23 @@ export interface ClientCreate {
   logo_url?: string;
 }
 
+export interface ClientImportRowResult {
+  linha: number;
+  cnpj?: string | null;
+  sucesso: boolean;
+  cliente_id?: number | null;
+  acao?: 'criado' | 'atualizado' | null;
+  erros: string[];
+}
+
+export interface ClientImportResult {
+  total_linhas: number;
+  criados: number;
+  atualizados: number;
+  com_erro: number;
+  linhas: ClientImportRowResult[];
+}
+
 export const clientService = {
   getAll: async (search?: string) => {
     const params = search ? { search } : {};
@@ -64,4 +81,14 @@ export const clientService = {
   delete: async (id: number) => {
     await api.delete(`/clients/${id}`);
   },
+
+  importFile: async (arquivo: File, params: { formato?: 'csv' | 'jsonl'; atualizar?: boolean } = {}) => {
+    const formData = new FormData();
+    formData.append('arquivo', arquivo);
+    const response = await api.post<ClientImportResult>('/clients/importar', formData, {
+      params,
+      headers: { 'Content-Type': 'multipart/form-data' },
+    });
+    return response.data;
+  },
 };
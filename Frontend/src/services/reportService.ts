@@ -27,12 +27,24 @@ export interface Report {
   categorias?: ChecklistCategory[];
 }
 
+export interface ChecklistSummary {
+  total_itens: number;
+  conforme: number;
+  nao_conforme: number;
+  na: number;
+  sem_resposta: number;
+  percentual_conforme: number;
+  percentual_nao_conforme: number;
+  percentual_na: number;
+}
+
 export interface ReportCreate {
   descricao: string;
   cliente_id: number;
   categoria?: string;
   responsavel_inspecao_id: number;
   data_agendada?: string;
+  template_id?: number;
   categorias?: Array<{
     nome: string;
     ordem: number;
@@ -44,6 +56,27 @@ export interface ReportCreate {
   }>;
 }
 
+export interface PdfBatchJob {
+  job_id: string;
+  formato: 'zip' | 'pdf';
+  status: 'pendente' | 'processando' | 'concluido' | 'erro';
+  total: number;
+  concluidos: number;
+  percentual: number;
+  relatorio_ids: number[];
+  criado_em: string;
+  erro?: string | null;
+}
+
+export interface PdfBatchRequest {
+  relatorio_ids?: number[];
+  cliente_id?: number;
+  data_inicio?: string;
+  data_fim?: string;
+  status?: 'em_andamento' | 'concluido';
+  formato?: 'zip' | 'pdf';
+}
+
 export const reportService = {
   getAll: async (cliente_id?: number) => {
     const params = cliente_id ? { cliente_id } : {};
@@ -56,6 +89,11 @@ export const reportService = {
     return response.data;
   },
 
+  getSummary: async (id: number) => {
+    const response = await api.get<ChecklistSummary>(`/reports/${id}/summary`);
+    return response.data;
+  },
+
   create: async (data: ReportCreate) => {
     const response = await api.post<Report>('/reports/', data);
     return response.data;
@@ -75,6 +113,17 @@ export const reportService = {
     return response.data;
   },
 
+  updateChecklistItems: async (
+    reportId: number,
+    items: Array<{ item_id: number; resposta?: 'conforme' | 'nao_conforme' | 'na' | null; observacoes?: string }>
+  ) => {
+    const response = await api.patch<Array<{ item_id: number; sucesso: boolean; erro?: string | null }>>(
+      `/reports/${reportId}/items`,
+      items
+    );
+    return response.data;
+  },
+
   exportPDF: async (reportId: number) => {
     const response = await api.get(`/reports/${reportId}/pdf`, {
       responseType: 'blob', // Importante para download de arquivo
@@ -91,6 +140,55 @@ export const reportService = {
     window.URL.revokeObjectURL(url);
   },
 
+  exportReports: async (params: {
+    formato?: 'csv' | 'xlsx';
+    cliente_id?: number;
+    data_inicio?: string;
+    data_fim?: string;
+    status_filter?: 'em_andamento' | 'concluido';
+    resposta?: 'conforme' | 'nao_conforme' | 'na';
+  } = {}) => {
+    const formato = params.formato ?? 'csv';
+    const response = await api.get('/reports/exportar', {
+      params: { ...params, formato },
+      responseType: 'blob',
+    });
+
+    const url = window.URL.createObjectURL(new Blob([response.data]));
+    const link = document.createElement('a');
+    link.href = url;
+    link.setAttribute('download', `relatorios_${new Date().getTime()}.${formato}`);
+    document.body.appendChild(link);
+    link.click();
+    link.remove();
+    window.URL.revokeObjectURL(url);
+  },
+
+  createPdfBatch: async (data: PdfBatchRequest) => {
+    const response = await api.post<PdfBatchJob>('/reports/pdf-lote', data);
+    return response.data;
+  },
+
+  getPdfBatch: async (jobId: string) => {
+    const response = await api.get<PdfBatchJob>(`/reports/pdf-lote/${jobId}`);
+    return response.data;
+  },
+
+  downloadPdfBatch: async (job: PdfBatchJob) => {
+    const response = await api.get(`/reports/pdf-lote/${job.job_id}/download`, {
+      responseType: 'blob',
+    });
+
+    const url = window.URL.createObjectURL(new Blob([response.data]));
+    const link = document.createElement('a');
+    link.href = url;
+    link.setAttribute('download', `relatorios_${new Date().getTime()}.${job.formato}`);
+    document.body.appendChild(link);
+    link.click();
+    link.remove();
+    window.URL.revokeObjectURL(url);
+  },
+
   finalizar: async (reportId: number) => {
     const response = await api.post<Report>(`/reports/${reportId}/finalizar`);
     return response.data;
@@ -0,0 +1,84 @@
+import api from './api';
+
+export interface SyncReport {
+  id: number;
+  descricao: string;
+  cliente_id: number;
+  categoria?: string | null;
+  responsavel_inspecao_id: number;
+  status: 'em_andamento' | 'concluido';
+  data_agendada?: string | null;
+  criado_em?: string | null;
+  finalizado_em?: string | null;
+  versao: number;
+}
+
+export interface SyncCategory {
+  id: number;
+  relatorio_id: number;
+  nome: string;
+  ordem: number;
+  versao: number;
+}
+
+export interface SyncItem {
+  id: number;
+  categoria_id: number;
+  template_item_id?: number | null;
+  codigo: string;
+  descricao: string;
+  resposta: 'conforme' | 'nao_conforme' | 'na' | null;
+  observacoes?: string | null;
+  ordem: number;
+  versao: number;
+}
+
+export interface SyncResponse {
+  token: number;
+  mais: boolean;
+  relatorios: SyncReport[];
+  categorias: SyncCategory[];
+  itens: SyncItem[];
+  excluidos: { relatorios: number[]; categorias: number[]; itens: number[] };
+}
+
+export interface SyncPush {
+  relatorios?: Array<{
+    id: number;
+    versao_base: number;
+    descricao?: string;
+    categoria?: string;
+    status?: 'em_andamento' | 'concluido';
+    forcar?: boolean;
+  }>;
+  itens?: Array<{
+    id: number;
+    versao_base: number;
+    resposta?: 'conforme' | 'nao_conforme' | 'na';
+    observacoes?: string;
+    forcar?: boolean;
+  }>;
+}
+
+export interface SyncPushResult {
+  tabela: 'relatorios' | 'itens';
+  id: number;
+  sucesso: boolean;
+  conflito: boolean;
+  versao?: number | null;
+  erro?: string | null;
+  atual?: SyncReport | SyncItem | null;
+}
+
+export const syncService = {
+  pull: async (since: number, relatorio_id?: number) => {
+    const params = relatorio_id ? { since, relatorio_id } : { since };
+    const response = await api.get<SyncResponse>('/sync/', { params });
+    return response.data;
+  },
+
+  push: async (data: SyncPush) => {
+    const response = await api.post<SyncPushResult[]>('/sync/', data);
+    return response.data;
+  },
+};